@@ -60,6 +60,17 @@ class CurriculumMetrics:
         self.max_reward = max(self.max_reward, episode_reward)
         self.min_reward = min(self.min_reward, episode_reward)
 
+    def update_batch(self, episode_rewards: np.ndarray):
+        """Update metrics with several episode results at once (same result as update() per reward)."""
+        episode_rewards = np.asarray(episode_rewards, dtype=np.float64).ravel()
+        if episode_rewards.size == 0:
+            return
+        self.episode_count += episode_rewards.size
+        self.rewards_history.extend(episode_rewards.tolist())
+        self.mean_reward = np.mean(self.rewards_history[-100:])  # Last 100 episodes
+        self.max_reward = max(self.max_reward, float(episode_rewards.max()))
+        self.min_reward = min(self.min_reward, float(episode_rewards.min()))
+
     def convergence_percentage(self, target_reward: Optional[float]) -> float:
         """Calculate what percentage of target reward we've achieved."""
         if target_reward is None or target_reward == 0:
@@ -0,0 +1,25 @@
+"""
+Optional Numba JIT support.
+
+Numba is not a hard dependency of the simulator. When it is installed the
+decorators below compile to native code; otherwise they return the function
+unchanged so the same code runs as plain Python. guvectorize has no
+meaningful pure-Python stand-in, so callers check NUMBA_AVAILABLE and keep
+a numpy implementation for the fallback.
+"""
+
+try:
+    from numba import guvectorize, njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    guvectorize = None
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare, with options, or with a signature)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -22,6 +22,8 @@ import math
 
 logger = logging.getLogger(__name__)
 
+EARTH_RADIUS_NM = 3440.07
+
 
 @dataclass
 class Aircraft:
@@ -375,19 +377,22 @@ def filter_aircraft_for_approach(
 
 def _calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate distance between two points in nautical miles"""
-    # Haversine formula
-    R = 3440.07  # Earth's radius in nautical miles
-
     lat1_rad = math.radians(lat1)
     lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lon = math.radians(lon2 - lon1)
+    return _haversine_nm(
+        lat1_rad, math.radians(lon1), math.cos(lat1_rad),
+        lat2_rad, math.radians(lon2), math.cos(lat2_rad),
+    )
 
-    a = math.sin(delta_lat / 2) ** 2 + \
-        math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
-    c = 2 * math.asin(math.sqrt(a))
 
-    return R * c
+def _haversine_nm(
+    lat1_rad: float, lon1_rad: float, cos_lat1: float,
+    lat2_rad: float, lon2_rad: float, cos_lat2: float,
+) -> float:
+    """Haversine distance in nautical miles between points in radians, with cos(lat) precomputed"""
+    a = math.sin((lat2_rad - lat1_rad) / 2) ** 2 + \
+        cos_lat1 * cos_lat2 * math.sin((lon2_rad - lon1_rad) / 2) ** 2
+    return EARTH_RADIUS_NM * 2 * math.asin(math.sqrt(a))
 
 
 def _calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
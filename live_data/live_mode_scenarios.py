@@ -10,20 +10,43 @@ Usage:
     aircraft = scenario.get_live_aircraft()
 """
 
+import heapq
 import logging
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+import math
+import time
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Tuple
+from dataclasses import dataclass, replace
 from datetime import datetime
 from enum import Enum
 
+import numpy as np
+
 from live_data.adsb_integration import (
     ADSBClient,
     Aircraft,
+    _haversine_nm,
     filter_aircraft_for_approach,
 )
 
 logger = logging.getLogger(__name__)
 
+_AIRPORTS_RAW = {
+    'SFO': (37.6213, -122.3790),
+    'LAX': (33.9425, -118.4081),
+    'JFK': (40.6413, -73.7781),
+    'ORD': (41.9742, -87.9073),
+    'ATL': (33.6407, -84.4277),
+}
+
+_AIRPORT_POSITIONS: Mapping[str, Tuple[float, float]] = MappingProxyType(_AIRPORTS_RAW)
+
+# Airport code -> (lat, lon, lat_rad, lon_rad, cos_lat_rad), computed once at import
+AIRPORTS: Mapping[str, Tuple[float, float, float, float, float]] = MappingProxyType({
+    code: (lat, lon, math.radians(lat), math.radians(lon), math.cos(math.radians(lat)))
+    for code, (lat, lon) in _AIRPORTS_RAW.items()
+})
+
 
 class SimulationAircraft(Enum):
     """Aircraft source"""
@@ -52,35 +75,38 @@ class LiveModeScenario:
         """Initialize live mode scenario"""
         self.config = config
         self.client = ADSBClient()
-        self.last_update = None
+        self.last_update: Optional[datetime] = None  # wall clock, for reporting only
+        self._last_update_monotonic: Optional[float] = None  # drives cache expiry
         self.aircraft_cache: List[Aircraft] = []
         self.aircraft_source_map: Dict[str, SimulationAircraft] = {}
 
-        # Airport positions
-        self.airport_positions = {
-            'SFO': (37.6213, -122.3790),
-            'LAX': (33.9425, -118.4081),
-            'JFK': (40.6413, -73.7781),
-            'ORD': (41.9742, -87.9073),
-            'ATL': (33.6407, -84.4277),
-        }
+        # Bumped whenever aircraft_cache/aircraft_source_map change
+        self._cache_gen = 0
+        self._sim_format_cache_gen = -1
+        self._sim_format_aircraft: List[Dict] = []
 
-        if config.airport_code not in self.airport_positions:
-            raise ValueError(f"Unknown airport: {config.airport_code}")
+        try:
+            self._apt = AIRPORTS[config.airport_code]
+        except KeyError:
+            raise ValueError(f"Unknown airport: {config.airport_code}") from None
 
-        logger.info(f"Live mode scenario initialized for {config.airport_code}")
+        logger.info("Live mode scenario initialized for %s", config.airport_code)
+
+    @property
+    def airport_positions(self) -> Mapping[str, Tuple[float, float]]:
+        """Airport code -> (lat, lon) for every known airport (read-only view of the shared table)."""
+        return _AIRPORT_POSITIONS
 
     def get_live_aircraft(self, force_refresh: bool = False) -> List[Aircraft]:
         """Get live aircraft for scenario"""
         # Check if update needed
-        if not force_refresh and self.last_update:
-            age = (datetime.utcnow() - self.last_update).total_seconds()
-            if age < self.config.update_interval_seconds:
+        if not force_refresh and self._last_update_monotonic is not None:
+            if time.monotonic() - self._last_update_monotonic < self.config.update_interval_seconds:
                 return self.aircraft_cache
 
         try:
             # Fetch aircraft from ADSBexchange
-            airport_lat, airport_lon = self.airport_positions[self.config.airport_code]
+            airport_lat, airport_lon = self._apt[0], self._apt[1]
 
             aircraft = self.client.get_aircraft_by_region(
                 lat=airport_lat,
@@ -101,55 +127,57 @@ class LiveModeScenario:
 
             # Limit aircraft count
             if len(aircraft) > self.config.max_aircraft_count:
-                # Sort by altitude descending (higher priority to lower aircraft)
-                aircraft = sorted(aircraft, key=lambda x: x.altitude_ft)[:self.config.max_aircraft_count]
+                # Keep the lowest aircraft (higher priority); partial sort, O(n log k)
+                aircraft = heapq.nsmallest(
+                    self.config.max_aircraft_count, aircraft, key=lambda x: x.altitude_ft
+                )
 
-            # Scale aircraft parameters for gameplay
-            scaled_aircraft = [self._scale_aircraft(ac) for ac in aircraft]
+            # Scale aircraft parameters for gameplay (no-op at the default 1.0)
+            if self.config.scale_factor == 1.0:
+                # Shallow list copy only: the client's region cache must not be mutated
+                scaled_aircraft = list(aircraft)
+            else:
+                scaled_aircraft = self._scale_aircraft_batch(aircraft)
 
             # Update cache
             self.aircraft_cache = scaled_aircraft
+            self._last_update_monotonic = time.monotonic()
             self.last_update = datetime.utcnow()
 
             # Track source
             for ac in scaled_aircraft:
                 self.aircraft_source_map[ac.callsign] = SimulationAircraft.REAL
+            self._cache_gen += 1
 
-            logger.info(f"Live update: {len(scaled_aircraft)} aircraft for {self.config.airport_code}")
+            logger.info("Live update: %d aircraft for %s", len(scaled_aircraft), self.config.airport_code)
             return scaled_aircraft
 
         except Exception as e:
-            logger.error(f"Error fetching live aircraft: {e}")
+            logger.error("Error fetching live aircraft: %s", e)
             return self.aircraft_cache
 
     def _scale_aircraft(self, aircraft: Aircraft) -> Aircraft:
         """Apply scaling to aircraft parameters for gameplay"""
-        # Scale ground speed for gameplay
-        scaled_speed = int(aircraft.ground_speed_kts * self.config.scale_factor)
-
-        # Altitude scaling (optional - usually keep real)
-        scaled_altitude = int(aircraft.altitude_ft * self.config.scale_factor)
-
-        # Create scaled copy
-        scaled = Aircraft(
-            icao=aircraft.icao,
-            callsign=aircraft.callsign,
-            latitude=aircraft.latitude,
-            longitude=aircraft.longitude,
-            altitude_ft=scaled_altitude,
-            ground_speed_kts=scaled_speed,
-            track_deg=aircraft.track_deg,
-            vertical_speed_fpm=aircraft.vertical_speed_fpm,
-            squawk=aircraft.squawk,
-            aircraft_type=aircraft.aircraft_type,
-            registration=aircraft.registration,
-            operator=aircraft.operator,
-            destination=aircraft.destination,
-            origin=aircraft.origin,
-            last_update_time=aircraft.last_update_time,
-        )
+        return self._scale_aircraft_batch([aircraft])[0]
+
+    def _scale_aircraft_batch(self, aircraft: List[Aircraft]) -> List[Aircraft]:
+        """Scale speed/altitude of all aircraft at once for gameplay"""
+        if not aircraft:
+            return []
+
+        scale = self.config.scale_factor
+        count = len(aircraft)
 
-        return scaled
+        # Scale ground speed and altitude as whole columns, truncating like int()
+        alt_arr = np.fromiter((ac.altitude_ft for ac in aircraft), dtype=np.float64, count=count)
+        gs_arr = np.fromiter((ac.ground_speed_kts for ac in aircraft), dtype=np.float64, count=count)
+        alt_scaled = (alt_arr * scale).astype(np.int32)
+        gs_scaled = (gs_arr * scale).astype(np.int32)
+
+        return [
+            replace(ac, altitude_ft=alt, ground_speed_kts=gs)
+            for ac, alt, gs in zip(aircraft, alt_scaled.tolist(), gs_scaled.tolist())
+        ]
 
     def get_aircraft_info(self, callsign: str) -> Optional[Dict]:
         """Get detailed info about live aircraft"""
@@ -166,12 +194,12 @@ class LiveModeScenario:
 
     def _get_distance_to_airport(self, aircraft: Aircraft) -> float:
         """Calculate distance from aircraft to airport"""
-        from live_data.adsb_integration import _calculate_distance
-
-        airport_lat, airport_lon = self.airport_positions[self.config.airport_code]
-        return _calculate_distance(
-            aircraft.latitude, aircraft.longitude,
-            airport_lat, airport_lon
+        # Haversine with the airport's trig terms taken from AIRPORTS
+        _, _, airport_lat_rad, airport_lon_rad, airport_cos_lat = self._apt
+        lat_rad = math.radians(aircraft.latitude)
+        return _haversine_nm(
+            lat_rad, math.radians(aircraft.longitude), math.cos(lat_rad),
+            airport_lat_rad, airport_lon_rad, airport_cos_lat,
         )
 
     def _estimate_arrival_time(self, aircraft: Aircraft) -> Optional[float]:
@@ -187,7 +215,8 @@ class LiveModeScenario:
         """Add simulated aircraft to scenario"""
         self.aircraft_cache.append(aircraft)
         self.aircraft_source_map[aircraft.callsign] = SimulationAircraft.SIMULATED
-        logger.info(f"Added simulated aircraft: {aircraft.callsign}")
+        self._cache_gen += 1
+        logger.info("Added simulated aircraft: %s", aircraft.callsign)
 
     def remove_aircraft(self, callsign: str) -> bool:
         """Remove aircraft from scenario"""
@@ -197,7 +226,8 @@ class LiveModeScenario:
 
         if len(self.aircraft_cache) < initial_count:
             self.aircraft_source_map.pop(callsign, None)
-            logger.info(f"Removed aircraft: {callsign}")
+            self._cache_gen += 1
+            logger.info("Removed aircraft: %s", callsign)
             return True
 
         return False
@@ -234,12 +264,14 @@ class LiveModeScenario:
         }
 
     def convert_to_simulation_format(self) -> Dict:
-        """Convert live aircraft to simulation format"""
-        return {
-            'airport': self.config.airport_code,
-            'timestamp': datetime.utcnow().isoformat(),
-            'mode': 'live',
-            'aircraft': [
+        """
+        Convert live aircraft to simulation format.
+
+        The aircraft entries are rebuilt only when the cache has changed since
+        the previous call; callers must treat them as read-only.
+        """
+        if self._sim_format_cache_gen != self._cache_gen:
+            self._sim_format_aircraft = [
                 {
                     'callsign': ac.callsign,
                     'type': ac.aircraft_type,
@@ -265,6 +297,13 @@ class LiveModeScenario:
                 }
                 for ac in self.aircraft_cache
             ]
+            self._sim_format_cache_gen = self._cache_gen
+
+        return {
+            'airport': self.config.airport_code,
+            'timestamp': datetime.utcnow().isoformat(),
+            'mode': 'live',
+            'aircraft': self._sim_format_aircraft,
         }
 
 
@@ -279,7 +318,7 @@ class LiveModeManager:
         """Create new live scenario"""
         scenario = LiveModeScenario(config)
         self.scenarios[config.airport_code] = scenario
-        logger.info(f"Created live scenario for {config.airport_code}")
+        logger.info("Created live scenario for %s", config.airport_code)
         return scenario
 
     def get_scenario(self, airport_code: str) -> Optional[LiveModeScenario]:
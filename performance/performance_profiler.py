@@ -11,18 +11,29 @@ Usage:
 
 import sys
 import time
+import threading
 import psutil
 import cProfile
 import pstats
 import io
 import json
+import heapq
 import logging
+from array import array
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import argparse
 
+import numpy as np
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json parses the same logs
+    _json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -70,8 +81,29 @@ class PerformanceProfiler:
 
         return result, report
 
-    def profile_memory(self, func, *args, **kwargs):
-        """Profile memory usage of a function"""
+    def profile_memory(
+        self,
+        func,
+        *args,
+        _method: str = 'tracemalloc',
+        _sample_interval: float = 0.05,
+        **kwargs,
+    ):
+        """
+        Profile memory usage of a function.
+
+        _method='tracemalloc' traces every Python allocation (exact heap numbers,
+        but slows the profiled code considerably). _method='rusage' samples the
+        process RSS every _sample_interval seconds instead, which costs almost
+        nothing; current_mb/peak_mb are then RSS growth relative to the start
+        of the call. The profiler options are underscore-prefixed so that every
+        other keyword argument is passed through to func unchanged.
+        """
+        if _method == 'rusage':
+            return self._profile_memory_rss(func, args, kwargs, _sample_interval)
+        if _method != 'tracemalloc':
+            raise ValueError(f"Unknown memory profiling method: {_method}")
+
         logger.info("Starting memory profiling...")
 
         # Get initial memory
@@ -95,9 +127,62 @@ class PerformanceProfiler:
             'peak_mb': memory_peak_mb,
         }
 
+    def _profile_memory_rss(self, func, args, kwargs, sample_interval: float):
+        """Profile memory via RSS sampling instead of per-allocation tracing"""
+        logger.info("Starting memory profiling (RSS sampling)...")
+
+        baseline = self.process.memory_info().rss
+        peak = baseline
+        stop = threading.Event()
+
+        def sample():
+            nonlocal peak
+            while not stop.wait(sample_interval):
+                peak = max(peak, self.process.memory_info().rss)
+
+        maxrss_before = self._max_rss_bytes()
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            stop.set()
+            sampler.join()
+            current = self.process.memory_info().rss
+            peak = max(peak, current)
+
+            # The kernel's high-water mark catches spikes shorter than the sample interval
+            maxrss_after = self._max_rss_bytes()
+            if maxrss_after > maxrss_before:
+                peak = max(peak, maxrss_after)
+
+        memory_used_mb = (current - baseline) / 1024 / 1024
+        memory_peak_mb = (peak - baseline) / 1024 / 1024
+
+        logger.info(f"Memory Current: {memory_used_mb:.2f} MB")
+        logger.info(f"Memory Peak: {memory_peak_mb:.2f} MB")
+
+        return result, {
+            'current_mb': memory_used_mb,
+            'peak_mb': memory_peak_mb,
+        }
+
+    @staticmethod
+    def _max_rss_bytes() -> int:
+        """Process peak RSS in bytes, or 0 where getrusage is unavailable"""
+        try:
+            import resource
+        except ImportError:  # Windows
+            return 0
+
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
     def monitor_performance(self, duration_seconds=60, interval=1):
         """Monitor system performance over time"""
-        logger.info(f"Monitoring performance for {duration_seconds} seconds...")
+        logger.info("Monitoring performance for %s seconds...", duration_seconds)
 
         start_time = time.time()
         measurements = []
@@ -111,18 +196,47 @@ class PerformanceProfiler:
                 'fds': self.process.num_fds() if hasattr(self.process, 'num_fds') else 0,
             }
             measurements.append(measurement)
-            logger.info(f"CPU: {measurement['cpu_percent']:.1f}%, Memory: {measurement['memory_mb']:.1f} MB")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("CPU: %.1f%%, Memory: %.1f MB", measurement['cpu_percent'], measurement['memory_mb'])
 
             time.sleep(interval)
 
         return measurements
 
-    def analyze_database_query_performance(self, queries: List[Dict]) -> Dict:
-        """Analyze database query performance"""
-        logger.info(f"Analyzing {len(queries)} queries...")
+    def analyze_database_query_performance(self, queries: Iterable[Dict], max_samples: int = 1000) -> Dict:
+        """
+        Analyze database query performance in a single streaming pass.
+
+        Only the durations are kept for every query; slow_queries holds the
+        max_samples slowest (>100ms, slowest first) and fast_queries the first
+        max_samples fast ones (<=10ms), so memory stays bounded for huge logs.
+        """
+        logger.info("Analyzing queries...")
+
+        durations = array('d')
+        slow_heap: List[Tuple[float, int, Dict]] = []
+        fast_queries: List[Dict] = []
+        total_queries = 0
+
+        for total_queries, q in enumerate(queries, start=1):
+            if 'duration_ms' not in q:
+                continue
+
+            duration = q['duration_ms']
+            durations.append(duration)
+
+            if duration > 100:
+                # Min-heap of the slowest queries; the counter breaks ties without comparing dicts
+                entry = (duration, total_queries, q)
+                if len(slow_heap) < max_samples:
+                    heapq.heappush(slow_heap, entry)
+                elif duration > slow_heap[0][0]:
+                    heapq.heapreplace(slow_heap, entry)
+            elif duration <= 10 and len(fast_queries) < max_samples:
+                fast_queries.append(q)
 
         analysis = {
-            'total_queries': len(queries),
+            'total_queries': total_queries,
             'slow_queries': [],
             'fast_queries': [],
             'avg_duration_ms': 0.0,
@@ -130,18 +244,20 @@ class PerformanceProfiler:
             'p99_duration_ms': 0.0,
         }
 
-        durations = [q['duration_ms'] for q in queries if 'duration_ms' in q]
-
         if durations:
-            durations.sort()
-            analysis['avg_duration_ms'] = sum(durations) / len(durations)
-            analysis['p95_duration_ms'] = durations[int(len(durations) * 0.95)]
-            analysis['p99_duration_ms'] = durations[int(len(durations) * 0.99)]
+            values = np.frombuffer(durations, dtype=np.float64)
+            n = len(values)
+            p95_idx, p99_idx = int(n * 0.95), int(n * 0.99)
+            ranked = np.partition(values, (p95_idx, p99_idx))
+
+            analysis['avg_duration_ms'] = float(values.mean())
+            analysis['p95_duration_ms'] = float(ranked[p95_idx])
+            analysis['p99_duration_ms'] = float(ranked[p99_idx])
 
-            # Identify slow queries (> 100ms)
-            analysis['slow_queries'] = [q for q in queries if q.get('duration_ms', 0) > 100]
-            analysis['fast_queries'] = [q for q in queries if q.get('duration_ms', 0) <= 10]
+            analysis['slow_queries'] = [q for _, _, q in sorted(slow_heap, reverse=True)]
+            analysis['fast_queries'] = fast_queries
 
+        logger.info(f"Analyzed {analysis['total_queries']} queries")
         logger.info(f"Average query time: {analysis['avg_duration_ms']:.2f} ms")
         logger.info(f"P95 query time: {analysis['p95_duration_ms']:.2f} ms")
         logger.info(f"Slow queries (>100ms): {len(analysis['slow_queries'])}")
@@ -178,7 +294,7 @@ class DatabaseOptimizationAnalyzer:
     """Analyze and suggest database optimizations"""
 
     @staticmethod
-    def analyze_slow_queries(queries: List[Dict]) -> List[str]:
+    def analyze_slow_queries(queries: Iterable[Dict]) -> List[str]:
         """Suggest optimizations for slow queries"""
         suggestions = []
 
@@ -198,7 +314,7 @@ class DatabaseOptimizationAnalyzer:
         return suggestions
 
     @staticmethod
-    def suggest_indexes(queries: List[Dict]) -> List[Dict]:
+    def suggest_indexes(queries: Iterable[Dict]) -> List[Dict]:
         """Suggest missing indexes based on query patterns"""
         suggestions = []
         column_frequencies = {}
@@ -263,6 +379,14 @@ class CachingOptimizationAnalyzer:
         return suggestions
 
 
+def iter_query_log(path: str) -> Iterator[Dict]:
+    """Stream queries from a JSONL log one line at a time"""
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _json_loads(line)
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Performance Analysis Tool for AI-ATC")
@@ -285,13 +409,13 @@ def main():
             logger.info(f"Report written to {args.output}")
 
     elif args.analyze:
-        # Load and analyze query log
-        with open(args.analyze, 'r') as f:
-            queries = [json.loads(line) for line in f if line.strip()]
+        # Stream the query log instead of loading it all into memory
+        profiler = PerformanceProfiler()
+        analysis = profiler.analyze_database_query_performance(iter_query_log(args.analyze))
 
         analyzer = DatabaseOptimizationAnalyzer()
-        suggestions = analyzer.analyze_slow_queries(queries)
-        index_suggestions = analyzer.suggest_indexes(queries)
+        suggestions = analyzer.analyze_slow_queries(analysis['slow_queries'])
+        index_suggestions = analyzer.suggest_indexes(iter_query_log(args.analyze))
 
         print("\nOptimization Suggestions:")
         for suggestion in suggestions:
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 from airport import Airport
 
@@ -13,18 +15,26 @@ class Runway:
         """
         self.airport = airport
         self.airport_latlon = airport.position_nm
-        self.runway_heading_rad = np.deg2rad(runway_heading_deg)
+        self.runway_heading_rad = math.radians(runway_heading_deg)
         self.faf_distance_nm = faf_distance_nm
 
-        # Unit vectors in ENU/NM frame
+        # Unit vectors in ENU/NM frame (scalar trig via math, not numpy ufuncs)
         self.localizer_dir = np.array([
-            np.cos(self.runway_heading_rad),
-            np.sin(self.runway_heading_rad)
+            math.cos(self.runway_heading_rad),
+            math.sin(self.runway_heading_rad)
         ], dtype=np.float32)
 
         # Opposite direction = outbound
         self.outbound_dir = -self.localizer_dir
 
+        # Plain-float copies for scalar math that doesn't need numpy
+        self.localizer_dir_xy = tuple(self.localizer_dir.tolist())
+        self.outbound_dir_xy = tuple(self.outbound_dir.tolist())
+
+        # FAF never moves, so compute it once (read-only, shared by all callers)
+        self._faf_point_nm = self.localizer_point_nm(faf_distance_nm)
+        self._faf_point_nm.setflags(write=False)
+
     def localizer_point_nm(self, distance_nm: float):
         """
         Point along localizer at given distance FROM runway
@@ -32,6 +42,13 @@ class Runway:
         """
         return self.outbound_dir * distance_nm
 
+    def localizer_points_nm(self, distances_nm):
+        """
+        Points along localizer for an array of distances FROM runway,
+        returned as an (N, 2) array (row i = localizer_point_nm(distances_nm[i]))
+        """
+        return self.outbound_dir * np.asarray(distances_nm, dtype=np.float32)[:, None]
+
     def faf_point_nm(self):
-        return self.localizer_point_nm(self.faf_distance_nm)
+        return self._faf_point_nm
 
@@ -4,23 +4,35 @@ Handles dynamic runway changes, wind-based runway selection, and multi-runway op
 """
 
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from math import sin, cos, radians
 from typing import List, Optional, Tuple, Dict
 from enum import Enum
 from runway import Runway
 from airport import Airport
+from jit_support import NUMBA_AVAILABLE, guvectorize, njit
 
 
 class RunwayOrientation(Enum):
-    """Runway orientation categories."""
-    NORTH = "north"           # 0-45° or 315-360°
-    NORTHEAST = "northeast"   # 45-90°
-    EAST = "east"             # 90-135°
-    SOUTHEAST = "southeast"   # 135-180°
-    SOUTH = "south"           # 180-225°
-    SOUTHWEST = "southwest"   # 225-270°
-    WEST = "west"             # 270-315°
-    NORTHWEST = "northwest"   # 315-360°
+    """Runway orientation categories, in heading_bin() order."""
+    NORTH = "north"           # 337.5-22.5°
+    NORTHEAST = "northeast"   # 22.5-67.5°
+    EAST = "east"             # 67.5-112.5°
+    SOUTHEAST = "southeast"   # 112.5-157.5°
+    SOUTH = "south"           # 157.5-202.5°
+    SOUTHWEST = "southwest"   # 202.5-247.5°
+    WEST = "west"             # 247.5-292.5°
+    NORTHWEST = "northwest"   # 292.5-337.5°
+
+
+# Orientation labels indexed by heading_bin(); plain strings, no Enum lookup
+ORIENTATION_LABELS = tuple(orientation.value for orientation in RunwayOrientation)
+
+
+@njit(cache=True)
+def heading_bin(heading_deg: float) -> int:
+    """Orientation sector (0-7, clockwise from north) of a heading in degrees."""
+    return int(((heading_deg + 22.5) % 360.0) // 45.0)
 
 
 class RunwayStatus(Enum):
@@ -31,13 +43,50 @@ class RunwayStatus(Enum):
     MAINTENANCE = "maintenance"
 
 
-@dataclass
+# Below this wind speed every runway scores nearly the same, so runway
+# selection keeps the active runway instead of scoring
+CALM_WIND_THRESHOLD_KTS = 3.0
+
+# Distinct quantized winds whose runway scores are kept. Gusty or variable
+# wind reports keep revisiting the same few values.
+_SCORE_CACHE_SIZE = 64
+
+
+# sin/cos of every whole degree. Runway headings and reported wind directions
+# are whole degrees in practice, so most trig becomes a list lookup; values
+# are built with the same math calls as the fallback, so results are identical.
+_SIN_DEG = [sin(radians(deg)) for deg in range(360)]
+_COS_DEG = [cos(radians(deg)) for deg in range(360)]
+
+
+def _sin_cos_deg(angle_deg: float) -> Tuple[float, float]:
+    """Return (sin, cos) of an angle in degrees, from the table when it is whole."""
+    if angle_deg % 1.0 == 0.0:
+        idx = int(angle_deg) % 360
+        return _SIN_DEG[idx], _COS_DEG[idx]
+    angle_rad = radians(angle_deg)
+    return sin(angle_rad), cos(angle_rad)
+
+
+@dataclass(frozen=True, slots=True)
 class WindConditions:
-    """Current wind conditions."""
+    """Current wind conditions (immutable; replaced on every wind update)."""
     wind_speed_kts: float     # Knots
     wind_direction_deg: float # Degrees (where wind comes FROM)
     wind_gust_kts: float = 0.0  # Wind gust speed
 
+    # Cached once per wind update; scalar math avoids numpy ufunc dispatch.
+    # The component methods stay plain Python: a Numba call costs ~0.2us to
+    # dispatch, about the whole cost of these few multiplies. Runway scoring,
+    # the hot caller, already computes both components inside _score_runway.
+    _sin_w: float = field(init=False, repr=False, compare=False)
+    _cos_w: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        sin_w, cos_w = _sin_cos_deg(self.wind_direction_deg)
+        object.__setattr__(self, "_sin_w", sin_w)
+        object.__setattr__(self, "_cos_w", cos_w)
+
     def get_crosswind_component(self, runway_heading_deg: float) -> float:
         """
         Calculate crosswind component for a runway.
@@ -48,13 +97,9 @@ class WindConditions:
         Returns:
             Crosswind component in knots (positive = from right)
         """
-        # Convert wind direction to headwind/crosswind relative to runway
-        relative_angle = runway_heading_deg - self.wind_direction_deg
-        relative_angle_rad = np.deg2rad(relative_angle)
-
-        # Crosswind component
-        crosswind = self.wind_speed_kts * np.sin(relative_angle_rad)
-        return crosswind
+        # sin(heading - wind_dir) via the angle-difference identity
+        sin_h, cos_h = _sin_cos_deg(runway_heading_deg)
+        return self.wind_speed_kts * (sin_h * self._cos_w - cos_h * self._sin_w)
 
     def get_headwind_component(self, runway_heading_deg: float) -> float:
         """
@@ -63,17 +108,62 @@ class WindConditions:
         Returns:
             Headwind component in knots (positive = headwind, negative = tailwind)
         """
-        relative_angle = runway_heading_deg - self.wind_direction_deg
-        relative_angle_rad = np.deg2rad(relative_angle)
+        sin_h, cos_h = _sin_cos_deg(runway_heading_deg)
+        return self.wind_speed_kts * (cos_h * self._cos_w + sin_h * self._sin_w)
+
+
+# Eager signature: compiled at import (and cached on disk), not on first call
+@njit("float64(float64, float64, float64, float64, float64, float64, float64, float64, boolean)",
+      cache=True)
+def _score_runway(
+    sin_heading: float,
+    cos_heading: float,
+    wind_speed_kts: float,
+    sin_wind: float,
+    cos_wind: float,
+    max_crosswind_kts: float,
+    max_headwind_kts: float,
+    max_tailwind_kts: float,
+    operational: bool,
+) -> float:
+    """
+    Numeric core of RunwayConfig.get_suitability_score (Numba-compiled when available).
+
+    Headings come in as cached sin/cos pairs, so the wind components need
+    no trig: sin(h - w) and cos(h - w) are expanded with the angle-difference
+    identities.
+    """
+    if not operational:
+        return -100.0
+
+    crosswind = abs(wind_speed_kts * (sin_heading * cos_wind - cos_heading * sin_wind))
+    headwind = wind_speed_kts * (cos_heading * cos_wind + sin_heading * sin_wind)
+
+    if crosswind > max_crosswind_kts or headwind > max_headwind_kts or headwind < -max_tailwind_kts:
+        return -50.0
+
+    # Penalize for crosswind (max penalty 20 points)
+    score = 100.0 - min((crosswind / max_crosswind_kts) * 20.0, 20.0)
+
+    if headwind < 0:
+        # Penalize for tailwind (max penalty 30 points)
+        score -= min((-headwind / max_tailwind_kts) * 30.0, 30.0)
+    else:
+        # Bonus for headwind (headwind is good for landing)
+        score += min(headwind / 10.0, 10.0)
 
-        # Headwind component
-        headwind = self.wind_speed_kts * np.cos(relative_angle_rad)
-        return headwind
+    return max(score, 0.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class RunwayConfig:
-    """Configuration for a single runway."""
+    """
+    Configuration for a single runway.
+
+    Slotted for cheap attribute access in scoring. Not frozen: status and
+    closed_until_time change when a runway is closed or reopened, and a
+    manager picks up direct assignments to any scored field on its next read.
+    """
     runway_id: str  # e.g., "RWY 27L"
     runway_heading_deg: float
     length_ft: float  # Runway length
@@ -90,6 +180,21 @@ class RunwayConfig:
     status: RunwayStatus = RunwayStatus.ACTIVE
     closed_until_time: Optional[float] = None  # Simulation time when runway reopens
 
+    # Heading trig and the heading it was computed for; see _heading_trig()
+    _sin_h: float = field(init=False, repr=False, compare=False)
+    _cos_h: float = field(init=False, repr=False, compare=False)
+    _trig_heading_deg: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._sin_h, self._cos_h = _sin_cos_deg(self.runway_heading_deg)
+        self._trig_heading_deg = self.runway_heading_deg
+
+    def _heading_trig(self) -> Tuple[float, float]:
+        """(sin, cos) of the runway heading, recomputed if the heading was reassigned."""
+        if self.runway_heading_deg != self._trig_heading_deg:
+            self.__post_init__()
+        return self._sin_h, self._cos_h
+
     def is_operational(self, current_time: Optional[float] = None) -> bool:
         """Check if runway is operational."""
         if self.status == RunwayStatus.CLOSED:
@@ -108,8 +213,12 @@ class RunwayConfig:
         if not self.is_operational():
             return False, f"{self.runway_id} is not operational"
 
-        crosswind = abs(wind_conditions.get_crosswind_component(self.runway_heading_deg))
-        headwind = wind_conditions.get_headwind_component(self.runway_heading_deg)
+        # Same identity-based components as _score_runway, so both always agree
+        wind_speed = wind_conditions.wind_speed_kts
+        sin_w, cos_w = wind_conditions._sin_w, wind_conditions._cos_w
+        sin_h, cos_h = self._heading_trig()
+        crosswind = abs(wind_speed * (sin_h * cos_w - cos_h * sin_w))
+        headwind = wind_speed * (cos_h * cos_w + sin_h * sin_w)
 
         if crosswind > self.max_crosswind_kts:
             return False, f"Crosswind {crosswind:.1f}kts exceeds limit {self.max_crosswind_kts}kts"
@@ -127,34 +236,79 @@ class RunwayConfig:
         Calculate suitability score for runway (0-100).
         Higher is better. Negative if unsuitable.
         """
-        if not self.is_operational():
-            return -100.0
+        sin_h, cos_h = self._heading_trig()
+        return _score_runway(
+            sin_h,
+            cos_h,
+            wind_conditions.wind_speed_kts,
+            wind_conditions._sin_w,
+            wind_conditions._cos_w,
+            self.max_crosswind_kts,
+            self.max_headwind_kts,
+            self.max_tailwind_kts,
+            self.is_operational(),
+        )
 
-        can_accept, _ = self.can_accept_aircraft(wind_conditions)
-        if not can_accept:
-            return -50.0
 
-        # Ideal conditions: straight-in landing with minimal crosswind
-        crosswind = abs(wind_conditions.get_crosswind_component(self.runway_heading_deg))
-        headwind = wind_conditions.get_headwind_component(self.runway_heading_deg)
+if NUMBA_AVAILABLE:
+    @guvectorize(
+        ["void(float64[:], float64[:], float64[:], float64[:], float64[:], float64, float64, float64, float64[:])"],
+        "(n),(n),(n),(n),(n),(),(),()->(n)",
+        cache=True,
+    )
+    def _score_all_runways(
+        sin_headings, cos_headings, max_crosswind_kts, max_headwind_kts, max_tailwind_kts,
+        wind_speed_kts, sin_wind, cos_wind, out,
+    ):
+        """Score every runway in one native loop (operational status handled by caller)."""
+        for i in range(sin_headings.shape[0]):
+            out[i] = _score_runway(
+                sin_headings[i], cos_headings[i], wind_speed_kts, sin_wind, cos_wind,
+                max_crosswind_kts[i], max_headwind_kts[i], max_tailwind_kts[i], True,
+            )
+
+
+def _suitability_scores(
+    sin_headings: np.ndarray,
+    cos_headings: np.ndarray,
+    max_crosswind_kts: np.ndarray,
+    max_headwind_kts: np.ndarray,
+    max_tailwind_kts: np.ndarray,
+    wind_conditions: WindConditions,
+) -> np.ndarray:
+    """
+    Vectorized RunwayConfig.get_suitability_score for operational runways.
+
+    Takes parallel per-runway arrays and returns one score per runway
+    (-50 where the wind limits are exceeded). Operational status is not
+    considered here.
+    """
+    wind_speed = wind_conditions.wind_speed_kts
+    sin_w, cos_w = wind_conditions._sin_w, wind_conditions._cos_w
+
+    if NUMBA_AVAILABLE:
+        return _score_all_runways(
+            sin_headings, cos_headings, max_crosswind_kts, max_headwind_kts, max_tailwind_kts,
+            wind_speed, sin_w, cos_w,
+        )
 
-        # Score based on how close to ideal conditions
-        score = 100.0
+    crosswind = np.abs(wind_speed * (sin_headings * cos_w - cos_headings * sin_w))
+    headwind = wind_speed * (cos_headings * cos_w + sin_headings * sin_w)
 
-        # Penalize for crosswind (max penalty 20 points)
-        crosswind_penalty = (crosswind / self.max_crosswind_kts) * 20.0
-        score -= min(crosswind_penalty, 20.0)
+    can_accept = ~(
+        (crosswind > max_crosswind_kts)
+        | (headwind > max_headwind_kts)
+        | (headwind < -max_tailwind_kts)
+    )
 
-        # Penalize for tailwind (max penalty 30 points)
-        if headwind < 0:
-            tailwind_penalty = (-headwind / self.max_tailwind_kts) * 30.0
-            score -= min(tailwind_penalty, 30.0)
-        else:
-            # Bonus for headwind (headwind is good for landing)
-            headwind_bonus = min(headwind / 10.0, 10.0)
-            score += headwind_bonus
+    score = 100.0 - np.minimum(crosswind / max_crosswind_kts * 20.0, 20.0)
+    score += np.where(
+        headwind < 0,
+        -np.minimum(-headwind / max_tailwind_kts * 30.0, 30.0),  # Tailwind penalty
+        np.minimum(headwind / 10.0, 10.0),                       # Headwind bonus
+    )
 
-        return max(score, 0.0)
+    return np.where(can_accept, np.maximum(score, 0.0), -50.0)
 
 
 class RunwayConfigurationManager:
@@ -163,39 +317,106 @@ class RunwayConfigurationManager:
     def __init__(self, airport: Airport):
         self.airport = airport
         self.runways: Dict[str, RunwayConfig] = {}
-        self.active_runway: Optional[str] = None
         self.runway_objects: Dict[str, Runway] = {}
         self.wind_conditions = WindConditions(0.0, 0.0)
-        self.configuration_history: List[Tuple[float, str, str]] = []  # (time, from_runway, to_runway)
         self.last_config_change_time = 0.0
         self.min_time_between_changes_seconds = 300.0  # Minimum 5 minutes between changes
 
+        # Runways are handled internally by integer index; string IDs are
+        # translated once at the public API boundary via _id_to_idx
+        self._runway_ids: List[str] = []
+        self._runway_list: List[RunwayConfig] = []
+        self._runway_object_list: List[Runway] = []
+        self._id_to_idx: Dict[str, int] = {}
+        self._active_idx: Optional[int] = None
+        self._history: List[Tuple[float, int, int]] = []  # (time, from_idx, to_idx)
+
+        # Structure-of-arrays copy of the runway list for vectorized scoring
+        self._sin_headings = np.empty(0)
+        self._cos_headings = np.empty(0)
+        self._max_crosswind = np.empty(0)
+        self._max_headwind = np.empty(0)
+        self._max_tailwind = np.empty(0)
+
+        # Which runways are operational
+        self._operational_mask = np.empty(0, dtype=bool)
+        # Per-runway (heading, limits, status, reopen time) the arrays were
+        # built from; compared on every read (see _current_mask)
+        self._runway_state: List[tuple] = []
+        self._next_reopen_time: Optional[float] = None  # Earliest scheduled reopen
+
+        # Quantized (wind speed, wind direction) -> (scores, best runway index)
+        self._score_cache: Dict[Tuple[float, float], Tuple[np.ndarray, Optional[int]]] = {}
+
+    @property
+    def active_runway(self) -> Optional[str]:
+        """ID of the currently active runway."""
+        if self._active_idx is None:
+            return None
+        return self._runway_ids[self._active_idx]
+
+    @active_runway.setter
+    def active_runway(self, runway_id: Optional[str]) -> None:
+        """Set the active runway by ID; raises ValueError for an unknown ID."""
+        if runway_id is None:
+            self._active_idx = None
+        elif runway_id in self._id_to_idx:
+            self._active_idx = self._id_to_idx[runway_id]
+        else:
+            raise ValueError(f"Runway {runway_id} not found")
+
+    @property
+    def configuration_history(self) -> Tuple[Tuple[float, str, str], ...]:
+        """
+        Runway changes as (time, from_runway, to_runway).
+
+        Built from the index log on each read, so it is a tuple: record changes
+        through change_runway_configuration() rather than appending here.
+        """
+        ids = self._runway_ids
+        return tuple((t, ids[from_idx], ids[to_idx]) for t, from_idx, to_idx in self._history)
+
     def add_runway(self, runway_config: RunwayConfig) -> None:
         """Add a runway to the airport."""
-        self.runways[runway_config.runway_id] = runway_config
+        runway_id = runway_config.runway_id
+        self.runways[runway_id] = runway_config
 
         # Create runway object
-        self.runway_objects[runway_config.runway_id] = Runway(
+        runway_object = Runway(
             airport=self.airport,
             runway_heading_deg=runway_config.runway_heading_deg,
             faf_distance_nm=runway_config.faf_distance_nm,
         )
+        self.runway_objects[runway_id] = runway_object
+
+        if runway_id in self._id_to_idx:
+            # Re-adding an existing ID replaces it in place
+            idx = self._id_to_idx[runway_id]
+            self._runway_list[idx] = runway_config
+            self._runway_object_list[idx] = runway_object
+        else:
+            idx = len(self._runway_list)
+            self._id_to_idx[runway_id] = idx
+            self._runway_ids.append(runway_id)
+            self._runway_list.append(runway_config)
+            self._runway_object_list.append(runway_object)
+        self._rebuild_runway_arrays()
 
         # Set first active runway
-        if self.active_runway is None:
-            self.active_runway = runway_config.runway_id
+        if self._active_idx is None:
+            self._active_idx = idx
 
     def get_active_runway(self) -> Optional[RunwayConfig]:
         """Get currently active runway configuration."""
-        if self.active_runway is None:
+        if self._active_idx is None:
             return None
-        return self.runways.get(self.active_runway)
+        return self._runway_list[self._active_idx]
 
     def get_active_runway_object(self) -> Optional[Runway]:
         """Get currently active runway object."""
-        if self.active_runway is None:
+        if self._active_idx is None:
             return None
-        return self.runway_objects.get(self.active_runway)
+        return self._runway_object_list[self._active_idx]
 
     def update_wind_conditions(
         self,
@@ -203,29 +424,139 @@ class RunwayConfigurationManager:
         wind_direction_deg: float,
         wind_gust_kts: float = 0.0
     ) -> None:
-        """Update current wind conditions."""
+        """Update current wind conditions (no-op if unchanged)."""
+        wind = self.wind_conditions
+        if (
+            wind.wind_speed_kts == wind_speed_kts
+            and wind.wind_direction_deg == wind_direction_deg
+            and wind.wind_gust_kts == wind_gust_kts
+        ):
+            return
         self.wind_conditions = WindConditions(wind_speed_kts, wind_direction_deg, wind_gust_kts)
 
+    @staticmethod
+    def _config_state(config: RunwayConfig) -> tuple:
+        """The RunwayConfig fields the per-runway arrays and mask are built from."""
+        return (
+            config.runway_heading_deg,
+            config.max_crosswind_kts,
+            config.max_headwind_kts,
+            config.max_tailwind_kts,
+            config.status,
+            config.closed_until_time,
+        )
+
+    def _rebuild_runway_arrays(self) -> None:
+        """Refresh the per-runway arrays and operational mask; drops cached scores."""
+        configs = self._runway_list
+        trig = [c._heading_trig() for c in configs]
+        self._sin_headings = np.array([t[0] for t in trig], dtype=np.float64)
+        self._cos_headings = np.array([t[1] for t in trig], dtype=np.float64)
+        self._max_crosswind = np.array([c.max_crosswind_kts for c in configs], dtype=np.float64)
+        self._max_headwind = np.array([c.max_headwind_kts for c in configs], dtype=np.float64)
+        self._max_tailwind = np.array([c.max_tailwind_kts for c in configs], dtype=np.float64)
+        self._operational_mask = np.array([c.is_operational() for c in configs], dtype=bool)
+        reopen_times = [
+            c.closed_until_time for c in configs
+            if c.status == RunwayStatus.CLOSED and c.closed_until_time is not None
+        ]
+        self._next_reopen_time = min(reopen_times) if reopen_times else None
+        self._runway_state = [self._config_state(c) for c in configs]
+        self._score_cache.clear()
+
+    def _current_mask(self) -> np.ndarray:
+        """
+        Operational mask, after rebuilding the per-runway arrays if any config changed.
+
+        RunwayConfig fields can be assigned directly (config.status = ...), so
+        the scored fields of every runway are compared on each read; the
+        arrays and cached scores are only rebuilt when one differs.
+        """
+        config_state = self._config_state
+        if [config_state(c) for c in self._runway_list] != self._runway_state:
+            self._rebuild_runway_arrays()
+        return self._operational_mask
+
+    def _reopen_due_runways(self, current_time: float) -> None:
+        """
+        Reopen runways whose scheduled closure has ended by current_time.
+
+        The config itself is updated, as reopen_runway() would: its status
+        goes back to ACTIVE and closed_until_time is cleared.
+        """
+        self._current_mask()  # Picks up closures assigned directly on configs
+        if self._next_reopen_time is None or current_time < self._next_reopen_time:
+            return
+        for config in self._runway_list:
+            if config.status == RunwayStatus.CLOSED and config.is_operational(current_time):
+                config.status = RunwayStatus.ACTIVE
+                config.closed_until_time = None
+        self._rebuild_runway_arrays()
+
     def get_best_runway(self) -> Optional[str]:
         """
         Select best runway for current wind conditions.
 
+        Wind changes slowly relative to simulation ticks, so scores are
+        cached per wind quantized to 0.1 kt / 0.1° (up to _SCORE_CACHE_SIZE
+        winds) until a runway is added, closed or reopened. Below CALM_WIND_THRESHOLD_KTS
+        the active runway is kept if it is operational.
+
         Returns:
             Runway ID with highest suitability score
         """
-        best_runway = None
-        best_score = -100.0
+        best_idx = self._best_runway_idx()
+        return None if best_idx is None else self._runway_ids[best_idx]
 
-        for runway_id, config in self.runways.items():
-            if not config.is_operational():
-                continue
-
-            score = config.get_suitability_score(self.wind_conditions)
-            if score > best_score:
-                best_score = score
-                best_runway = runway_id
+    def _score_runways(self) -> Tuple[np.ndarray, Optional[int]]:
+        """
+        Suitability score of every runway (index order) for the current wind,
+        plus the index of the best one.
 
-        return best_runway
+        Non-operational runways score -inf so they never win argmax. Cached
+        on quantized wind.
+        """
+        mask = self._current_mask()  # Clears the cache if statuses changed
+        cache_key = (
+            round(self.wind_conditions.wind_speed_kts, 1),
+            round(self.wind_conditions.wind_direction_deg, 1),
+        )
+        cached = self._score_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        scores = _suitability_scores(
+            self._sin_headings,
+            self._cos_headings,
+            self._max_crosswind,
+            self._max_headwind,
+            self._max_tailwind,
+            self.wind_conditions,
+        )
+        scores = np.where(mask, scores, -np.inf)
+
+        best_idx = int(np.argmax(scores)) if len(scores) else None  # First runway wins ties
+        if best_idx is not None and scores[best_idx] == -np.inf:
+            best_idx = None
+
+        if len(self._score_cache) >= _SCORE_CACHE_SIZE:
+            self._score_cache.clear()
+        self._score_cache[cache_key] = (scores, best_idx)
+        return scores, best_idx
+
+    def _best_runway_idx(self) -> Optional[int]:
+        """Index of the best operational runway for the current wind."""
+        if self.wind_conditions.wind_speed_kts < CALM_WIND_THRESHOLD_KTS:
+            return self._calm_wind_runway_idx()
+        return self._score_runways()[1]
+
+    def _calm_wind_runway_idx(self) -> Optional[int]:
+        """Active runway if operational, otherwise the first operational one."""
+        mask = self._current_mask()
+        if self._active_idx is not None and mask[self._active_idx]:
+            return self._active_idx
+        operational = np.flatnonzero(mask)
+        return int(operational[0]) if len(operational) else None
 
     def evaluate_configuration_change(self, current_time: float) -> Tuple[bool, Optional[str], str]:
         """
@@ -238,23 +569,34 @@ class RunwayConfigurationManager:
         if current_time - self.last_config_change_time < self.min_time_between_changes_seconds:
             return False, None, "Minimum time between changes not met"
 
+        self._reopen_due_runways(current_time)
+
         current_runway = self.get_active_runway()
-        best_runway = self.get_best_runway()
+        if (
+            self.wind_conditions.wind_speed_kts < CALM_WIND_THRESHOLD_KTS
+            and current_runway is not None
+            and self._current_mask()[self._active_idx]
+        ):
+            return False, None, "Calm wind, keeping current runway"
 
-        if current_runway is None or best_runway is None:
+        scores, best_idx = self._score_runways()
+
+        if current_runway is None or best_idx is None:
             return False, None, "No suitable runways available"
 
-        if best_runway == self.active_runway:
+        if best_idx == self._active_idx:
             return False, None, "Current runway is optimal"
 
+        best_runway = self._runway_ids[best_idx]
+
         # Check if current runway is no longer suitable
         can_accept, reason = current_runway.can_accept_aircraft(self.wind_conditions)
         if not can_accept:
             return True, best_runway, f"Current runway unsuitable: {reason}"
 
-        # Check if best runway is significantly better
-        current_score = current_runway.get_suitability_score(self.wind_conditions)
-        best_score = self.runways[best_runway].get_suitability_score(self.wind_conditions)
+        # Check if best runway is significantly better (scores computed once above)
+        current_score = float(scores[self._active_idx])
+        best_score = float(scores[best_idx])
 
         if best_score > current_score + 15.0:  # 15 point threshold
             return True, best_runway, f"Better runway available (score {best_score:.0f} vs {current_score:.0f})"
@@ -268,71 +610,81 @@ class RunwayConfigurationManager:
         Returns:
             Tuple of (success, message)
         """
-        if new_runway_id not in self.runways:
+        new_idx = self._id_to_idx.get(new_runway_id)
+        if new_idx is None:
             return False, f"Runway {new_runway_id} not found"
 
-        if not self.runways[new_runway_id].is_operational():
+        if not self._runway_list[new_idx].is_operational():
             return False, f"Runway {new_runway_id} is not operational"
 
         old_runway = self.active_runway
-        self.active_runway = new_runway_id
+        old_idx = self._active_idx
+        self._active_idx = new_idx
         self.last_config_change_time = current_time
 
-        if old_runway:
-            self.configuration_history.append((current_time, old_runway, new_runway_id))
+        if old_idx is not None:
+            self._history.append((current_time, old_idx, new_idx))
 
         return True, f"Runway configuration changed from {old_runway} to {new_runway_id}"
 
     def close_runway(self, runway_id: str, reopen_at_time: Optional[float] = None) -> None:
         """Close a runway for maintenance or emergency."""
-        if runway_id in self.runways:
-            self.runways[runway_id].status = RunwayStatus.CLOSED
-            self.runways[runway_id].closed_until_time = reopen_at_time
+        idx = self._id_to_idx.get(runway_id)
+        if idx is not None:
+            config = self._runway_list[idx]
+            config.status = RunwayStatus.CLOSED
+            config.closed_until_time = reopen_at_time
+            self._rebuild_runway_arrays()
 
             # Switch to different runway if needed
-            if self.active_runway == runway_id:
-                best_runway = self.get_best_runway()
-                if best_runway:
-                    self.active_runway = best_runway
+            if self._active_idx == idx:
+                best_idx = self._best_runway_idx()
+                if best_idx is not None:
+                    self._active_idx = best_idx
 
     def reopen_runway(self, runway_id: str) -> None:
         """Reopen a closed runway."""
-        if runway_id in self.runways:
-            self.runways[runway_id].status = RunwayStatus.ACTIVE
-            self.runways[runway_id].closed_until_time = None
+        idx = self._id_to_idx.get(runway_id)
+        if idx is not None:
+            config = self._runway_list[idx]
+            config.status = RunwayStatus.ACTIVE
+            config.closed_until_time = None
+            self._rebuild_runway_arrays()
 
     def get_summary(self) -> str:
         """Get summary of current runway configuration."""
         active = self.get_active_runway()
-        summary = f"\n{'='*60}\n"
-        summary += f"RUNWAY CONFIGURATION\n"
-        summary += f"{'='*60}\n"
-        summary += f"Active Runway: {self.active_runway}\n"
+        wind = self.wind_conditions
+        rule = "=" * 60
+
+        parts: List[str] = ["", rule, "RUNWAY CONFIGURATION", rule, f"Active Runway: {self.active_runway}"]
 
         if active:
-            summary += f"Heading: {active.runway_heading_deg:.0f}°\n"
-            summary += f"Length: {active.length_ft:.0f} ft\n"
+            parts.append(f"Heading: {active.runway_heading_deg:.0f}°")
+            parts.append(f"Length: {active.length_ft:.0f} ft")
 
-            can_accept, reason = active.can_accept_aircraft(self.wind_conditions)
-            summary += f"Status: {'OPERATIONAL' if can_accept else 'UNSUITABLE'}\n"
+            can_accept, reason = active.can_accept_aircraft(wind)
+            parts.append(f"Status: {'OPERATIONAL' if can_accept else 'UNSUITABLE'}")
             if not can_accept:
-                summary += f"  Reason: {reason}\n"
+                parts.append(f"  Reason: {reason}")
 
-            score = active.get_suitability_score(self.wind_conditions)
-            summary += f"Suitability Score: {score:.0f}/100\n"
+            score = active.get_suitability_score(wind)
+            parts.append(f"Suitability Score: {score:.0f}/100")
 
-        summary += f"\nWind: {self.wind_conditions.wind_speed_kts:.1f}kts from {self.wind_conditions.wind_direction_deg:.0f}°\n"
-        summary += f"Gust: {self.wind_conditions.wind_gust_kts:.1f}kts\n"
+        parts.append(f"\nWind: {wind.wind_speed_kts:.1f}kts from {wind.wind_direction_deg:.0f}°")
+        parts.append(f"Gust: {wind.wind_gust_kts:.1f}kts")
 
-        summary += f"\nAvailable Runways:\n"
-        for runway_id, config in self.runways.items():
+        parts.append("\nAvailable Runways:")
+        for idx, config in enumerate(self._runway_list):
+            runway_id = self._runway_ids[idx]
             status = "ACTIVE" if config.status == RunwayStatus.ACTIVE else "CLOSED"
-            score = config.get_suitability_score(self.wind_conditions)
-            marker = "→" if runway_id == self.active_runway else " "
-            summary += f"  {marker} {runway_id}: {config.runway_heading_deg:.0f}° ({status}) Score: {score:.0f}\n"
+            score = config.get_suitability_score(wind)
+            marker = "→" if idx == self._active_idx else " "
+            parts.append(f"  {marker} {runway_id}: {config.runway_heading_deg:.0f}° ({status}) Score: {score:.0f}")
 
-        summary += f"{'='*60}\n"
-        return summary
+        parts.append(rule)
+        parts.append("")  # Trailing newline
+        return "\n".join(parts)
 
 
 if __name__ == "__main__":
@@ -10,6 +10,9 @@ from scenarios.airport_scenarios import (
     Runway,
     NavigationFix,
     Procedure,
+    TrafficSpec,
+    WeatherPattern,
+    Challenge,
     get_airport_scenario,
     list_available_airports,
     MAJOR_AIRPORTS,
@@ -28,6 +31,9 @@ __all__ = [
     "Runway",
     "NavigationFix",
     "Procedure",
+    "TrafficSpec",
+    "WeatherPattern",
+    "Challenge",
     "get_airport_scenario",
     "list_available_airports",
     "MAJOR_AIRPORTS",
@@ -11,8 +11,11 @@ Airports included:
 - ATL (Hartsfield-Jackson Atlanta International)
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Tuple
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from operator import attrgetter
+from sys import intern
+from typing import List, Dict, Mapping, NamedTuple, Optional, Tuple
 from enum import Enum
 import numpy as np
 
@@ -26,7 +29,24 @@ class AirportCode(Enum):
     ATL = "ATL"  # Atlanta
 
 
-@dataclass
+# Code strings in declaration order, resolved once instead of iterating the Enum
+_AIRPORT_CODE_VALUES: Tuple[str, ...] = tuple(code.value for code in AirportCode)
+
+
+def _make_fast_asdict(cls):
+    """
+    Build an asdict() equivalent for a dataclass whose fields are all
+    primitives. The field list is resolved once here, so calls skip asdict's
+    per-call field walk, recursion and deepcopy.
+    """
+    getters = tuple((f.name, attrgetter(f.name)) for f in fields(cls))
+
+    def _as_dict(obj) -> Dict:
+        return {name: getter(obj) for name, getter in getters}
+    return _as_dict
+
+
+@dataclass(slots=True)
 class Runway:
     """Runway configuration"""
     runway_id: str
@@ -39,7 +59,10 @@ class Runway:
     max_crosswind_kts: float = 15.0
 
 
-@dataclass
+Runway._as_dict = _make_fast_asdict(Runway)
+
+
+@dataclass(slots=True)
 class NavigationFix:
     """Navigation fix (waypoint)"""
     fix_id: str
@@ -48,7 +71,7 @@ class NavigationFix:
     altitude_restriction_ft: int = 0  # 0 = no restriction
 
 
-@dataclass
+@dataclass(slots=True)
 class Procedure:
     """Approach or departure procedure"""
     name: str
@@ -58,9 +81,70 @@ class Procedure:
     altitude_restrictions: List[int]  # Feet at each fix
     speed_restrictions: List[int]  # Knots at each fix
     description: str = ""
+    # Array views of the lists above for vectorized consumers
+    fix_positions: np.ndarray = field(init=False, repr=False, compare=False)  # (n, 2) nm
+    alt_restr: np.ndarray = field(init=False, repr=False, compare=False)
+    spd_restr: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.fix_positions = np.asarray(
+            [f.position_nm for f in self.fixes], dtype=np.float32
+        ).reshape(-1, 2)
+        self.alt_restr = np.asarray(self.altitude_restrictions, dtype=np.int32)
+        self.spd_restr = np.asarray(self.speed_restrictions, dtype=np.int32)
+
+
+class TrafficSpec(NamedTuple):
+    """Typical airline traffic at an airport"""
+    aircraft_id: str  # Airline prefix used for callsigns
+    aircraft_type: str
+    count: int
+    weight: str = "medium"
+
+
+class WeatherPattern(NamedTuple):
+    """Representative weather condition"""
+    name: str
+    visibility_sm: int
+    ceiling_ft: int
+    wind_speed: int  # Knots
+    wind_direction: int  # Degrees (where wind comes FROM)
+    description: str = ""
+
+
+class Challenge(NamedTuple):
+    """Airport-specific training challenge"""
+    name: str
+    description: str
+    difficulty: Optional[str] = None  # None = use the scenario difficulty
+    objectives: Tuple[str, ...] = ()
+
+
+class _FrozenDict(dict):
+    """Read-only dict that still pickles, deep-copies and JSON-encodes like a dict."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
 
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
 
-@dataclass
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+def _freeze_voice_pack(value):
+    """Recursively intern strings and freeze dicts into read-only _FrozenDicts."""
+    if isinstance(value, str):
+        return intern(value)
+    if isinstance(value, Mapping):
+        return _FrozenDict({intern(k): _freeze_voice_pack(v) for k, v in value.items()})
+    return value
+
+
+@dataclass(slots=True)
 class AirportScenario:
     """Complete airport scenario"""
     airport_code: AirportCode
@@ -69,10 +153,33 @@ class AirportScenario:
     elevation_ft: int
     runways: List[Runway]
     procedures: List[Procedure]
-    typical_traffic: List[Dict] = field(default_factory=list)
-    weather_patterns: List[Dict] = field(default_factory=list)
-    challenges: List[Dict] = field(default_factory=list)
-    voice_pack: Dict = field(default_factory=dict)
+    typical_traffic: Tuple[TrafficSpec, ...] = ()
+    weather_patterns: Tuple[WeatherPattern, ...] = ()
+    challenges: Tuple[Challenge, ...] = ()
+    voice_pack: Mapping = field(default_factory=dict)  # Frozen in __post_init__
+    # Runway columns for vectorized wind checks, in self.runways order
+    runway_headings: np.ndarray = field(init=False, repr=False, compare=False)
+    runway_ids: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    traffic_counts: np.ndarray = field(init=False, repr=False, compare=False)  # Per typical_traffic entry
+    # Scenario-file forms of runways/procedures, materialized once per airport
+    runway_dicts: Tuple[Dict, ...] = field(init=False, repr=False, compare=False)
+    procedure_dicts: Tuple[Dict, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.runway_headings = np.array([r.heading_deg for r in self.runways], dtype=np.float64)
+        self.runway_ids = tuple(r.runway_id for r in self.runways)
+        self.voice_pack = _freeze_voice_pack(self.voice_pack)
+        self.traffic_counts = np.array([t.count for t in self.typical_traffic], dtype=np.int32)
+        self.runway_dicts = tuple(r._as_dict() for r in self.runways)
+        self.procedure_dicts = tuple(
+            {
+                "name": p.name,
+                "type": p.procedure_type,
+                "runway": p.runway,
+                "description": p.description,
+            }
+            for p in self.procedures
+        )
 
 
 # ============================================================================
@@ -80,133 +187,135 @@ class AirportScenario:
 # Known for: Parallel approaches, marine layer, challenging winds
 # ============================================================================
 
-SFO_AIRPORT = AirportScenario(
-    airport_code=AirportCode.SFO,
-    name="San Francisco International Airport",
-    position_nm=(0.0, 0.0),
-    elevation_ft=13,
-    runways=[
-        Runway("28L", 280.0, 11066, 150, ils_equipped=True),
-        Runway("28R", 280.0, 10604, 150, ils_equipped=True),
-        Runway("01L", 10.0, 10604, 150, ils_equipped=True),
-        Runway("01R", 10.0, 11066, 150, ils_equipped=True),
-    ],
-    procedures=[
-        Procedure(
-            name="RNAV Approach RWY 28L",
-            procedure_type="approach",
-            runway="28L",
-            fixes=[
-                NavigationFix("MARBL", (10.0, 5.0), "fix", 6000),
-                NavigationFix("TRONC", (5.0, 3.0), "fix", 3000),
-                NavigationFix("MADBE", (2.0, 1.0), "fix", 1500),
-            ],
-            altitude_restrictions=[6000, 3000, 1500],
-            speed_restrictions=[250, 200, 160],
-            description="Parallel runway approach RWY 28L via MARBL transition"
+@lru_cache(maxsize=None)
+def _build_sfo() -> AirportScenario:
+    return AirportScenario(
+        airport_code=AirportCode.SFO,
+        name="San Francisco International Airport",
+        position_nm=(0.0, 0.0),
+        elevation_ft=13,
+        runways=[
+            Runway("28L", 280.0, 11066, 150, ils_equipped=True),
+            Runway("28R", 280.0, 10604, 150, ils_equipped=True),
+            Runway("01L", 10.0, 10604, 150, ils_equipped=True),
+            Runway("01R", 10.0, 11066, 150, ils_equipped=True),
+        ],
+        procedures=[
+            Procedure(
+                name="RNAV Approach RWY 28L",
+                procedure_type="approach",
+                runway="28L",
+                fixes=[
+                    NavigationFix("MARBL", (10.0, 5.0), "fix", 6000),
+                    NavigationFix("TRONC", (5.0, 3.0), "fix", 3000),
+                    NavigationFix("MADBE", (2.0, 1.0), "fix", 1500),
+                ],
+                altitude_restrictions=[6000, 3000, 1500],
+                speed_restrictions=[250, 200, 160],
+                description="Parallel runway approach RWY 28L via MARBL transition"
+            ),
+            Procedure(
+                name="RNAV Approach RWY 28R",
+                procedure_type="approach",
+                runway="28R",
+                fixes=[
+                    NavigationFix("MARBL", (10.0, 5.0), "fix", 6000),
+                    NavigationFix("TRONC", (5.0, 3.0), "fix", 3000),
+                    NavigationFix("MADBE", (2.0, 1.0), "fix", 1500),
+                ],
+                altitude_restrictions=[6000, 3000, 1500],
+                speed_restrictions=[250, 200, 160],
+                description="Parallel runway approach RWY 28R via MARBL transition"
+            ),
+        ],
+        typical_traffic=(
+            TrafficSpec(
+                aircraft_id="UAL",
+                aircraft_type="B737",
+                count=3,
+                weight="heavy",
+            ),
+            TrafficSpec(
+                aircraft_id="AAL",
+                aircraft_type="A320",
+                count=2,
+                weight="medium",
+            ),
+            TrafficSpec(
+                aircraft_id="SWR",
+                aircraft_type="B737",
+                count=2,
+                weight="medium",
+            ),
+        ),
+        weather_patterns=(
+            WeatherPattern(
+                name="Morning Marine Layer",
+                visibility_sm=2,
+                ceiling_ft=1200,
+                wind_speed=8,
+                wind_direction=270,
+                description="Typical morning fog condition"
+            ),
+            WeatherPattern(
+                name="Afternoon Sea Breeze",
+                visibility_sm=8,
+                ceiling_ft=3000,
+                wind_speed=12,
+                wind_direction=290,
+                description="Clear afternoon with westerly wind"
+            ),
+            WeatherPattern(
+                name="Night Calm",
+                visibility_sm=10,
+                ceiling_ft=5000,
+                wind_speed=4,
+                wind_direction=270,
+                description="Clear night conditions"
+            ),
         ),
-        Procedure(
-            name="RNAV Approach RWY 28R",
-            procedure_type="approach",
-            runway="28R",
-            fixes=[
-                NavigationFix("MARBL", (10.0, 5.0), "fix", 6000),
-                NavigationFix("TRONC", (5.0, 3.0), "fix", 3000),
-                NavigationFix("MADBE", (2.0, 1.0), "fix", 1500),
-            ],
-            altitude_restrictions=[6000, 3000, 1500],
-            speed_restrictions=[250, 200, 160],
-            description="Parallel runway approach RWY 28R via MARBL transition"
+        challenges=(
+            Challenge(
+                name="Parallel Runway Approach",
+                description="Manage simultaneous approaches to RWY 28L and 28R with proper spacing",
+                difficulty="advanced",
+                objectives=(
+                    "Maintain proper spacing (1000ft vertical or 2nm horizontal)",
+                    "Sequence two aircraft for parallel approaches",
+                    "Execute smooth transitions",
+                )
+            ),
+            Challenge(
+                name="Marine Layer Approach",
+                description="Navigate through marine layer with low visibility and ceiling",
+                difficulty="intermediate",
+                objectives=(
+                    "Use instruments for approach",
+                    "Maintain heading alignment",
+                    "Manage descent profile in low visibility",
+                )
+            ),
+            Challenge(
+                name="Wind Shift Landing",
+                description="Handle significant wind shift during approach sequence",
+                difficulty="advanced",
+                objectives=(
+                    "Detect wind shift from 270 to 290 degrees",
+                    "Adjust approach vectors accordingly",
+                    "Maintain separation during modification",
+                )
+            ),
         ),
-    ],
-    typical_traffic=[
-        {
-            "aircraft_id": "UAL",
-            "aircraft_type": "B737",
-            "count": 3,
-            "weight": "heavy",
-        },
-        {
-            "aircraft_id": "AAL",
-            "aircraft_type": "A320",
-            "count": 2,
-            "weight": "medium",
-        },
-        {
-            "aircraft_id": "SWR",
-            "aircraft_type": "B737",
-            "count": 2,
-            "weight": "medium",
-        },
-    ],
-    weather_patterns=[
-        {
-            "name": "Morning Marine Layer",
-            "visibility_sm": 2,
-            "ceiling_ft": 1200,
-            "wind_speed": 8,
-            "wind_direction": 270,
-            "description": "Typical morning fog condition"
-        },
-        {
-            "name": "Afternoon Sea Breeze",
-            "visibility_sm": 8,
-            "ceiling_ft": 3000,
-            "wind_speed": 12,
-            "wind_direction": 290,
-            "description": "Clear afternoon with westerly wind"
-        },
-        {
-            "name": "Night Calm",
-            "visibility_sm": 10,
-            "ceiling_ft": 5000,
-            "wind_speed": 4,
-            "wind_direction": 270,
-            "description": "Clear night conditions"
-        },
-    ],
-    challenges=[
-        {
-            "name": "Parallel Runway Approach",
-            "description": "Manage simultaneous approaches to RWY 28L and 28R with proper spacing",
-            "difficulty": "advanced",
-            "objectives": [
-                "Maintain proper spacing (1000ft vertical or 2nm horizontal)",
-                "Sequence two aircraft for parallel approaches",
-                "Execute smooth transitions",
-            ]
-        },
-        {
-            "name": "Marine Layer Approach",
-            "description": "Navigate through marine layer with low visibility and ceiling",
-            "difficulty": "intermediate",
-            "objectives": [
-                "Use instruments for approach",
-                "Maintain heading alignment",
-                "Manage descent profile in low visibility",
-            ]
-        },
-        {
-            "name": "Wind Shift Landing",
-            "description": "Handle significant wind shift during approach sequence",
-            "difficulty": "advanced",
-            "objectives": [
-                "Detect wind shift from 270 to 290 degrees",
-                "Adjust approach vectors accordingly",
-                "Maintain separation during modification",
-            ]
-        },
-    ],
-    voice_pack={
-        "station_id": "San Francisco Ground",
-        "atc_phrases": {
-            "welcome": "Welcome to San Francisco Approach",
-            "descend": "Descend and maintain three thousand",
-            "approach_clearance": "Cleared for parallel approach to two-eight left",
-            "landing_clearance": "Cleared to land runway two-eight left, wind two-seven-zero at eight knots",
+        voice_pack={
+            "station_id": "San Francisco Ground",
+            "atc_phrases": {
+                "welcome": "Welcome to San Francisco Approach",
+                "descend": "Descend and maintain three thousand",
+                "approach_clearance": "Cleared for parallel approach to two-eight left",
+                "landing_clearance": "Cleared to land runway two-eight left, wind two-seven-zero at eight knots",
+            }
         }
-    }
-)
+    )
 
 
 # ============================================================================
@@ -214,142 +323,144 @@ SFO_AIRPORT = AirportScenario(
 # Known for: Complex runway system, crossing runways, heavy traffic
 # ============================================================================
 
-LAX_AIRPORT = AirportScenario(
-    airport_code=AirportCode.LAX,
-    name="Los Angeles International Airport",
-    position_nm=(0.0, 0.0),
-    elevation_ft=126,
-    runways=[
-        Runway("24L", 240.0, 12923, 200, ils_equipped=True),
-        Runway("24R", 240.0, 12923, 200, ils_equipped=True),
-        Runway("06L", 60.0, 12923, 200, ils_equipped=True),
-        Runway("06R", 60.0, 12923, 200, ils_equipped=True),
-        Runway("25L", 250.0, 10860, 150, ils_equipped=True),
-        Runway("25R", 250.0, 10860, 150, ils_equipped=True),
-    ],
-    procedures=[
-        Procedure(
-            name="RNAV Approach RWY 24L",
-            procedure_type="approach",
-            runway="24L",
-            fixes=[
-                NavigationFix("SANER", (15.0, 8.0), "fix", 5000),
-                NavigationFix("FAJEN", (8.0, 4.0), "fix", 2500),
-                NavigationFix("RIDLE", (2.0, 1.0), "fix", 1500),
-            ],
-            altitude_restrictions=[5000, 2500, 1500],
-            speed_restrictions=[250, 200, 150],
-            description="Approach to LAX RWY 24L"
+@lru_cache(maxsize=None)
+def _build_lax() -> AirportScenario:
+    return AirportScenario(
+        airport_code=AirportCode.LAX,
+        name="Los Angeles International Airport",
+        position_nm=(0.0, 0.0),
+        elevation_ft=126,
+        runways=[
+            Runway("24L", 240.0, 12923, 200, ils_equipped=True),
+            Runway("24R", 240.0, 12923, 200, ils_equipped=True),
+            Runway("06L", 60.0, 12923, 200, ils_equipped=True),
+            Runway("06R", 60.0, 12923, 200, ils_equipped=True),
+            Runway("25L", 250.0, 10860, 150, ils_equipped=True),
+            Runway("25R", 250.0, 10860, 150, ils_equipped=True),
+        ],
+        procedures=[
+            Procedure(
+                name="RNAV Approach RWY 24L",
+                procedure_type="approach",
+                runway="24L",
+                fixes=[
+                    NavigationFix("SANER", (15.0, 8.0), "fix", 5000),
+                    NavigationFix("FAJEN", (8.0, 4.0), "fix", 2500),
+                    NavigationFix("RIDLE", (2.0, 1.0), "fix", 1500),
+                ],
+                altitude_restrictions=[5000, 2500, 1500],
+                speed_restrictions=[250, 200, 150],
+                description="Approach to LAX RWY 24L"
+            ),
+            Procedure(
+                name="RNAV Approach RWY 24R",
+                procedure_type="approach",
+                runway="24R",
+                fixes=[
+                    NavigationFix("SANER", (15.0, 8.0), "fix", 5000),
+                    NavigationFix("FAJEN", (8.0, 4.0), "fix", 2500),
+                    NavigationFix("RIDLE", (2.0, 1.0), "fix", 1500),
+                ],
+                altitude_restrictions=[5000, 2500, 1500],
+                speed_restrictions=[250, 200, 150],
+                description="Approach to LAX RWY 24R"
+            ),
+        ],
+        typical_traffic=(
+            TrafficSpec(
+                aircraft_id="AAL",
+                aircraft_type="B777",
+                count=4,
+                weight="heavy",
+            ),
+            TrafficSpec(
+                aircraft_id="UAL",
+                aircraft_type="B787",
+                count=3,
+                weight="heavy",
+            ),
+            TrafficSpec(
+                aircraft_id="DAL",
+                aircraft_type="A321",
+                count=3,
+                weight="medium",
+            ),
+            TrafficSpec(
+                aircraft_id="SWR",
+                aircraft_type="B737",
+                count=2,
+                weight="medium",
+            ),
+        ),
+        weather_patterns=(
+            WeatherPattern(
+                name="Santa Ana Winds",
+                visibility_sm=6,
+                ceiling_ft=2500,
+                wind_speed=18,
+                wind_direction=100,
+                description="Strong Santa Ana winds from the desert"
+            ),
+            WeatherPattern(
+                name="Marine Inversion",
+                visibility_sm=4,
+                ceiling_ft=1500,
+                wind_speed=10,
+                wind_direction=240,
+                description="Marine layer with inversion layer"
+            ),
+            WeatherPattern(
+                name="Clear Southern California",
+                visibility_sm=10,
+                ceiling_ft=5000,
+                wind_speed=8,
+                wind_direction=250,
+                description="Typical clear LA weather"
+            ),
         ),
-        Procedure(
-            name="RNAV Approach RWY 24R",
-            procedure_type="approach",
-            runway="24R",
-            fixes=[
-                NavigationFix("SANER", (15.0, 8.0), "fix", 5000),
-                NavigationFix("FAJEN", (8.0, 4.0), "fix", 2500),
-                NavigationFix("RIDLE", (2.0, 1.0), "fix", 1500),
-            ],
-            altitude_restrictions=[5000, 2500, 1500],
-            speed_restrictions=[250, 200, 150],
-            description="Approach to LAX RWY 24R"
+        challenges=(
+            Challenge(
+                name="High Density Traffic",
+                description="Manage 6+ aircraft in approach sequence with crossing runways",
+                difficulty="expert",
+                objectives=(
+                    "Sequence 6 aircraft safely",
+                    "Maintain proper separation",
+                    "Manage runway crossing conflicts",
+                    "Optimize landing throughput",
+                )
+            ),
+            Challenge(
+                name="Santa Ana Wind Challenge",
+                description="Navigate strong desert winds with variable gusts",
+                difficulty="advanced",
+                objectives=(
+                    "Handle 18+ knot winds from unusual direction",
+                    "Manage wind shear warnings",
+                    "Execute stable approaches in gusty conditions",
+                )
+            ),
+            Challenge(
+                name="Runway Crossing Management",
+                description="Manage aircraft crossing active runways during arrivals/departures",
+                difficulty="advanced",
+                objectives=(
+                    "Sequence arrivals on 24L/R",
+                    "Allow departures on 25L/R to cross",
+                    "Maintain safety throughout sequence",
+                )
+            ),
         ),
-    ],
-    typical_traffic=[
-        {
-            "aircraft_id": "AAL",
-            "aircraft_type": "B777",
-            "count": 4,
-            "weight": "heavy",
-        },
-        {
-            "aircraft_id": "UAL",
-            "aircraft_type": "B787",
-            "count": 3,
-            "weight": "heavy",
-        },
-        {
-            "aircraft_id": "DAL",
-            "aircraft_type": "A321",
-            "count": 3,
-            "weight": "medium",
-        },
-        {
-            "aircraft_id": "SWR",
-            "aircraft_type": "B737",
-            "count": 2,
-            "weight": "medium",
-        },
-    ],
-    weather_patterns=[
-        {
-            "name": "Santa Ana Winds",
-            "visibility_sm": 6,
-            "ceiling_ft": 2500,
-            "wind_speed": 18,
-            "wind_direction": 100,
-            "description": "Strong Santa Ana winds from the desert"
-        },
-        {
-            "name": "Marine Inversion",
-            "visibility_sm": 4,
-            "ceiling_ft": 1500,
-            "wind_speed": 10,
-            "wind_direction": 240,
-            "description": "Marine layer with inversion layer"
-        },
-        {
-            "name": "Clear Southern California",
-            "visibility_sm": 10,
-            "ceiling_ft": 5000,
-            "wind_speed": 8,
-            "wind_direction": 250,
-            "description": "Typical clear LA weather"
-        },
-    ],
-    challenges=[
-        {
-            "name": "High Density Traffic",
-            "description": "Manage 6+ aircraft in approach sequence with crossing runways",
-            "difficulty": "expert",
-            "objectives": [
-                "Sequence 6 aircraft safely",
-                "Maintain proper separation",
-                "Manage runway crossing conflicts",
-                "Optimize landing throughput",
-            ]
-        },
-        {
-            "name": "Santa Ana Wind Challenge",
-            "description": "Navigate strong desert winds with variable gusts",
-            "difficulty": "advanced",
-            "objectives": [
-                "Handle 18+ knot winds from unusual direction",
-                "Manage wind shear warnings",
-                "Execute stable approaches in gusty conditions",
-            ]
-        },
-        {
-            "name": "Runway Crossing Management",
-            "description": "Manage aircraft crossing active runways during arrivals/departures",
-            "difficulty": "advanced",
-            "objectives": [
-                "Sequence arrivals on 24L/R",
-                "Allow departures on 25L/R to cross",
-                "Maintain safety throughout sequence",
-            ]
-        },
-    ],
-    voice_pack={
-        "station_id": "Los Angeles Approach",
-        "atc_phrases": {
-            "welcome": "Welcome to Los Angeles Approach",
-            "descend": "Descend and maintain two thousand five hundred",
-            "approach_clearance": "Cleared for approach runway two-four left",
-            "landing_clearance": "Cleared to land runway two-four left, wind two-four-zero at eight knots",
+        voice_pack={
+            "station_id": "Los Angeles Approach",
+            "atc_phrases": {
+                "welcome": "Welcome to Los Angeles Approach",
+                "descend": "Descend and maintain two thousand five hundred",
+                "approach_clearance": "Cleared for approach runway two-four left",
+                "landing_clearance": "Cleared to land runway two-four left, wind two-four-zero at eight knots",
+            }
         }
-    }
-)
+    )
 
 
 # ============================================================================
@@ -357,119 +468,121 @@ LAX_AIRPORT = AirportScenario(
 # Known for: Complex procedures, heavy traffic, cold weather
 # ============================================================================
 
-JFK_AIRPORT = AirportScenario(
-    airport_code=AirportCode.JFK,
-    name="John F. Kennedy International Airport",
-    position_nm=(0.0, 0.0),
-    elevation_ft=13,
-    runways=[
-        Runway("04L", 40.0, 14511, 200, ils_equipped=True),
-        Runway("04R", 40.0, 13000, 200, ils_equipped=True),
-        Runway("22L", 220.0, 14000, 200, ils_equipped=True),
-        Runway("22R", 220.0, 14511, 200, ils_equipped=True),
-        Runway("13L", 130.0, 8550, 150, ils_equipped=False),
-        Runway("13R", 130.0, 8550, 150, ils_equipped=False),
-    ],
-    procedures=[
-        Procedure(
-            name="STAR Arrival CANOE TWO",
-            procedure_type="arrival",
-            runway="04L",
-            fixes=[
-                NavigationFix("CANOE", (25.0, 15.0), "fix", 4000),
-                NavigationFix("DOVER", (15.0, 8.0), "fix", 2500),
-                NavigationFix("LNSKY", (5.0, 2.0), "fix", 1500),
-            ],
-            altitude_restrictions=[4000, 2500, 1500],
-            speed_restrictions=[250, 200, 160],
-            description="CANOE TWO departure to JFK RWY 04"
+@lru_cache(maxsize=None)
+def _build_jfk() -> AirportScenario:
+    return AirportScenario(
+        airport_code=AirportCode.JFK,
+        name="John F. Kennedy International Airport",
+        position_nm=(0.0, 0.0),
+        elevation_ft=13,
+        runways=[
+            Runway("04L", 40.0, 14511, 200, ils_equipped=True),
+            Runway("04R", 40.0, 13000, 200, ils_equipped=True),
+            Runway("22L", 220.0, 14000, 200, ils_equipped=True),
+            Runway("22R", 220.0, 14511, 200, ils_equipped=True),
+            Runway("13L", 130.0, 8550, 150, ils_equipped=False),
+            Runway("13R", 130.0, 8550, 150, ils_equipped=False),
+        ],
+        procedures=[
+            Procedure(
+                name="STAR Arrival CANOE TWO",
+                procedure_type="arrival",
+                runway="04L",
+                fixes=[
+                    NavigationFix("CANOE", (25.0, 15.0), "fix", 4000),
+                    NavigationFix("DOVER", (15.0, 8.0), "fix", 2500),
+                    NavigationFix("LNSKY", (5.0, 2.0), "fix", 1500),
+                ],
+                altitude_restrictions=[4000, 2500, 1500],
+                speed_restrictions=[250, 200, 160],
+                description="CANOE TWO departure to JFK RWY 04"
+            ),
+        ],
+        typical_traffic=(
+            TrafficSpec(
+                aircraft_id="DAL",
+                aircraft_type="B777",
+                count=4,
+                weight="heavy",
+            ),
+            TrafficSpec(
+                aircraft_id="BAW",
+                aircraft_type="B777",
+                count=3,
+                weight="heavy",
+            ),
+            TrafficSpec(
+                aircraft_id="UAL",
+                aircraft_type="B767",
+                count=3,
+                weight="heavy",
+            ),
+            TrafficSpec(
+                aircraft_id="AAL",
+                aircraft_type="A321",
+                count=2,
+                weight="medium",
+            ),
         ),
-    ],
-    typical_traffic=[
-        {
-            "aircraft_id": "DAL",
-            "aircraft_type": "B777",
-            "count": 4,
-            "weight": "heavy",
-        },
-        {
-            "aircraft_id": "BAW",
-            "aircraft_type": "B777",
-            "count": 3,
-            "weight": "heavy",
-        },
-        {
-            "aircraft_id": "UAL",
-            "aircraft_type": "B767",
-            "count": 3,
-            "weight": "heavy",
-        },
-        {
-            "aircraft_id": "AAL",
-            "aircraft_type": "A321",
-            "count": 2,
-            "weight": "medium",
-        },
-    ],
-    weather_patterns=[
-        {
-            "name": "Winter Conditions",
-            "visibility_sm": 2,
-            "ceiling_ft": 800,
-            "wind_speed": 15,
-            "wind_direction": 330,
-            "description": "Winter snow and low visibility"
-        },
-        {
-            "name": "Spring Storms",
-            "visibility_sm": 3,
-            "ceiling_ft": 1200,
-            "wind_speed": 20,
-            "wind_direction": 180,
-            "description": "Spring thunderstorms"
-        },
-        {
-            "name": "Clear Summer",
-            "visibility_sm": 10,
-            "ceiling_ft": 5000,
-            "wind_speed": 10,
-            "wind_direction": 220,
-            "description": "Clear summer day"
-        },
-    ],
-    challenges=[
-        {
-            "name": "Winter Landing Challenge",
-            "description": "Land heavy aircraft in winter conditions with low visibility",
-            "difficulty": "expert",
-            "objectives": [
-                "Manage low ceiling approach",
-                "Handle strong northerly winds",
-                "Execute stable landing",
-                "Avoid go-arounds",
-            ]
-        },
-        {
-            "name": "Complex Arrival Procedures",
-            "description": "Follow STAR procedures with multiple waypoints and restrictions",
-            "difficulty": "advanced",
-            "objectives": [
-                "Follow CANOE TWO procedure exactly",
-                "Maintain altitude restrictions",
-                "Execute speed reductions at each fix",
-            ]
-        },
-    ],
-    voice_pack={
-        "station_id": "New York Approach",
-        "atc_phrases": {
-            "welcome": "Welcome to New York Approach",
-            "descend": "Descend and maintain three thousand",
-            "approach_clearance": "Cleared for approach runway zero-four left",
-            "landing_clearance": "Cleared to land runway zero-four left, wind three-three-zero at twelve knots",
+        weather_patterns=(
+            WeatherPattern(
+                name="Winter Conditions",
+                visibility_sm=2,
+                ceiling_ft=800,
+                wind_speed=15,
+                wind_direction=330,
+                description="Winter snow and low visibility"
+            ),
+            WeatherPattern(
+                name="Spring Storms",
+                visibility_sm=3,
+                ceiling_ft=1200,
+                wind_speed=20,
+                wind_direction=180,
+                description="Spring thunderstorms"
+            ),
+            WeatherPattern(
+                name="Clear Summer",
+                visibility_sm=10,
+                ceiling_ft=5000,
+                wind_speed=10,
+                wind_direction=220,
+                description="Clear summer day"
+            ),
+        ),
+        challenges=(
+            Challenge(
+                name="Winter Landing Challenge",
+                description="Land heavy aircraft in winter conditions with low visibility",
+                difficulty="expert",
+                objectives=(
+                    "Manage low ceiling approach",
+                    "Handle strong northerly winds",
+                    "Execute stable landing",
+                    "Avoid go-arounds",
+                )
+            ),
+            Challenge(
+                name="Complex Arrival Procedures",
+                description="Follow STAR procedures with multiple waypoints and restrictions",
+                difficulty="advanced",
+                objectives=(
+                    "Follow CANOE TWO procedure exactly",
+                    "Maintain altitude restrictions",
+                    "Execute speed reductions at each fix",
+                )
+            ),
+        ),
+        voice_pack={
+            "station_id": "New York Approach",
+            "atc_phrases": {
+                "welcome": "Welcome to New York Approach",
+                "descend": "Descend and maintain three thousand",
+                "approach_clearance": "Cleared for approach runway zero-four left",
+                "landing_clearance": "Cleared to land runway zero-four left, wind three-three-zero at twelve knots",
+            }
         }
-    }
-)
+    )
 
 
 # ============================================================================
@@ -477,118 +590,120 @@ JFK_AIRPORT = AirportScenario(
 # Known for: Challenging weather, complex traffic, frequent delays
 # ============================================================================
 
-ORD_AIRPORT = AirportScenario(
-    airport_code=AirportCode.ORD,
-    name="Chicago O'Hare International Airport",
-    position_nm=(0.0, 0.0),
-    elevation_ft=682,
-    runways=[
-        Runway("28C", 280.0, 13000, 200, ils_equipped=True),
-        Runway("28L", 280.0, 12000, 200, ils_equipped=True),
-        Runway("28R", 280.0, 13000, 200, ils_equipped=True),
-        Runway("10L", 100.0, 11000, 150, ils_equipped=True),
-        Runway("10R", 100.0, 13000, 150, ils_equipped=True),
-        Runway("10C", 100.0, 13000, 150, ils_equipped=True),
-    ],
-    procedures=[
-        Procedure(
-            name="RNAV Approach RWY 28L",
-            procedure_type="approach",
-            runway="28L",
-            fixes=[
-                NavigationFix("WAUKEE", (20.0, 10.0), "fix", 4000),
-                NavigationFix("ARLON", (10.0, 5.0), "fix", 2000),
-                NavigationFix("MIDWAY", (2.0, 1.0), "fix", 1000),
-            ],
-            altitude_restrictions=[4000, 2000, 1000],
-            speed_restrictions=[250, 180, 140],
-            description="Approach to ORD RWY 28"
+@lru_cache(maxsize=None)
+def _build_ord() -> AirportScenario:
+    return AirportScenario(
+        airport_code=AirportCode.ORD,
+        name="Chicago O'Hare International Airport",
+        position_nm=(0.0, 0.0),
+        elevation_ft=682,
+        runways=[
+            Runway("28C", 280.0, 13000, 200, ils_equipped=True),
+            Runway("28L", 280.0, 12000, 200, ils_equipped=True),
+            Runway("28R", 280.0, 13000, 200, ils_equipped=True),
+            Runway("10L", 100.0, 11000, 150, ils_equipped=True),
+            Runway("10R", 100.0, 13000, 150, ils_equipped=True),
+            Runway("10C", 100.0, 13000, 150, ils_equipped=True),
+        ],
+        procedures=[
+            Procedure(
+                name="RNAV Approach RWY 28L",
+                procedure_type="approach",
+                runway="28L",
+                fixes=[
+                    NavigationFix("WAUKEE", (20.0, 10.0), "fix", 4000),
+                    NavigationFix("ARLON", (10.0, 5.0), "fix", 2000),
+                    NavigationFix("MIDWAY", (2.0, 1.0), "fix", 1000),
+                ],
+                altitude_restrictions=[4000, 2000, 1000],
+                speed_restrictions=[250, 180, 140],
+                description="Approach to ORD RWY 28"
+            ),
+        ],
+        typical_traffic=(
+            TrafficSpec(
+                aircraft_id="AAL",
+                aircraft_type="A320",
+                count=4,
+                weight="medium",
+            ),
+            TrafficSpec(
+                aircraft_id="UAL",
+                aircraft_type="B737",
+                count=4,
+                weight="medium",
+            ),
+            TrafficSpec(
+                aircraft_id="DAL",
+                aircraft_type="B737",
+                count=3,
+                weight="medium",
+            ),
+            TrafficSpec(
+                aircraft_id="SWR",
+                aircraft_type="B737",
+                count=2,
+                weight="medium",
+            ),
+        ),
+        weather_patterns=(
+            WeatherPattern(
+                name="Severe Thunderstorms",
+                visibility_sm=1,
+                ceiling_ft=500,
+                wind_speed=25,
+                wind_direction=270,
+                description="Summer thunderstorms with strong winds"
+            ),
+            WeatherPattern(
+                name="Lake Effect Snow",
+                visibility_sm=2,
+                ceiling_ft=800,
+                wind_speed=18,
+                wind_direction=320,
+                description="Winter lake effect snow from Lake Michigan"
+            ),
+            WeatherPattern(
+                name="Clear Spring",
+                visibility_sm=10,
+                ceiling_ft=6000,
+                wind_speed=8,
+                wind_direction=180,
+                description="Clear spring conditions"
+            ),
         ),
-    ],
-    typical_traffic=[
-        {
-            "aircraft_id": "AAL",
-            "aircraft_type": "A320",
-            "count": 4,
-            "weight": "medium",
-        },
-        {
-            "aircraft_id": "UAL",
-            "aircraft_type": "B737",
-            "count": 4,
-            "weight": "medium",
-        },
-        {
-            "aircraft_id": "DAL",
-            "aircraft_type": "B737",
-            "count": 3,
-            "weight": "medium",
-        },
-        {
-            "aircraft_id": "SWR",
-            "aircraft_type": "B737",
-            "count": 2,
-            "weight": "medium",
-        },
-    ],
-    weather_patterns=[
-        {
-            "name": "Severe Thunderstorms",
-            "visibility_sm": 1,
-            "ceiling_ft": 500,
-            "wind_speed": 25,
-            "wind_direction": 270,
-            "description": "Summer thunderstorms with strong winds"
-        },
-        {
-            "name": "Lake Effect Snow",
-            "visibility_sm": 2,
-            "ceiling_ft": 800,
-            "wind_speed": 18,
-            "wind_direction": 320,
-            "description": "Winter lake effect snow from Lake Michigan"
-        },
-        {
-            "name": "Clear Spring",
-            "visibility_sm": 10,
-            "ceiling_ft": 6000,
-            "wind_speed": 8,
-            "wind_direction": 180,
-            "description": "Clear spring conditions"
-        },
-    ],
-    challenges=[
-        {
-            "name": "Severe Weather Management",
-            "description": "Handle thunderstorms with go-arounds and sequence changes",
-            "difficulty": "expert",
-            "objectives": [
-                "Issue go-arounds due to weather",
-                "Re-sequence aircraft",
-                "Manage multiple approaches safely",
-            ]
-        },
-        {
-            "name": "Triple Runway Approach",
-            "description": "Manage approaches to three parallel runways simultaneously",
-            "difficulty": "expert",
-            "objectives": [
-                "Sequence 6 aircraft to three runways",
-                "Maintain proper spacing",
-                "Optimize landing rate",
-            ]
-        },
-    ],
-    voice_pack={
-        "station_id": "Chicago Approach",
-        "atc_phrases": {
-            "welcome": "Welcome to Chicago Approach",
-            "descend": "Descend and maintain two thousand",
-            "approach_clearance": "Cleared for approach runway two-eight left",
-            "landing_clearance": "Cleared to land runway two-eight left, wind two-eight-zero at ten knots",
+        challenges=(
+            Challenge(
+                name="Severe Weather Management",
+                description="Handle thunderstorms with go-arounds and sequence changes",
+                difficulty="expert",
+                objectives=(
+                    "Issue go-arounds due to weather",
+                    "Re-sequence aircraft",
+                    "Manage multiple approaches safely",
+                )
+            ),
+            Challenge(
+                name="Triple Runway Approach",
+                description="Manage approaches to three parallel runways simultaneously",
+                difficulty="expert",
+                objectives=(
+                    "Sequence 6 aircraft to three runways",
+                    "Maintain proper spacing",
+                    "Optimize landing rate",
+                )
+            ),
+        ),
+        voice_pack={
+            "station_id": "Chicago Approach",
+            "atc_phrases": {
+                "welcome": "Welcome to Chicago Approach",
+                "descend": "Descend and maintain two thousand",
+                "approach_clearance": "Cleared for approach runway two-eight left",
+                "landing_clearance": "Cleared to land runway two-eight left, wind two-eight-zero at ten knots",
+            }
         }
-    }
-)
+    )
 
 
 # ============================================================================
@@ -596,157 +711,186 @@ ORD_AIRPORT = AirportScenario(
 # Known for: World's busiest airport, high traffic volume
 # ============================================================================
 
-ATL_AIRPORT = AirportScenario(
-    airport_code=AirportCode.ATL,
-    name="Hartsfield-Jackson Atlanta International Airport",
-    position_nm=(0.0, 0.0),
-    elevation_ft=1026,
-    runways=[
-        Runway("27L", 270.0, 13000, 150, ils_equipped=True),
-        Runway("27R", 270.0, 13000, 150, ils_equipped=True),
-        Runway("09L", 90.0, 12000, 150, ils_equipped=True),
-        Runway("09R", 90.0, 12000, 150, ils_equipped=True),
-        Runway("27C", 270.0, 13000, 150, ils_equipped=True),
-        Runway("09C", 90.0, 13000, 150, ils_equipped=True),
-    ],
-    procedures=[
-        Procedure(
-            name="RNAV Approach RWY 27L",
-            procedure_type="approach",
-            runway="27L",
-            fixes=[
-                NavigationFix("DOBBS", (20.0, 12.0), "fix", 4000),
-                NavigationFix("KENUP", (10.0, 6.0), "fix", 2000),
-                NavigationFix("PEACH", (2.0, 1.0), "fix", 1000),
-            ],
-            altitude_restrictions=[4000, 2000, 1000],
-            speed_restrictions=[250, 180, 140],
-            description="Approach to ATL RWY 27"
+@lru_cache(maxsize=None)
+def _build_atl() -> AirportScenario:
+    return AirportScenario(
+        airport_code=AirportCode.ATL,
+        name="Hartsfield-Jackson Atlanta International Airport",
+        position_nm=(0.0, 0.0),
+        elevation_ft=1026,
+        runways=[
+            Runway("27L", 270.0, 13000, 150, ils_equipped=True),
+            Runway("27R", 270.0, 13000, 150, ils_equipped=True),
+            Runway("09L", 90.0, 12000, 150, ils_equipped=True),
+            Runway("09R", 90.0, 12000, 150, ils_equipped=True),
+            Runway("27C", 270.0, 13000, 150, ils_equipped=True),
+            Runway("09C", 90.0, 13000, 150, ils_equipped=True),
+        ],
+        procedures=[
+            Procedure(
+                name="RNAV Approach RWY 27L",
+                procedure_type="approach",
+                runway="27L",
+                fixes=[
+                    NavigationFix("DOBBS", (20.0, 12.0), "fix", 4000),
+                    NavigationFix("KENUP", (10.0, 6.0), "fix", 2000),
+                    NavigationFix("PEACH", (2.0, 1.0), "fix", 1000),
+                ],
+                altitude_restrictions=[4000, 2000, 1000],
+                speed_restrictions=[250, 180, 140],
+                description="Approach to ATL RWY 27"
+            ),
+        ],
+        typical_traffic=(
+            TrafficSpec(
+                aircraft_id="DAL",
+                aircraft_type="A321",
+                count=6,
+                weight="medium",
+            ),
+            TrafficSpec(
+                aircraft_id="AAL",
+                aircraft_type="A320",
+                count=5,
+                weight="medium",
+            ),
+            TrafficSpec(
+                aircraft_id="UAL",
+                aircraft_type="B737",
+                count=4,
+                weight="medium",
+            ),
+            TrafficSpec(
+                aircraft_id="SWR",
+                aircraft_type="B737",
+                count=3,
+                weight="medium",
+            ),
+        ),
+        weather_patterns=(
+            WeatherPattern(
+                name="Summer Heat",
+                visibility_sm=8,
+                ceiling_ft=3000,
+                wind_speed=12,
+                wind_direction=230,
+                description="Hot summer day with afternoon haze"
+            ),
+            WeatherPattern(
+                name="Spring Severe Weather",
+                visibility_sm=3,
+                ceiling_ft=1500,
+                wind_speed=22,
+                wind_direction=190,
+                description="Spring severe weather season"
+            ),
+            WeatherPattern(
+                name="Fall Clear",
+                visibility_sm=10,
+                ceiling_ft=5000,
+                wind_speed=8,
+                wind_direction=270,
+                description="Clear fall conditions"
+            ),
         ),
-    ],
-    typical_traffic=[
-        {
-            "aircraft_id": "DAL",
-            "aircraft_type": "A321",
-            "count": 6,
-            "weight": "medium",
-        },
-        {
-            "aircraft_id": "AAL",
-            "aircraft_type": "A320",
-            "count": 5,
-            "weight": "medium",
-        },
-        {
-            "aircraft_id": "UAL",
-            "aircraft_type": "B737",
-            "count": 4,
-            "weight": "medium",
-        },
-        {
-            "aircraft_id": "SWR",
-            "aircraft_type": "B737",
-            "count": 3,
-            "weight": "medium",
-        },
-    ],
-    weather_patterns=[
-        {
-            "name": "Summer Heat",
-            "visibility_sm": 8,
-            "ceiling_ft": 3000,
-            "wind_speed": 12,
-            "wind_direction": 230,
-            "description": "Hot summer day with afternoon haze"
-        },
-        {
-            "name": "Spring Severe Weather",
-            "visibility_sm": 3,
-            "ceiling_ft": 1500,
-            "wind_speed": 22,
-            "wind_direction": 190,
-            "description": "Spring severe weather season"
-        },
-        {
-            "name": "Fall Clear",
-            "visibility_sm": 10,
-            "ceiling_ft": 5000,
-            "wind_speed": 8,
-            "wind_direction": 270,
-            "description": "Clear fall conditions"
-        },
-    ],
-    challenges=[
-        {
-            "name": "Ultra High Density",
-            "description": "Manage world's busiest airport with 8+ simultaneous aircraft",
-            "difficulty": "expert",
-            "objectives": [
-                "Land 8 aircraft safely in sequence",
-                "Maintain perfect separation",
-                "Maximize landing efficiency (15+ per hour)",
-                "Handle continuous demand",
-            ]
-        },
-        {
-            "name": "Runway Configuration Change",
-            "description": "Change from 27s to 09s during approach sequence",
-            "difficulty": "expert",
-            "objectives": [
-                "Detect runway change need",
-                "Issue go-arounds",
-                "Re-sequence aircraft",
-                "Execute new approaches",
-            ]
-        },
-        {
-            "name": "Severe Weather Avoidance",
-            "description": "Route aircraft around spring thunderstorms",
-            "difficulty": "advanced",
-            "objectives": [
-                "Identify storm cells",
-                "Vector around weather",
-                "Maintain efficient routing",
-                "Ensure all aircraft land safely",
-            ]
-        },
-    ],
-    voice_pack={
-        "station_id": "Atlanta Approach",
-        "atc_phrases": {
-            "welcome": "Welcome to Atlanta Approach",
-            "descend": "Descend and maintain two thousand",
-            "approach_clearance": "Cleared for approach runway two-seven left",
-            "landing_clearance": "Cleared to land runway two-seven left, wind two-seven-zero at eight knots",
+        challenges=(
+            Challenge(
+                name="Ultra High Density",
+                description="Manage world's busiest airport with 8+ simultaneous aircraft",
+                difficulty="expert",
+                objectives=(
+                    "Land 8 aircraft safely in sequence",
+                    "Maintain perfect separation",
+                    "Maximize landing efficiency (15+ per hour)",
+                    "Handle continuous demand",
+                )
+            ),
+            Challenge(
+                name="Runway Configuration Change",
+                description="Change from 27s to 09s during approach sequence",
+                difficulty="expert",
+                objectives=(
+                    "Detect runway change need",
+                    "Issue go-arounds",
+                    "Re-sequence aircraft",
+                    "Execute new approaches",
+                )
+            ),
+            Challenge(
+                name="Severe Weather Avoidance",
+                description="Route aircraft around spring thunderstorms",
+                difficulty="advanced",
+                objectives=(
+                    "Identify storm cells",
+                    "Vector around weather",
+                    "Maintain efficient routing",
+                    "Ensure all aircraft land safely",
+                )
+            ),
+        ),
+        voice_pack={
+            "station_id": "Atlanta Approach",
+            "atc_phrases": {
+                "welcome": "Welcome to Atlanta Approach",
+                "descend": "Descend and maintain two thousand",
+                "approach_clearance": "Cleared for approach runway two-seven left",
+                "landing_clearance": "Cleared to land runway two-seven left, wind two-seven-zero at eight knots",
+            }
         }
-    }
-)
+    )
 
 
-# Dictionary of all major airports
-MAJOR_AIRPORTS = {
-    AirportCode.SFO: SFO_AIRPORT,
-    AirportCode.LAX: LAX_AIRPORT,
-    AirportCode.JFK: JFK_AIRPORT,
-    AirportCode.ORD: ORD_AIRPORT,
-    AirportCode.ATL: ATL_AIRPORT,
+# Scenario builders keyed by code string, so lookups skip Enum construction
+_BUILDERS_BY_CODE = {
+    AirportCode.SFO.value: _build_sfo,
+    AirportCode.LAX.value: _build_lax,
+    AirportCode.JFK.value: _build_jfk,
+    AirportCode.ORD.value: _build_ord,
+    AirportCode.ATL.value: _build_atl,
 }
 
 
+class _LazyScenarioMap(Mapping):
+    """AirportCode -> AirportScenario mapping that builds each scenario on first lookup"""
+
+    def __getitem__(self, code: AirportCode) -> AirportScenario:
+        builder = _BUILDERS_BY_CODE.get(getattr(code, "value", None))
+        if builder is None:
+            raise KeyError(code)
+        return builder()
+
+    def __iter__(self):
+        return (AirportCode(code) for code in _BUILDERS_BY_CODE)
+
+    def __len__(self) -> int:
+        return len(_BUILDERS_BY_CODE)
+
+
+MAJOR_AIRPORTS: Mapping = _LazyScenarioMap()
+
+
+def __getattr__(name: str) -> AirportScenario:
+    """Lazily resolve the legacy SFO_AIRPORT-style module constants"""
+    if name.endswith("_AIRPORT"):
+        builder = _BUILDERS_BY_CODE.get(name[:-len("_AIRPORT")])
+        if builder is not None:
+            return builder()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_airport_scenario(airport_code: str) -> AirportScenario:
     """Get scenario for specified airport"""
-    try:
-        code = AirportCode(airport_code)
-        return MAJOR_AIRPORTS[code]
-    except KeyError:
-        raise ValueError(f"Unknown airport code: {airport_code}")
-    except ValueError:
-        raise ValueError(f"Invalid airport code: {airport_code}. Must be one of: SFO, LAX, JFK, ORD, ATL")
+    builder = _BUILDERS_BY_CODE.get(airport_code)
+    if builder is None:
+        raise ValueError(
+            f"Invalid airport code: {airport_code}. Must be one of: {', '.join(_BUILDERS_BY_CODE)}"
+        )
+    return builder()
 
 
 def list_available_airports() -> List[str]:
     """List all available airport scenarios"""
-    return [airport.value for airport in AirportCode]
+    return list(_AIRPORT_CODE_VALUES)
 
 
 if __name__ == '__main__':
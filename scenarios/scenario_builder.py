@@ -4,15 +4,29 @@ Scenario Builder for AI-ATC
 Builds playable scenarios from airport configurations with difficulty variants.
 """
 
+import copy
 import json
-from typing import Dict, List, Optional
-from dataclasses import asdict
+import math
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, repeat
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 from enum import Enum
+import numpy as np
+
+from jit_support import NUMBA_AVAILABLE, njit
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json writes the same document
+    orjson = None
+
 from scenarios.airport_scenarios import (
     AirportScenario,
+    WeatherPattern,
     get_airport_scenario,
+    list_available_airports,
     MAJOR_AIRPORTS,
-    AirportCode,
 )
 
 
@@ -71,14 +85,102 @@ class ScenarioDifficulty:
     }
 
 
+# Everything a build needs per difficulty, resolved in one lookup:
+# (difficulty params, duration minutes, success criteria, challenge index).
+# Success criteria are read-only; each scenario gets its own copy.
+_DIFFICULTY_TABLE: Dict[DifficultyLevel, Tuple[Dict, int, Mapping, int]] = {
+    DifficultyLevel.BEGINNER: (
+        ScenarioDifficulty.PRESETS[DifficultyLevel.BEGINNER],
+        10,
+        MappingProxyType({
+            "min_score": 60,
+            "max_violations": 5,
+            "min_landings": 1,
+        }),
+        0,
+    ),
+    DifficultyLevel.INTERMEDIATE: (
+        ScenarioDifficulty.PRESETS[DifficultyLevel.INTERMEDIATE],
+        20,
+        MappingProxyType({
+            "min_score": 70,
+            "max_violations": 2,
+            "min_landings": 3,
+        }),
+        0,
+    ),
+    DifficultyLevel.ADVANCED: (
+        ScenarioDifficulty.PRESETS[DifficultyLevel.ADVANCED],
+        30,
+        MappingProxyType({
+            "min_score": 80,
+            "max_violations": 1,
+            "min_landings": 5,
+        }),
+        1,
+    ),
+    DifficultyLevel.EXPERT: (
+        ScenarioDifficulty.PRESETS[DifficultyLevel.EXPERT],
+        45,
+        MappingProxyType({
+            "min_score": 85,
+            "max_violations": 0,
+            "min_landings": 8,
+            "min_landings_per_hour": 15,
+        }),
+        2,
+    ),
+}
+
+# Weather used when an airport defines no weather patterns
+_DEFAULT_WEATHER = MappingProxyType({
+    "visibility_sm": 10,
+    "ceiling_ft": 5000,
+    "wind_speed": 8,
+    "wind_direction": 270,
+})
+
+# Callsign flight numbers ("1000", "1001", ...) formatted once; presets use
+# at most 8 aircraft, larger counts fall back to formatting per scenario
+_FLIGHT_NUMBERS = tuple(str(1000 + i) for i in range(64))
+
+# Objectives shared by every scenario, then extras added by difficulty
+_BASE_OBJECTIVES = (
+    "Land all aircraft safely",
+    "Maintain proper separation (1000 ft vertical / 2 nm horizontal)",
+    "Follow realistic procedures",
+)
+_DIFFICULTY_EXTRA_OBJECTIVES: Dict[DifficultyLevel, Tuple[str, ...]] = {
+    DifficultyLevel.BEGINNER: (),
+    DifficultyLevel.INTERMEDIATE: (),
+    DifficultyLevel.ADVANCED: ("Maximize landing efficiency",),
+    DifficultyLevel.EXPERT: ("Maximize landing efficiency", "Achieve 15+ landings per hour"),
+}
+
+
 class ScenarioBuilder:
     """Builds scenarios from airport data"""
 
-    def __init__(self):
-        self.scenarios = {}
+    def __init__(self, seed: Optional[int] = None):
+        self.scenarios: Dict[str, Dict[str, Dict]] = {}  # Built variants by airport code
+        # Own generator so traffic is reproducible and independent of global random state
+        self._rng = np.random.default_rng(seed)
 
     def build_airport_scenarios(self, airport_code: str) -> Dict[str, Dict]:
-        """Build all difficulty variants for an airport"""
+        """
+        Build all difficulty variants for an airport.
+
+        Variants are built once per builder and cached in self.scenarios;
+        every call returns a deep copy, so callers may mutate the result.
+        """
+        cached = self.scenarios.get(airport_code)
+        if cached is None:
+            cached = self._build_airport_variants(airport_code)
+            self.scenarios[airport_code] = cached
+        return copy.deepcopy(cached)
+
+    def _build_airport_variants(self, airport_code: str) -> Dict[str, Dict]:
+        """Build every difficulty variant for an airport (uncached)"""
         try:
             airport = get_airport_scenario(airport_code)
         except ValueError as e:
@@ -98,7 +200,7 @@ class ScenarioBuilder:
         difficulty: DifficultyLevel
     ) -> Dict:
         """Build a single scenario for specific difficulty"""
-        difficulty_params = ScenarioDifficulty.PRESETS[difficulty]
+        difficulty_params, duration, success_criteria, _ = _DIFFICULTY_TABLE[difficulty]
 
         # Select weather pattern
         weather = self._select_weather(airport, difficulty_params)
@@ -116,35 +218,23 @@ class ScenarioBuilder:
             "airport": airport.airport_code.value,
             "airport_name": airport.name,
             "difficulty": difficulty.value,
-            "duration_minutes": self._calculate_duration(difficulty),
+            "duration_minutes": duration,
             "difficulty_params": difficulty_params,
-            "weather": weather,
+            "weather": dict(_DEFAULT_WEATHER) if weather is None else weather._asdict(),
             "initial_runway": initial_runway,
-            "runways": [asdict(r) for r in airport.runways],
-            "procedures": [
-                {
-                    "name": p.name,
-                    "type": p.procedure_type,
-                    "runway": p.runway,
-                    "description": p.description,
-                }
-                for p in airport.procedures
-            ],
+            # Flat dicts, so a shallow copy keeps each scenario independent
+            "runways": [dict(r) for r in airport.runway_dicts],
+            "procedures": [dict(p) for p in airport.procedure_dicts],
             "traffic": traffic,
             "challenge": challenge,
             "objectives": self._build_objectives(airport, difficulty, challenge),
-            "success_criteria": self._build_success_criteria(difficulty),
+            "success_criteria": dict(success_criteria),
         }
 
-    def _select_weather(self, airport: AirportScenario, params: Dict) -> Dict:
-        """Select appropriate weather based on difficulty"""
+    def _select_weather(self, airport: AirportScenario, params: Dict) -> Optional[WeatherPattern]:
+        """Select appropriate weather based on difficulty (None = _DEFAULT_WEATHER)"""
         if not airport.weather_patterns:
-            return {
-                "visibility_sm": 10,
-                "ceiling_ft": 5000,
-                "wind_speed": 8,
-                "wind_direction": 270,
-            }
+            return None
 
         # Select weather based on severity
         severity_threshold = params["weather_severity"]
@@ -155,20 +245,29 @@ class ScenarioBuilder:
 
         return airport.weather_patterns[pattern_idx]
 
-    def _select_initial_runway(self, airport: AirportScenario, weather: Dict) -> str:
-        """Select best runway based on wind"""
+    def _select_initial_runway(self, airport: AirportScenario, weather: Optional[WeatherPattern]) -> str:
+        """Select best runway based on wind (lowest crosswind, first runway wins ties)"""
         best_runway = None
-        best_score = float('inf')
+        best_score = math.inf
+
+        if weather is None:
+            wind_dir = _DEFAULT_WEATHER["wind_direction"]
+            wind_speed = _DEFAULT_WEATHER["wind_speed"]
+        else:
+            wind_dir = weather.wind_direction
+            wind_speed = weather.wind_speed
 
-        wind_dir = weather.get("wind_direction", 270)
+        if NUMBA_AVAILABLE:
+            best_idx = _min_crosswind_idx(airport.runway_headings, float(wind_dir), float(wind_speed))
+            return airport.runway_ids[best_idx] if best_idx >= 0 else airport.runways[0].runway_id
 
+        # A handful of runways: scalar math beats numpy's per-call dispatch
         for runway in airport.runways:
-            # Calculate crosswind component
             angle_diff = abs(runway.heading_deg - wind_dir)
             if angle_diff > 180:
                 angle_diff = 360 - angle_diff
 
-            crosswind = weather.get("wind_speed", 8) * abs(np.sin(np.radians(angle_diff)))
+            crosswind = wind_speed * abs(math.sin(math.radians(angle_diff)))
 
             # Lower crosswind is better
             if crosswind < best_score:
@@ -179,38 +278,43 @@ class ScenarioBuilder:
 
     def _generate_traffic(self, airport: AirportScenario, params: Dict) -> List[Dict]:
         """Generate traffic for scenario"""
-        import random
-
-        traffic = []
         aircraft_count = int(params["aircraft_count"])
 
         # Get typical traffic for airport
         if not airport.typical_traffic:
             return []
 
-        # Scale traffic based on density
-        airport_traffic = airport.typical_traffic.copy()
-
-        for airline_config in airport_traffic:
-            count = int(airline_config["count"] * params["traffic_density"])
-
-            for i in range(count):
-                if len(traffic) >= aircraft_count:
-                    break
-
-                traffic.append({
-                    "callsign": f"{airline_config['aircraft_id']}{1000 + len(traffic)}",
-                    "aircraft_type": airline_config["aircraft_type"],
-                    "weight": airline_config.get("weight", "medium"),
-                    "spawn_time_minutes": random.uniform(0, 10),
-                    "initial_altitude_ft": random.uniform(4000, 8000),
-                    "destination_runway": None,  # Will be assigned by controller
-                })
-
-            if len(traffic) >= aircraft_count:
-                break
-
-        return traffic
+        # Scale traffic based on density, all airlines at once. typical_traffic
+        # is an immutable tuple, so it is read directly without a copy.
+        scaled_counts = (airport.traffic_counts * params["traffic_density"]).astype(np.int32).tolist()
+
+        # One airline spec per aircraft, in airline order, capped at aircraft_count
+        specs = list(islice(
+            chain.from_iterable(
+                repeat(spec, count) for spec, count in zip(airport.typical_traffic, scaled_counts)
+            ),
+            aircraft_count,
+        ))
+
+        # Draw spawn times and altitudes for all aircraft in two batched calls
+        spawn_times = self._rng.uniform(0, 10, len(specs)).tolist()
+        altitudes = self._rng.uniform(4000, 8000, len(specs)).tolist()
+
+        flight_numbers = _FLIGHT_NUMBERS
+        if len(specs) > len(flight_numbers):
+            flight_numbers = [str(1000 + i) for i in range(len(specs))]
+
+        return [
+            {
+                "callsign": spec.aircraft_id + flight_numbers[i],
+                "aircraft_type": spec.aircraft_type,
+                "weight": spec.weight,
+                "spawn_time_minutes": spawn_time,
+                "initial_altitude_ft": altitude,
+                "destination_runway": None,  # Will be assigned by controller
+            }
+            for i, (spec, spawn_time, altitude) in enumerate(zip(specs, spawn_times, altitudes))
+        ]
 
     def _select_challenge(
         self,
@@ -221,22 +325,17 @@ class ScenarioBuilder:
         if not airport.challenges:
             return {}
 
-        challenge_idx = {
-            DifficultyLevel.BEGINNER: 0,
-            DifficultyLevel.INTERMEDIATE: 0,
-            DifficultyLevel.ADVANCED: 1,
-            DifficultyLevel.EXPERT: 2,
-        }.get(difficulty, 0)
+        challenge_idx = _DIFFICULTY_TABLE[difficulty][3]
 
         if challenge_idx >= len(airport.challenges):
             challenge_idx = len(airport.challenges) - 1
 
         challenge = airport.challenges[challenge_idx]
         return {
-            "name": challenge["name"],
-            "description": challenge["description"],
-            "difficulty": challenge.get("difficulty", difficulty.value),
-            "objectives": challenge.get("objectives", []),
+            "name": challenge.name,
+            "description": challenge.description,
+            "difficulty": challenge.difficulty or difficulty.value,
+            "objectives": list(challenge.objectives),
         }
 
     def _build_objectives(
@@ -246,63 +345,27 @@ class ScenarioBuilder:
         challenge: Dict
     ) -> List[str]:
         """Build scenario objectives"""
-        objectives = [
-            "Land all aircraft safely",
-            "Maintain proper separation (1000 ft vertical / 2 nm horizontal)",
-            "Follow realistic procedures",
+        return [
+            *_BASE_OBJECTIVES,
+            *(challenge.get("objectives", ()) if challenge else ()),
+            *_DIFFICULTY_EXTRA_OBJECTIVES[difficulty],
         ]
 
-        if challenge:
-            objectives.extend(challenge.get("objectives", []))
+    def build_all_scenarios(self, max_workers: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Build all scenarios for all major airports.
 
-        if difficulty in [DifficultyLevel.ADVANCED, DifficultyLevel.EXPERT]:
-            objectives.append("Maximize landing efficiency")
+        Runs serially by default: the bundled airports build in well under a
+        millisecond, far less than process pool startup. Pass max_workers > 1
+        to fan airports out to worker processes when per-airport work is
+        heavy; each worker gets its own seed drawn from this builder's RNG.
+        """
+        if max_workers is not None and max_workers > 1:
+            return self._build_all_scenarios_parallel(max_workers)
 
-        if difficulty == DifficultyLevel.EXPERT:
-            objectives.append("Achieve 15+ landings per hour")
-
-        return objectives
-
-    def _build_success_criteria(self, difficulty: DifficultyLevel) -> Dict:
-        """Build success criteria based on difficulty"""
-        return {
-            DifficultyLevel.BEGINNER: {
-                "min_score": 60,
-                "max_violations": 5,
-                "min_landings": 1,
-            },
-            DifficultyLevel.INTERMEDIATE: {
-                "min_score": 70,
-                "max_violations": 2,
-                "min_landings": 3,
-            },
-            DifficultyLevel.ADVANCED: {
-                "min_score": 80,
-                "max_violations": 1,
-                "min_landings": 5,
-            },
-            DifficultyLevel.EXPERT: {
-                "min_score": 85,
-                "max_violations": 0,
-                "min_landings": 8,
-                "min_landings_per_hour": 15,
-            },
-        }.get(difficulty, {})
-
-    def _calculate_duration(self, difficulty: DifficultyLevel) -> int:
-        """Calculate scenario duration in minutes"""
-        return {
-            DifficultyLevel.BEGINNER: 10,
-            DifficultyLevel.INTERMEDIATE: 20,
-            DifficultyLevel.ADVANCED: 30,
-            DifficultyLevel.EXPERT: 45,
-        }.get(difficulty, 20)
-
-    def build_all_scenarios(self) -> Dict[str, Dict]:
-        """Build all scenarios for all major airports"""
         all_scenarios = {}
 
-        for airport_code in [a.value for a in AirportCode]:
+        for airport_code in list_available_airports():
             try:
                 scenarios = self.build_airport_scenarios(airport_code)
                 all_scenarios[airport_code] = scenarios
@@ -311,20 +374,112 @@ class ScenarioBuilder:
 
         return all_scenarios
 
-    def save_scenarios(self, scenarios: Dict, filepath: str = "scenarios/generated_scenarios.json") -> bool:
-        """Save scenarios to JSON file"""
+    def iter_all_scenarios(self) -> Iterator[Tuple[str, Dict[str, Dict]]]:
+        """
+        Yield (airport_code, variants) for all major airports, one at a time.
+
+        Airports not already cached are built without being stored, so a
+        streaming consumer such as save_scenarios holds one airport at a time;
+        cached airports are yielded as deep copies.
+        """
+        for airport_code in list_available_airports():
+            try:
+                scenarios = self.scenarios.get(airport_code)
+                if scenarios is None:
+                    scenarios = self._build_airport_variants(airport_code)
+                else:
+                    scenarios = copy.deepcopy(scenarios)
+            except Exception as e:
+                print(f"Error building scenarios for {airport_code}: {e}")
+                continue
+            yield airport_code, scenarios
+
+    def _build_all_scenarios_parallel(self, max_workers: int) -> Dict[str, Dict]:
+        """Build each airport in a worker process and merge into self.scenarios"""
+        all_scenarios = {}
+        airport_codes = list_available_airports()
+        seeds = self._rng.integers(0, 2**63, size=len(airport_codes)).tolist()
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                code: executor.submit(_build_airport_worker, code, seed)
+                for code, seed in zip(airport_codes, seeds)
+                if code not in self.scenarios
+            }
+            for airport_code in airport_codes:
+                try:
+                    if airport_code in futures:
+                        self.scenarios[airport_code] = futures[airport_code].result()
+                    all_scenarios[airport_code] = copy.deepcopy(self.scenarios[airport_code])
+                except Exception as e:
+                    print(f"Error building scenarios for {airport_code}: {e}")
+
+        return all_scenarios
+
+    def save_scenarios(
+        self,
+        scenarios: Union[Dict[str, Dict], Iterable[Tuple[str, Dict]]],
+        filepath: str = "scenarios/generated_scenarios.json",
+    ) -> bool:
+        """
+        Save scenarios to JSON file.
+
+        Accepts the dict from build_all_scenarios or (airport_code, variants)
+        pairs such as iter_all_scenarios(); airports are encoded and written
+        one at a time (with orjson when installed), so a generator source is
+        never held in memory as a whole.
+        """
+        items = scenarios.items() if isinstance(scenarios, Mapping) else scenarios
         try:
-            with open(filepath, 'w') as f:
-                json.dump(scenarios, f, indent=2, default=str)
-            print(f"Saved {len(scenarios)} airports to {filepath}")
+            count = 0
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write("{")
+                for airport_code, variants in items:
+                    # Same layout as a single indent=2 dump of the whole dict
+                    f.write(",\n  " if count else "\n  ")
+                    f.write(json.dumps(airport_code))
+                    f.write(": ")
+                    f.write(_encode_json(variants).replace("\n", "\n  "))
+                    count += 1
+                f.write("\n}" if count else "}")
+            print(f"Saved {count} airports to {filepath}")
             return True
         except Exception as e:
             print(f"Error saving scenarios: {e}")
             return False
 
 
-# For numpy compatibility
-import numpy as np
+@njit(cache=True)
+def _min_crosswind_idx(headings: np.ndarray, wind_dir: float, wind_speed: float) -> int:
+    """Index of the lowest-crosswind heading (first wins ties), -1 if none; Numba-compiled."""
+    best_idx = -1
+    best_crosswind = np.inf
+    for i in range(headings.shape[0]):
+        angle_diff = abs(headings[i] - wind_dir)
+        if angle_diff > 180.0:
+            angle_diff = 360.0 - angle_diff
+
+        crosswind = wind_speed * abs(np.sin(np.radians(angle_diff)))
+        if crosswind < best_crosswind:
+            best_crosswind = crosswind
+            best_idx = i
+    return best_idx
+
+
+def _encode_json(value) -> str:
+    """Encode value as indent=2 JSON, with orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(value, indent=2, default=str)
+
+
+def _build_airport_worker(airport_code: str, seed: int) -> Dict[str, Dict]:
+    """Process pool entry point for ScenarioBuilder.build_all_scenarios"""
+    return ScenarioBuilder(seed=seed).build_airport_scenarios(airport_code)
 
 
 def generate_all_scenarios() -> Dict[str, Dict]:
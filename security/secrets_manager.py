@@ -12,26 +12,108 @@ Usage:
 """
 
 import os
+import atexit
+import functools
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
-from cryptography.fernet import Fernet
+import math
+import queue
+import secrets
+import signal
+import string
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
 import hashlib
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json reads and writes the same documents
+    orjson = None
+
+try:
+    import blake3
+except ImportError:  # blake3 is optional; archive hashes fall back to SHA-256
+    blake3 = None
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
 logger = logging.getLogger(__name__)
 
+# Hash recorded for rotated-out values in archive.log (named per entry as hash_alg)
+if blake3 is not None:
+    _ARCHIVE_HASH_ALG, _archive_hash = 'blake3', blake3.blake3
+else:
+    _ARCHIVE_HASH_ALG, _archive_hash = 'sha256', hashlib.sha256
+
+_PASSWORD_ALPHABET = string.ascii_letters + string.digits + string.punctuation
+
+_fernet_cls = None
+
+
+def _get_fernet() -> "type[Fernet]":
+    """Import cryptography's Fernet on first use; importers that never build a SecretsManager skip its load time"""
+    global _fernet_cls
+    if _fernet_cls is None:
+        from cryptography.fernet import Fernet
+        _fernet_cls = Fernet
+    return _fernet_cls
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Encode value as compact JSON bytes, with orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_durably(path: str, data: bytes, flags: int) -> None:
+    """Write data with raw os.write calls (no buffered file object) and fsync once"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | flags, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
 
 class SecretsManager:
     """Manage application secrets securely"""
 
+    # How long the writer thread waits after a mutation to gather more before one fsync
+    WRITE_COALESCE_SECONDS = 0.005
+
+    # Baseline file layout: {"v": 1, "payload": <Fernet token of all secrets as JSON>}
+    FILE_FORMAT_VERSION = 1
+
+    # Rotated-out secret hashes go to one append-only log, rolled over past this size
+    ARCHIVE_DIR = Path('.secrets/archive')
+    ARCHIVE_MAX_BYTES = 10 * 1024 * 1024
+
     def __init__(self, secrets_file: Optional[str] = None, key_file: Optional[str] = None):
         """Initialize secrets manager"""
         self.secrets_file = secrets_file or os.getenv('SECRETS_FILE', '.secrets/secrets.json')
         self.key_file = key_file or os.getenv('SECRETS_KEY_FILE', '.secrets/key')
         self.rotation_days = int(os.getenv('SECRETS_ROTATION_DAYS', 90))
 
+        # Mutations are appended here and folded into secrets_file by _compact()
+        self.wal_file = str(Path(self.secrets_file).with_suffix('.wal'))
+        self._pending_wal: Optional[List[Tuple[str, str, Any]]] = None  # Set while batching
+        self._archive_fd: Optional[int] = None  # Opened on first archive
+        self._pending_archive: List[Tuple[str, str]] = []  # (name, old value) held while batching
+
         # Create secrets directory
         Path(self.secrets_file).parent.mkdir(parents=True, exist_ok=True)
 
@@ -41,58 +123,101 @@ class SecretsManager:
         # Load secrets
         self.secrets = self._load_secrets()
 
-    def _load_or_create_key(self) -> Fernet:
+        # Resolved values: name -> (value, monotonic expiry time)
+        self._cache: Dict[str, Tuple[Any, float]] = {}
+
+        # Persistence runs on one background thread so mutating calls never wait on disk;
+        # None on the queue stops it. close() (or interpreter exit) drains and joins it.
+        self._write_queue: "queue.Queue[Optional[List[Tuple[str, str, Any]]]]" = queue.Queue()
+        self._write_error: Optional[Exception] = None  # Last writer failure, raised by flush()
+        self._writer: Optional[threading.Thread] = threading.Thread(
+            target=self._writer_loop, name='secrets-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _load_or_create_key(self) -> "Fernet":
         """Load encryption key or create if doesn't exist"""
         if os.path.exists(self.key_file):
             with open(self.key_file, 'rb') as f:
                 key = f.read()
         else:
-            key = Fernet.generate_key()
+            key = _get_fernet().generate_key()
             Path(self.key_file).parent.mkdir(parents=True, exist_ok=True)
             with open(self.key_file, 'wb') as f:
                 f.write(key)
             os.chmod(self.key_file, 0o600)
             logger.info(f"Created new encryption key: {self.key_file}")
 
-        return Fernet(key)
+        return _get_fernet()(key)
 
     def _load_secrets(self) -> Dict[str, Any]:
-        """Load encrypted secrets from file"""
-        if not os.path.exists(self.secrets_file):
-            return {}
-
-        try:
-            with open(self.secrets_file, 'r') as f:
-                data = json.load(f)
-
-            # Decrypt secrets
-            decrypted = {}
-            for key, encrypted_value in data.items():
+        """Load encrypted secrets from the baseline file, then replay the WAL"""
+        decrypted = {}
+
+        if os.path.exists(self.secrets_file):
+            try:
+                with open(self.secrets_file, 'rb') as f:
+                    data = _json_loads(f.read())
+
+                if data.get('v') == self.FILE_FORMAT_VERSION:
+                    decrypted = self._decrypt_value(data['payload'])
+                else:
+                    # Legacy layout: one Fernet token per secret
+                    for key, encrypted_value in data.items():
+                        try:
+                            decrypted[key] = self._decrypt_value(encrypted_value)
+                        except Exception as e:
+                            logger.error(f"Failed to decrypt secret {key}: {e}")
+            except Exception as e:
+                logger.error(f"Failed to load secrets: {e}")
+                return {}
+
+        self._replay_wal(decrypted)
+        return decrypted
+
+    def _replay_wal(self, secrets: Dict[str, Any]) -> None:
+        """Apply logged set/delete records on top of the baseline secrets"""
+        if not os.path.exists(self.wal_file):
+            return
+
+        with open(self.wal_file, 'r+') as f:
+            lines = f.read().split('\n')
+            if lines[-1]:
+                # Drop a torn final line left by a crash mid-append so later appends start clean
+                logger.error("Discarding incomplete trailing WAL record")
+                f.truncate(f.tell() - len(lines[-1].encode()))
+
+            # Each line is one encrypted batch of [op, name, value] mutations
+            for line_no, line in enumerate(lines[:-1], 1):
                 try:
-                    decrypted_value = self.cipher.decrypt(encrypted_value.encode()).decode()
-                    decrypted[key] = json.loads(decrypted_value)
+                    for op, name, value in self._decrypt_value(line):
+                        if op == 'set':
+                            secrets[name] = value
+                        elif op == 'delete':
+                            secrets.pop(name, None)
                 except Exception as e:
-                    logger.error(f"Failed to decrypt secret {key}: {e}")
+                    logger.error(f"Skipping unreadable WAL record {line_no}: {e}")
 
-            return decrypted
-        except Exception as e:
-            logger.error(f"Failed to load secrets: {e}")
-            return {}
+    def _encrypt_value(self, value: Any) -> str:
+        return self.cipher.encrypt(_json_dumps(value)).decode()
+
+    def _decrypt_value(self, encrypted_value: str) -> Any:
+        return _json_loads(self.cipher.decrypt(encrypted_value.encode()))
 
     def _save_secrets(self) -> bool:
-        """Save encrypted secrets to file"""
+        """Save all encrypted secrets to the baseline file (atomic replace)"""
         try:
-            # Encrypt secrets
-            encrypted = {}
-            for key, value in self.secrets.items():
-                value_json = json.dumps(value)
-                encrypted_value = self.cipher.encrypt(value_json.encode()).decode()
-                encrypted[key] = encrypted_value
-
-            # Write to file
+            # Encrypt all secrets as one blob (dict() snapshots atomically while callers keep mutating)
+            encrypted = {
+                'v': self.FILE_FORMAT_VERSION,
+                'payload': self._encrypt_value(dict(self.secrets)),
+            }
+
+            # Write to a temp file, then swap it in so readers never see a partial file
             Path(self.secrets_file).parent.mkdir(parents=True, exist_ok=True)
-            with open(self.secrets_file, 'w') as f:
-                json.dump(encrypted, f)
+            tmp_file = f"{self.secrets_file}.tmp"
+            _write_durably(tmp_file, _json_dumps(encrypted), os.O_TRUNC)
+            os.replace(tmp_file, self.secrets_file)
 
             os.chmod(self.secrets_file, 0o600)
             logger.info(f"Saved secrets to {self.secrets_file}")
@@ -101,8 +226,131 @@ class SecretsManager:
             logger.error(f"Failed to save secrets: {e}")
             return False
 
+    def _log_mutation(self, op: str, name: str) -> bool:
+        """Hand one set/delete to the writer thread (or hold it while batching)"""
+        mutation = (op, name, self.secrets[name] if op == 'set' else None)
+
+        if self._pending_wal is not None:
+            self._pending_wal.append(mutation)
+        else:
+            self._enqueue_write([mutation])
+        return True
+
+    def _enqueue_write(self, mutations: List[Tuple[str, str, Any]]) -> None:
+        """Hand a batch of mutations to the writer thread"""
+        if self._writer is None:
+            raise ValueError("SecretsManager is closed")
+        self._write_queue.put(mutations)
+
+    def _writer_loop(self) -> None:
+        """Drain queued mutations, coalescing bursts into a single WAL append, until None is queued"""
+        stopping = False
+        while not stopping:
+            batches = [self._write_queue.get()]
+            if batches[0] is not None:
+                time.sleep(self.WRITE_COALESCE_SECONDS)
+                while True:
+                    try:
+                        batches.append(self._write_queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+            stopping = None in batches
+            try:
+                mutations = [mutation for batch in batches if batch is not None for mutation in batch]
+                if not self._append_wal(mutations):
+                    raise OSError(f"Failed to persist secrets to {self.wal_file}")
+            except Exception as e:
+                logger.error(f"Secrets writer failed: {e}")
+                self._write_error = e
+            finally:
+                for _ in batches:
+                    self._write_queue.task_done()
+
+    def flush(self) -> None:
+        """
+        Block until every queued mutation has been written to disk.
+
+        Raises the last error the writer hit since the previous flush(); the
+        affected mutations stay in memory but may not be on disk.
+        """
+        self._write_queue.join()
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """
+        Write queued mutations, stop the writer thread and close archive.log.
+
+        Raises like flush() if a write failed. Mutating the manager afterwards
+        raises ValueError; reads keep working. Safe to call more than once.
+        """
+        if self._writer is None:
+            return
+        atexit.unregister(self.close)
+        self._write_queue.put(None)  # Queued after every pending batch
+        self._writer.join()
+        self._writer = None
+        if self._archive_fd is not None:
+            os.close(self._archive_fd)
+            self._archive_fd = None
+        self.flush()
+
+    def __enter__(self) -> "SecretsManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _append_wal(self, mutations: List[Tuple[str, str, Any]]) -> bool:
+        """Append mutations to the WAL as one encrypted line with a single fsync, compacting when it outgrows the baseline"""
+        if not mutations:
+            return True
+
+        try:
+            Path(self.wal_file).parent.mkdir(parents=True, exist_ok=True)
+            _write_durably(self.wal_file, self.cipher.encrypt(_json_dumps(mutations)) + b'\n', os.O_APPEND)
+        except Exception as e:
+            logger.error(f"Failed to append to secrets WAL: {e}")
+            return False
+
+        baseline_size = os.path.getsize(self.secrets_file) if os.path.exists(self.secrets_file) else 0
+        if os.path.getsize(self.wal_file) > baseline_size:
+            return self._compact()
+        return True
+
+    def _compact(self) -> bool:
+        """Fold the WAL into the baseline file and truncate it"""
+        if not self._save_secrets():
+            return False
+        try:
+            os.remove(self.wal_file)
+        except FileNotFoundError:
+            pass
+        return True
+
+    @contextmanager
+    def _batched_writes(self) -> Iterator[None]:
+        """Hold mutations inside the block and hand them to the writer as one batch"""
+        if self._pending_wal is not None:
+            yield  # Already batching; the outer block flushes
+            return
+
+        self._pending_wal = []
+        try:
+            yield
+        finally:
+            mutations, self._pending_wal = self._pending_wal, None
+            if mutations:
+                self._enqueue_write(mutations)
+
     def get_secret(self, name: str, default: Any = None) -> Any:
-        """Get secret value"""
+        """Get secret value (cached until the secret expires or changes)"""
+        cached = self._cache.get(name)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
         if name not in self.secrets:
             logger.warning(f"Secret not found: {name}")
             return default
@@ -110,44 +358,63 @@ class SecretsManager:
         secret_data = self.secrets[name]
 
         # Check if secret has expired
+        expiry_mono = math.inf
         if 'expires_at' in secret_data:
             expiry = datetime.fromisoformat(secret_data['expires_at'])
-            if datetime.utcnow() > expiry:
+            remaining = (expiry - datetime.utcnow()).total_seconds()
+            if remaining < 0:
                 logger.warning(f"Secret has expired: {name}")
                 return None
+            expiry_mono = time.monotonic() + remaining
+
+        value = secret_data.get('value')
+        self._cache[name] = (value, expiry_mono)
+        return value
+
+    def invalidate(self, name: str) -> None:
+        """Drop a secret's cached value"""
+        self._cache.pop(name, None)
 
-        return secret_data.get('value')
+    def clear_cache(self) -> None:
+        """Drop all cached secret values"""
+        self._cache.clear()
 
     def set_secret(self, name: str, value: str, ttl_days: int = 90) -> bool:
-        """Set or update secret"""
-        expires_at = (datetime.utcnow() + timedelta(days=ttl_days)).isoformat()
+        """Set or update secret (written to disk in the background; flush() waits for it)"""
+        now_epoch = time.time()
+        now = datetime.fromtimestamp(now_epoch, timezone.utc).replace(tzinfo=None)
+        expires_at = (now + timedelta(days=ttl_days)).isoformat()
 
+        self.invalidate(name)
         self.secrets[name] = {
             'value': value,
-            'created_at': datetime.utcnow().isoformat(),
+            'created_at': now.isoformat(),
+            'created_at_epoch': now_epoch,
             'expires_at': expires_at,
             'rotation_due': False,
         }
 
         logger.info(f"Set secret: {name} (expires in {ttl_days} days)")
-        return self._save_secrets()
+        return self._log_mutation('set', name)
 
     def delete_secret(self, name: str) -> bool:
-        """Delete secret"""
+        """Delete secret (written to disk in the background; flush() waits for it)"""
         if name in self.secrets:
             del self.secrets[name]
+            self.invalidate(name)
             logger.info(f"Deleted secret: {name}")
-            return self._save_secrets()
+            return self._log_mutation('delete', name)
         return False
 
     def list_secrets(self, include_values: bool = False) -> Dict[str, Any]:
         """List all secrets (metadata only by default)"""
         result = {}
+        threshold = time.time() - self.rotation_days * 86400
         for name, data in self.secrets.items():
             result[name] = {
                 'created_at': data.get('created_at'),
                 'expires_at': data.get('expires_at'),
-                'rotation_due': self._is_rotation_due(name),
+                'rotation_due': self._created_at_epoch(data) <= threshold,
             }
             if include_values:
                 result[name]['value'] = data.get('value')
@@ -159,10 +426,16 @@ class SecretsManager:
         if not secret_data:
             return False
 
-        created_at = datetime.fromisoformat(secret_data['created_at'])
-        days_since_creation = (datetime.utcnow() - created_at).days
+        return time.time() - self._created_at_epoch(secret_data) >= self.rotation_days * 86400
 
-        return days_since_creation >= self.rotation_days
+    @staticmethod
+    def _created_at_epoch(secret_data: Dict[str, Any]) -> float:
+        """Creation time as a Unix timestamp, parsed once for secrets saved before it was stored"""
+        epoch = secret_data.get('created_at_epoch')
+        if epoch is None:
+            created_at = datetime.fromisoformat(secret_data['created_at'])
+            epoch = secret_data['created_at_epoch'] = created_at.replace(tzinfo=timezone.utc).timestamp()
+        return epoch
 
     def rotate_secret(self, name: str) -> bool:
         """Rotate (regenerate) a secret"""
@@ -193,7 +466,7 @@ class SecretsManager:
         if 'password' in name.lower():
             return self._generate_password(16)
         elif 'key' in name.lower():
-            return Fernet.generate_key().decode()
+            return _get_fernet().generate_key().decode()
         elif 'token' in name.lower():
             return self._generate_token(32)
         else:
@@ -202,53 +475,92 @@ class SecretsManager:
 
     def _generate_password(self, length: int = 16) -> str:
         """Generate secure random password"""
-        import secrets
-        import string
-
-        alphabet = string.ascii_letters + string.digits + string.punctuation
-        return ''.join(secrets.choice(alphabet) for _ in range(length))
+        alphabet = _PASSWORD_ALPHABET
+        # Draw random bytes in bulk rather than one urandom call per character.
+        # Bytes at or above the largest multiple of len(alphabet) are rejected
+        # so the modulo below stays unbiased.
+        limit = 256 - 256 % len(alphabet)
+        chars = []
+        while len(chars) < length:
+            chars.extend(alphabet[b % len(alphabet)] for b in os.urandom(length * 2) if b < limit)
+        return ''.join(chars[:length])
 
     def _generate_token(self, length: int = 32) -> str:
         """Generate secure random token"""
-        import secrets
         return secrets.token_hex(length // 2)
 
     def _archive_secret(self, name: str, value: str) -> bool:
-        """Archive old secret for audit purposes"""
-        archive_dir = Path('.secrets/archive')
-        archive_dir.mkdir(parents=True, exist_ok=True)
+        """Archive old secret for audit purposes (one JSON line in archive.log)"""
+        # Batched rotations are hashed and written together by flush_archive()
+        if self._pending_wal is not None:
+            self._pending_archive.append((name, value))
+            return True
+        if not self._archive_secrets([(name, value)]):
+            return False
+        self.flush_archive()
+        return True
 
-        archive_file = archive_dir / f"{name}_{datetime.utcnow().timestamp()}.json"
+    def _archive_secrets(self, names_values: List[Tuple[str, str]]) -> bool:
+        """Hash and append many archive entries with a single write"""
+        if not names_values:
+            return True
 
-        archive_data = {
-            'name': name,
-            'value_hash': hashlib.sha256(value.encode()).hexdigest(),
-            'archived_at': datetime.utcnow().isoformat(),
-        }
+        archived_at = datetime.utcnow().isoformat()
+        lines = b''.join(
+            _json_dumps({
+                'name': name,
+                'value_hash': _archive_hash(value.encode()).hexdigest(),
+                'hash_alg': _ARCHIVE_HASH_ALG,
+                'archived_at': archived_at,
+            }) + b'\n'
+            for name, value in names_values
+        )
 
         try:
-            with open(archive_file, 'w') as f:
-                json.dump(archive_data, f)
-            os.chmod(archive_file, 0o600)
-            logger.info(f"Archived secret: {name}")
+            if self._archive_fd is None:
+                self._open_archive()
+            os.write(self._archive_fd, lines)
+            logger.info(f"Archived {len(names_values)} secret(s)")
             return True
         except Exception as e:
             logger.error(f"Failed to archive secret: {e}")
             return False
 
+    def _open_archive(self) -> None:
+        """Open archive.log for appending, rolling it over first if it is too large"""
+        self.ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+        archive_file = self.ARCHIVE_DIR / 'archive.log'
+        if archive_file.exists() and archive_file.stat().st_size > self.ARCHIVE_MAX_BYTES:
+            archive_file.rename(archive_file.with_name(f"archive.log.{datetime.utcnow().timestamp()}"))
+        self._archive_fd = os.open(archive_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+
+    def flush_archive(self) -> None:
+        """Write any batched archive entries, fsync archive.log, and close it once past the rollover size"""
+        if self._pending_archive:
+            pending, self._pending_archive = self._pending_archive, []
+            self._archive_secrets(pending)
+        if self._archive_fd is None:
+            return
+        os.fsync(self._archive_fd)
+        if os.fstat(self._archive_fd).st_size > self.ARCHIVE_MAX_BYTES:
+            os.close(self._archive_fd)
+            self._archive_fd = None  # Next archive rolls the file over
+
     def check_rotations_due(self) -> Dict[str, bool]:
         """Check which secrets need rotation"""
-        result = {}
-        for name in self.secrets:
-            result[name] = self._is_rotation_due(name)
-        return result
+        threshold = time.time() - self.rotation_days * 86400
+        return {name: self._created_at_epoch(data) <= threshold for name, data in self.secrets.items()}
 
     def rotate_all_due(self) -> Dict[str, bool]:
-        """Rotate all secrets that are due for rotation"""
+        """Rotate all secrets that are due for rotation (persisted with one WAL write)"""
         results = {}
-        for name, is_due in self.check_rotations_due().items():
-            if is_due:
-                results[name] = self.rotate_secret(name)
+        threshold = time.time() - self.rotation_days * 86400
+        with self._batched_writes():
+            # Rotation replaces values in place, so iterating the live dict is safe
+            for name, data in self.secrets.items():
+                if self._created_at_epoch(data) <= threshold:
+                    results[name] = self.rotate_secret(name)
+        self.flush_archive()
         return results
 
     def export_for_deployment(self, env_file: str = '.env') -> bool:
@@ -282,7 +594,24 @@ class EnvironmentSecrets:
 
     @staticmethod
     def load_and_validate() -> Dict[str, str]:
-        """Load all required secrets from environment"""
+        """Load all required secrets from environment (validated once per process until reload())"""
+        return dict(EnvironmentSecrets._load_cached())
+
+    @staticmethod
+    def reload() -> None:
+        """Forget the cached environment secrets so the next load re-reads them"""
+        EnvironmentSecrets._load_cached.cache_clear()
+
+    @staticmethod
+    def reload_on_sighup() -> None:
+        """Install a SIGHUP handler that calls reload() (call from the main thread)"""
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, lambda signum, frame: EnvironmentSecrets.reload())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_cached() -> Dict[str, str]:
+        # Failures raise, and lru_cache does not cache exceptions, so a fixed environment is retried
         secrets = {}
 
         for name in EnvironmentSecrets.REQUIRED_SECRETS:
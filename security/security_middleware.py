@@ -11,11 +11,23 @@ Usage:
 """
 
 from flask import request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from functools import wraps
+import io
 import logging
 import re
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; Flask's stdlib provider is used without it
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; bodies are parsed fully, then validated
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,28 +73,73 @@ class SecurityHeaders:
     )
 
 
+# Static response headers, built once; applied by SecurityHeadersMiddleware.
+# PEP 3333 requires header values to be str (the server encodes them as
+# latin-1), so they cannot be pre-encoded to bytes here. Keep them ASCII so
+# that encode stays a plain copy.
+SECURITY_HEADER_ITEMS = (
+    ('Strict-Transport-Security', SecurityHeaders.HSTS),
+    ('Content-Security-Policy', SecurityHeaders.CSP),
+    ('X-Frame-Options', SecurityHeaders.X_FRAME_OPTIONS),
+    ('X-Content-Type-Options', SecurityHeaders.X_CONTENT_TYPE_OPTIONS),
+    ('X-XSS-Protection', SecurityHeaders.X_XSS_PROTECTION),
+    ('Referrer-Policy', SecurityHeaders.REFERRER_POLICY),
+    ('Permissions-Policy', SecurityHeaders.PERMISSIONS_POLICY),
+)
+_REPLACED_HEADERS = frozenset(name.lower() for name, _ in SECURITY_HEADER_ITEMS) | {'server'}
+
+
+class SecurityHeadersMiddleware:
+    """WSGI middleware adding the security headers to every response
+
+    Works on the raw header list in start_response, so the static set is
+    appended in one step instead of assigned through Flask's Headers object.
+    Existing copies of those headers and any Server header are dropped.
+    """
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        def secure_start_response(status, headers, exc_info=None):
+            headers = [item for item in headers if item[0].lower() not in _REPLACED_HEADERS]
+            headers.extend(SECURITY_HEADER_ITEMS)
+            return start_response(status, headers, exc_info)
+
+        return self.wsgi_app(environ, secure_start_response)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson
+
+    Dates and dataclasses are passed through to Flask's `default` so responses
+    serialize exactly as with the stdlib provider.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 def setup_security(app, config=None):
     """Setup security for Flask application"""
 
     if config is None:
         config = {}
 
-    # Apply security headers
-    @app.after_request
-    def apply_security_headers(response):
-        """Add security headers to all responses"""
-        response.headers['Strict-Transport-Security'] = SecurityHeaders.HSTS
-        response.headers['Content-Security-Policy'] = SecurityHeaders.CSP
-        response.headers['X-Frame-Options'] = SecurityHeaders.X_FRAME_OPTIONS
-        response.headers['X-Content-Type-Options'] = SecurityHeaders.X_CONTENT_TYPE_OPTIONS
-        response.headers['X-XSS-Protection'] = SecurityHeaders.X_XSS_PROTECTION
-        response.headers['Referrer-Policy'] = SecurityHeaders.REFERRER_POLICY
-        response.headers['Permissions-Policy'] = SecurityHeaders.PERMISSIONS_POLICY
+    # Parse and emit request/response JSON with orjson when installed
+    if orjson is not None:
+        app.json = ORJSONProvider(app)
 
-        # Remove server header
-        response.headers.pop('Server', None)
-
-        return response
+    # Apply security headers (and strip Server) on every response
+    app.wsgi_app = SecurityHeadersMiddleware(app.wsgi_app)
 
     # Setup CORS
     setup_cors(app, config)
@@ -161,35 +218,92 @@ def setup_input_validation(app):
 
             # Validate request data
             if request.is_json:
-                data = request.get_json()
-                if not is_valid_json_structure(data):
+                valid = None
+                if ijson is not None:
+                    # Walk tokens of the cached raw body; rejected payloads never get an object tree
+                    valid = is_valid_json_stream(request.get_data(cache=True))
+                if valid is None:
+                    valid = is_valid_json_structure(request.get_json())
+                if not valid:
                     return jsonify({'error': 'Invalid JSON structure'}), 400
 
 
+_JSON_SCALAR_TYPES = frozenset((int, float, bool, type(None)))
+
+
 def is_valid_json_structure(data, max_depth=10):
     """Validate JSON structure for security"""
-    if max_depth <= 0:
-        return False
-
-    if isinstance(data, dict):
-        if len(data) > 100:  # Max 100 keys
-            return False
-        return all(
-            isinstance(k, str) and
-            len(k) < 256 and
-            is_valid_json_structure(v, max_depth - 1)
-            for k, v in data.items()
-        )
-
-    if isinstance(data, list):
-        if len(data) > 1000:  # Max 1000 items
+    # Iterative walk: no Python frame per node, and exits on the first violation.
+    # Parsed JSON only contains exact builtin types, so type() checks suffice.
+    stack = [(data, max_depth)]
+    while stack:
+        node, depth = stack.pop()
+        if depth <= 0:
             return False
-        return all(is_valid_json_structure(item, max_depth - 1) for item in data)
 
-    if isinstance(data, str):
-        return len(data) < 10000  # Max 10k chars
+        node_type = type(node)
+        if node_type is dict:
+            if len(node) > 100:  # Max 100 keys
+                return False
+            for k, v in node.items():
+                if type(k) is not str or len(k) >= 256:
+                    return False
+                stack.append((v, depth - 1))
+        elif node_type is list:
+            if len(node) > 1000:  # Max 1000 items
+                return False
+            stack.extend((item, depth - 1) for item in node)
+        elif node_type is str:
+            if len(node) >= 10000:  # Max 10k chars
+                return False
+        elif node_type not in _JSON_SCALAR_TYPES:
+            return False
 
-    return isinstance(data, (int, float, bool, type(None)))
+    return True
+
+
+def is_valid_json_stream(raw, max_depth=10):
+    """Validate raw JSON bytes with the same limits as is_valid_json_structure
+
+    Walks ijson parse events, so oversized or deeply nested payloads are
+    rejected at the first offending token without building Python objects.
+    The whole body is still in memory as bytes; only the object tree is saved.
+
+    Returns None when ijson rejects the text. That covers malformed JSON, but
+    also numbers the backend cannot hold (yajl: ints past 64 bits, 1e400)
+    that the app's JSON loader accepts, so callers should fall back to
+    parsing and is_valid_json_structure.
+    """
+    containers = []  # [is_map, item count] per open container
+    try:
+        for event, value in ijson.basic_parse(io.BytesIO(raw), use_float=True):
+            if event == 'map_key':
+                containers[-1][1] += 1
+                if containers[-1][1] > 100 or len(value) >= 256:
+                    return False
+                continue
+            if event == 'end_map' or event == 'end_array':
+                containers.pop()
+                continue
+
+            # Every remaining event starts a value at the current nesting level
+            if len(containers) >= max_depth:
+                return False
+            if containers and not containers[-1][0]:
+                containers[-1][1] += 1
+                if containers[-1][1] > 1000:
+                    return False
+
+            if event == 'start_map':
+                containers.append([True, 0])
+            elif event == 'start_array':
+                containers.append([False, 0])
+            elif event == 'string' and len(value) >= 10000:
+                return False
+    except ijson.JSONError:
+        return None
+
+    return True
 
 
 class InputSanitizer:
@@ -217,6 +331,8 @@ class InputSanitizer:
         r'require\(',
         r'import\(',
     ]
+    # One alternation compiled once: a single scan per input instead of one per pattern
+    DANGEROUS_RE = re.compile('|'.join(f'(?:{p})' for p in DANGEROUS_PATTERNS), re.IGNORECASE)
 
     @staticmethod
     def sanitize_email(email):
@@ -270,11 +386,10 @@ class InputSanitizer:
             return None
 
         # Check for dangerous patterns
-        value_lower = value.lower()
-        for pattern in InputSanitizer.DANGEROUS_PATTERNS:
-            if re.search(pattern, value_lower, re.IGNORECASE):
-                logger.warning(f"Dangerous pattern detected in input: {pattern}")
-                return None
+        match = InputSanitizer.DANGEROUS_RE.search(value)
+        if match:
+            logger.warning(f"Dangerous pattern detected in input: {match.group(0)}")
+            return None
 
         return value
 
@@ -341,6 +456,9 @@ class AuditLogger:
     @staticmethod
     def log_auth_event(event_type, user_id, status, details=None):
         """Log authentication event"""
+        if not logger.isEnabledFor(logging.INFO):
+            return  # Skip the timestamp and dict/f-string formatting nobody will see
+
         log_entry = {
             'timestamp': datetime.utcnow().isoformat(),
             'event_type': event_type,
@@ -353,6 +471,9 @@ class AuditLogger:
     @staticmethod
     def log_admin_action(admin_id, action, resource, resource_id, status):
         """Log admin action"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         log_entry = {
             'timestamp': datetime.utcnow().isoformat(),
             'admin_id': admin_id,
@@ -366,6 +487,9 @@ class AuditLogger:
     @staticmethod
     def log_security_event(event_type, severity, details):
         """Log security event"""
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+
         log_entry = {
             'timestamp': datetime.utcnow().isoformat(),
             'event_type': event_type,
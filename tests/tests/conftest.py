@@ -1,14 +1,21 @@
+import copy
+
 import numpy as np
 import pytest
 from airplane import Airplane
 from airport import Airport
+from curriculum import AdaptiveCurriculum
+
+def pos(x, y):
+    """A position in NM with the float32 dtype the simulator uses."""
+    return np.array([x, y], dtype=np.float32)
 
 @pytest.fixture
 def arrival_plane():
     return Airplane(
         plane_id=1,
-        position_nm=np.array([10.0, 0.0], dtype=np.float32),  # 10 NM out
-        destination_nm=Airport(np.array([0.0, 0.0], dtype=np.float32), 0.0),
+        position_nm=pos(10.0, 0.0),  # 10 NM out
+        destination_nm=Airport(pos(0.0, 0.0), 0.0),
         heading_rads=0.0,
         speed_kts=180.0,
         min_speed_kts=120.0,
@@ -17,3 +24,15 @@ def arrival_plane():
         init_altitude_ft=5000.0,
         is_arrival=True,
     )
+
+
+@pytest.fixture(scope="session")
+def curriculum_proto():
+    """One default curriculum shared by tests that only read it."""
+    return AdaptiveCurriculum()
+
+
+@pytest.fixture
+def curriculum(curriculum_proto):
+    """A fresh copy of the default curriculum for tests that mutate it."""
+    return copy.deepcopy(curriculum_proto)
@@ -0,0 +1,59 @@
+"""
+Tests for airport scenario definitions.
+"""
+
+import copy
+import dataclasses
+import json
+import pickle
+
+import pytest
+from scenarios.airport_scenarios import (
+    MAJOR_AIRPORTS,
+    AirportCode,
+    AirportScenario,
+    get_airport_scenario,
+)
+
+
+class TestMajorAirports:
+    """Test the public airport lookup table."""
+
+    def test_major_airports_maps_codes_to_scenarios(self):
+        """Test MAJOR_AIRPORTS values are scenarios, built once per airport."""
+        assert set(MAJOR_AIRPORTS) == set(AirportCode)
+
+        scenario = MAJOR_AIRPORTS[AirportCode.SFO]
+        assert isinstance(scenario, AirportScenario)
+        assert scenario.runways
+        assert MAJOR_AIRPORTS[AirportCode.SFO] is scenario
+        assert get_airport_scenario("SFO") is scenario
+
+        with pytest.raises(KeyError):
+            MAJOR_AIRPORTS["SFO"]
+
+
+class TestVoicePack:
+    """Test the frozen, interned voice pack."""
+
+    def test_voice_pack_is_read_only(self):
+        """Test voice pack mutation raises."""
+        scenario = get_airport_scenario("SFO")
+
+        with pytest.raises(TypeError):
+            scenario.voice_pack["new_key"] = "value"
+        with pytest.raises(TypeError):
+            scenario.voice_pack.update({"new_key": "value"})
+
+    def test_scenario_pickle_and_deepcopy_round_trip(self):
+        """Test scenarios still pickle, deep-copy and serialize."""
+        scenario = get_airport_scenario("SFO")
+
+        for clone in (pickle.loads(pickle.dumps(scenario)), copy.deepcopy(scenario)):
+            assert clone == scenario
+            assert clone.voice_pack == scenario.voice_pack
+            with pytest.raises(TypeError):
+                clone.voice_pack["new_key"] = "value"
+
+        assert json.loads(json.dumps(scenario.voice_pack)) == scenario.voice_pack
+        assert dataclasses.asdict(scenario)["voice_pack"] == scenario.voice_pack
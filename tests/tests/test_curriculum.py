@@ -2,11 +2,11 @@
 Tests for curriculum learning module.
 """
 
+import numpy as np
 import pytest
 from curriculum import (
     CurriculumStage,
     CurriculumMetrics,
-    AdaptiveCurriculum,
 )
 
 
@@ -97,12 +97,24 @@ class TestCurriculumMetrics:
         assert metrics.max_reward == 250.0
         assert metrics.min_reward == 50.0
 
+    def test_update_batch_matches_update(self):
+        """Test batched updates give the same metrics as per-episode updates."""
+        rewards = np.linspace(-50.0, 250.0, 130)
+        single = CurriculumMetrics(stage=0)
+        for reward in rewards:
+            single.update(float(reward))
+
+        batched = CurriculumMetrics(stage=0)
+        batched.update_batch(rewards[:30])
+        batched.update_batch(rewards[30:])
+
+        assert batched == single
+
     def test_convergence_percentage_with_target(self):
         """Test convergence percentage calculation."""
         metrics = CurriculumMetrics(stage=0)
 
-        for _ in range(20):
-            metrics.update(100.0)
+        metrics.update_batch(np.full(20, 100.0, dtype=np.float32))
 
         # 100 out of 200 target = 50%
         convergence = metrics.convergence_percentage(target_reward=200.0)
@@ -120,8 +132,7 @@ class TestCurriculumMetrics:
         """Test convergence when exceeding target."""
         metrics = CurriculumMetrics(stage=0)
 
-        for _ in range(20):
-            metrics.update(300.0)
+        metrics.update_batch(np.full(20, 300.0, dtype=np.float32))
 
         # 300 out of 200 target = 150%, capped at 100%
         convergence = metrics.convergence_percentage(target_reward=200.0)
@@ -131,42 +142,35 @@ class TestCurriculumMetrics:
 class TestAdaptiveCurriculum:
     """Test adaptive curriculum management."""
 
-    def test_curriculum_creation(self):
+    def test_curriculum_creation(self, curriculum_proto):
         """Test creating curriculum."""
-        curriculum = AdaptiveCurriculum()
-
-        assert len(curriculum.stages) > 0
-        assert curriculum.current_stage_idx == 0
+        assert len(curriculum_proto.stages) > 0
+        assert curriculum_proto.current_stage_idx == 0
 
-    def test_get_current_stage(self):
+    def test_get_current_stage(self, curriculum_proto):
         """Test retrieving current stage."""
-        curriculum = AdaptiveCurriculum()
-        stage = curriculum.current_stage
+        stage = curriculum_proto.current_stage
 
         assert stage is not None
         assert stage.stage == 0
 
-    def test_stage_progression(self):
+    def test_stage_progression(self, curriculum):
         """Test that stages progress in order."""
-        curriculum = AdaptiveCurriculum()
-
         for i in range(min(3, len(curriculum.stages))):
             stage = curriculum.current_stage
             assert stage.stage == i
             curriculum.current_stage_idx += 1
 
-    def test_initialize_stage_metrics(self):
+    def test_initialize_stage_metrics(self, curriculum):
         """Test initializing metrics for stage."""
-        curriculum = AdaptiveCurriculum()
         curriculum.initialize_stage_metrics()
 
         stage_idx = curriculum.current_stage.stage
         assert stage_idx in curriculum.metrics
         assert curriculum.metrics[stage_idx].stage == stage_idx
 
-    def test_update_stage_metrics(self):
+    def test_update_stage_metrics(self, curriculum):
         """Test updating stage metrics."""
-        curriculum = AdaptiveCurriculum()
         curriculum.initialize_stage_metrics()
 
         curriculum.update_stage_metrics(100.0)
@@ -177,9 +181,8 @@ class TestAdaptiveCurriculum:
         assert metrics.episode_count == 2
         assert metrics.mean_reward == 125.0
 
-    def test_should_advance_stage_conditions(self):
+    def test_should_advance_stage_conditions(self, curriculum):
         """Test conditions for stage advancement."""
-        curriculum = AdaptiveCurriculum()
         curriculum.initialize_stage_metrics()
 
         # Not enough episodes
@@ -198,9 +201,8 @@ class TestAdaptiveCurriculum:
         # Should advance if conditions met
         # (depends on target threshold logic)
 
-    def test_advance_stage(self):
+    def test_advance_stage(self, curriculum):
         """Test advancing to next stage."""
-        curriculum = AdaptiveCurriculum()
         initial_stage = curriculum.current_stage_idx
 
         # Force advance by directly incrementing
@@ -208,28 +210,25 @@ class TestAdaptiveCurriculum:
             curriculum.current_stage_idx += 1
             assert curriculum.current_stage_idx > initial_stage
 
-    def test_get_stage_config_dict(self):
+    def test_get_stage_config_dict(self, curriculum_proto):
         """Test getting stage configuration as dictionary."""
-        curriculum = AdaptiveCurriculum()
-        config = curriculum.get_stage_config_dict()
+        config = curriculum_proto.get_stage_config_dict()
 
         assert "stage" in config
         assert "num_planes" in config
         assert "landing_reward" in config
         assert "collision_penalty" in config
 
-    def test_stage_difficulties_increase(self):
+    def test_stage_difficulties_increase(self, curriculum_proto):
         """Test that difficulty increases with stages."""
-        curriculum = AdaptiveCurriculum()
-        stages = curriculum.stages
+        stages = curriculum_proto.stages
 
         # Check that later stages have more aircraft
         num_planes = [s.num_planes for s in stages]
         assert num_planes == sorted(num_planes, reverse=False) or num_planes[0] <= num_planes[-1]
 
-    def test_get_summary(self):
+    def test_get_summary(self, curriculum):
         """Test getting curriculum summary."""
-        curriculum = AdaptiveCurriculum()
         curriculum.initialize_stage_metrics()
 
         summary = curriculum.get_summary()
@@ -242,42 +241,35 @@ class TestAdaptiveCurriculum:
 class TestDefaultStages:
     """Test default curriculum stage configurations."""
 
-    def test_stage_0_basic_approach(self):
+    def test_stage_0_basic_approach(self, curriculum_proto):
         """Test stage 0 configuration."""
-        curriculum = AdaptiveCurriculum()
-        stage = curriculum.stages[0]
+        stage = curriculum_proto.stages[0]
 
         assert stage.stage == 0
         assert "Basic" in stage.name or "Single" in stage.name
         assert stage.num_planes == 1
         assert stage.intercept_angle_range == (0.0, 0.0)
 
-    def test_stage_difficulty_progression(self):
+    def test_stage_difficulty_progression(self, curriculum_proto):
         """Test that difficulty increases across stages."""
-        curriculum = AdaptiveCurriculum()
-
         # Check that timesteps and targets increase
-        for i in range(len(curriculum.stages) - 1):
-            stage_current = curriculum.stages[i]
-            stage_next = curriculum.stages[i + 1]
+        for i in range(len(curriculum_proto.stages) - 1):
+            stage_current = curriculum_proto.stages[i]
+            stage_next = curriculum_proto.stages[i + 1]
 
             # Next stage should have at least as many timesteps
             assert stage_next.timesteps >= stage_current.timesteps
 
-    def test_all_stages_have_targets(self):
+    def test_all_stages_have_targets(self, curriculum_proto):
         """Test that stages have reasonable target rewards."""
-        curriculum = AdaptiveCurriculum()
-
-        for stage in curriculum.stages[:-1]:  # All but last
+        for stage in curriculum_proto.stages[:-1]:  # All but last
             assert stage.target_reward is not None
             assert stage.target_reward > 0
 
-    def test_reward_escalation(self):
+    def test_reward_escalation(self, curriculum_proto):
         """Test that penalty structure escalates appropriately."""
-        curriculum = AdaptiveCurriculum()
-
         # Check that collision penalties increase as difficulty increases
-        penalties = [s.collision_penalty for s in curriculum.stages]
+        penalties = [s.collision_penalty for s in curriculum_proto.stages]
         # Penalties should generally increase or stay constant
         assert penalties[0] <= penalties[-1]
 
@@ -285,25 +277,20 @@ class TestDefaultStages:
 class TestStageTransitions:
     """Test curriculum stage transitions."""
 
-    def test_max_stage_no_advance(self):
+    def test_max_stage_no_advance(self, curriculum):
         """Test that we don't advance past last stage."""
-        curriculum = AdaptiveCurriculum()
         curriculum.current_stage_idx = len(curriculum.stages) - 1
 
         assert not curriculum.should_advance_stage()
 
-    def test_get_stage_out_of_bounds(self):
+    def test_get_stage_out_of_bounds(self, curriculum_proto):
         """Test getting stage with out of bounds index."""
-        curriculum = AdaptiveCurriculum()
-
-        stage = curriculum.get_stage(999)
+        stage = curriculum_proto.get_stage(999)
         assert stage is not None
-        assert stage == curriculum.stages[-1]
+        assert stage == curriculum_proto.stages[-1]
 
-    def test_metrics_per_stage(self):
+    def test_metrics_per_stage(self, curriculum):
         """Test that each stage tracks separate metrics."""
-        curriculum = AdaptiveCurriculum()
-
         # Simulate progression through stages
         for stage_idx in range(min(3, len(curriculum.stages))):
             curriculum.initialize_stage_metrics()
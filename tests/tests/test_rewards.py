@@ -2,23 +2,23 @@ import numpy as np
 import pytest
 from ai_atc_env import AIATCEnv
 from airplane import MAX_VERT_ACCEL, Airplane
-from conftest import arrival_plane
+from conftest import arrival_plane, pos
 
 AIRPORT = np.array([0.0, 0.0], dtype=np.float32)
 
 def test_terminal_reward_increases_when_closer(arrival_plane):
-    arrival_plane.position_nm = np.array([20.0, 0.0])
+    arrival_plane.position_nm = pos(20.0, 0.0)
     arrival_plane.altitude = 20.0 * 318  # on glide path
     r_far = arrival_plane.compute_pilot_reward(curriculum_stage=2)
 
-    arrival_plane.position_nm = np.array([5.0, 0.0])
+    arrival_plane.position_nm = pos(5.0, 0.0)
     arrival_plane.altitude = 5.0 * 318  # on glide path
     r_near = arrival_plane.compute_pilot_reward(curriculum_stage=2)
 
     assert r_near > r_far
 
 def test_arrival_descent_reward(arrival_plane):
-    arrival_plane.position_nm = np.array([10.0, 0.0])
+    arrival_plane.position_nm = pos(10.0, 0.0)
     arrival_plane.altitude = 3180  # on glide path
 
     r = arrival_plane.compute_pilot_reward(curriculum_stage=1)
@@ -26,7 +26,7 @@ def test_arrival_descent_reward(arrival_plane):
     assert r > 0
 
 def test_arrival_climb_penalty(arrival_plane):
-    arrival_plane.position_nm = np.array([10.0, 0.0])
+    arrival_plane.position_nm = pos(10.0, 0.0)
     baseline = arrival_plane.compute_pilot_reward(curriculum_stage=1)  # alt=5000, above glide
 
     arrival_plane.altitude = 2000  # below glide
@@ -47,12 +47,22 @@ def test_glide_slope_reasonable(arrival_plane):
     # tan(3°) ≈ 0.052
     assert 0.04 < slope < 0.07
 
-def test_descent_better_than_climb_near_runway():
-
+@pytest.fixture(scope="module")
+def _final_approach_plane():
     env = AIATCEnv(max_planes=1, render_mode=None)
+    return env.spawn_on_final(plane_id=0, distance_nm=8, altitude_ft=3000, intercept_deg=0.0)
+
+@pytest.fixture
+def final_approach_plane(_final_approach_plane):
+    # The env is built once per module; restore the fields tests and rewards mutate
+    plane = _final_approach_plane
+    saved = plane.vert_speed, plane.prev_dist_nm
+    yield plane
+    plane.vert_speed, plane.prev_dist_nm = saved
+
+def test_descent_better_than_climb_near_runway(final_approach_plane):
+    plane = final_approach_plane
 
-    plane = env.spawn_on_final(plane_id=0, distance_nm=8, altitude_ft=3000, intercept_deg=0.0)
-    
     plane.vert_speed = -500
     r_descend = plane.compute_pilot_reward()
 
@@ -5,6 +5,8 @@ Tests for runway configuration management system.
 import pytest
 import numpy as np
 from runway_config import (
+    ORIENTATION_LABELS,
+    heading_bin,
     RunwayOrientation,
     RunwayStatus,
     WindConditions,
@@ -76,6 +78,14 @@ class TestRunwayConfig:
         assert runway.runway_heading_deg == 270.0
         assert runway.status == RunwayStatus.ACTIVE
 
+    def test_heading_orientation_bin(self):
+        """Test headings map to the orientation sector labels."""
+        assert RunwayOrientation(ORIENTATION_LABELS[heading_bin(270.0)]) == RunwayOrientation.WEST
+        assert ORIENTATION_LABELS[heading_bin(350.0)] == "north"
+        assert ORIENTATION_LABELS[heading_bin(10.0)] == "north"
+        assert ORIENTATION_LABELS[heading_bin(45.0)] == "northeast"
+        assert ORIENTATION_LABELS[heading_bin(-90.0)] == "west"
+
     def test_runway_operational_check(self):
         """Test runway operational status."""
         runway = RunwayConfig(
@@ -229,6 +239,123 @@ class TestRunwayConfigurationManager:
 
         assert best == "RWY 09"
 
+    def test_best_runway_skips_closed_runway(self):
+        """Test best runway selection ignores closed runways."""
+        airport = Airport(position_nm=np.array([0.0, 0.0], dtype=np.float32))
+        manager = RunwayConfigurationManager(airport)
+
+        manager.add_runway(RunwayConfig("RWY 27", 270.0, 10000.0, 150.0))
+        manager.add_runway(RunwayConfig("RWY 09", 90.0, 8000.0, 150.0))
+        manager.update_wind_conditions(10.0, 270.0)
+
+        manager.close_runway("RWY 27")
+        assert manager.get_best_runway() == "RWY 09"
+
+        manager.close_runway("RWY 09")
+        assert manager.get_best_runway() is None
+
+    def test_direct_status_assignment_updates_selection(self):
+        """Test closing a runway by assigning its status directly."""
+        airport = Airport(position_nm=np.array([0.0, 0.0], dtype=np.float32))
+        manager = RunwayConfigurationManager(airport)
+
+        manager.add_runway(RunwayConfig("RWY 27", 270.0, 10000.0, 150.0))
+        manager.add_runway(RunwayConfig("RWY 09", 90.0, 8000.0, 150.0))
+        manager.update_wind_conditions(10.0, 270.0)
+        assert manager.get_best_runway() == "RWY 27"
+
+        manager.runways["RWY 27"].status = RunwayStatus.CLOSED
+        assert manager.get_best_runway() == "RWY 09"
+
+        manager.runways["RWY 27"].status = RunwayStatus.ACTIVE
+        assert manager.get_best_runway() == "RWY 27"
+
+    def test_cached_scores_match_fresh_scores(self):
+        """Test repeat winds hit the score cache without changing the answer."""
+        airport = Airport(position_nm=np.array([0.0, 0.0], dtype=np.float32))
+
+        def make_manager():
+            manager = RunwayConfigurationManager(airport)
+            manager.add_runway(RunwayConfig("RWY 27", 270.0, 10000.0, 150.0))
+            manager.add_runway(RunwayConfig("RWY 09", 90.0, 8000.0, 150.0))
+            manager.add_runway(RunwayConfig("RWY 36", 0.0, 9000.0, 150.0))
+            return manager
+
+        manager = make_manager()
+        winds = [(10.0, 270.0), (12.0, 85.0), (10.0, 270.0), (8.0, 350.0), (12.0, 85.0)]
+        for speed, direction in winds:
+            manager.update_wind_conditions(speed, direction)
+            fresh = make_manager()
+            fresh.update_wind_conditions(speed, direction)
+            assert manager.get_best_runway() == fresh.get_best_runway()
+        assert len(manager._score_cache) == 3
+
+        # Closing a runway invalidates cached scores
+        manager.close_runway("RWY 09")
+        manager.update_wind_conditions(12.0, 85.0)
+        assert manager.get_best_runway() != "RWY 09"
+
+        manager.reopen_runway("RWY 09")
+        assert manager.get_best_runway() == "RWY 09"
+
+    def test_reassigned_heading_and_limits_are_rescored(self):
+        """Test assigning a runway's heading or wind limits changes its score."""
+        airport = Airport(position_nm=np.array([0.0, 0.0], dtype=np.float32))
+        manager = RunwayConfigurationManager(airport)
+
+        manager.add_runway(RunwayConfig("RWY 27", 270.0, 10000.0, 150.0))
+        manager.add_runway(RunwayConfig("RWY 36", 0.0, 9000.0, 150.0))
+        manager.update_wind_conditions(20.0, 90.0)
+        runway = manager.runways["RWY 27"]
+        assert runway.get_suitability_score(manager.wind_conditions) == -50.0
+
+        runway.runway_heading_deg = 90.0
+        assert runway.get_suitability_score(manager.wind_conditions) == 102.0
+        scores, best_idx = manager._score_runways()
+        assert scores[0] == 102.0
+        assert manager.get_best_runway() == "RWY 27"
+
+        runway.max_headwind_kts = 15.0
+        scores, _ = manager._score_runways()
+        assert scores[0] == -50.0
+        assert runway.get_suitability_score(manager.wind_conditions) == -50.0
+
+    def test_vectorized_scores_match_per_runway_scores(self):
+        """Test batched runway scoring agrees with RunwayConfig.get_suitability_score."""
+        airport = Airport(position_nm=np.array([0.0, 0.0], dtype=np.float32))
+        manager = RunwayConfigurationManager(airport)
+
+        for heading in range(0, 360, 15):
+            manager.add_runway(RunwayConfig(f"RWY {heading}", float(heading), 10000.0, 150.0,
+                                            max_crosswind_kts=12.0 + heading % 7))
+        manager.close_runway("RWY 90")
+
+        for speed, direction in [(4.0, 10.0), (15.0, 273.5), (25.0, 181.0), (40.0, 45.0)]:
+            manager.update_wind_conditions(speed, direction)
+            scores, _ = manager._score_runways()
+            expected = [
+                config.get_suitability_score(manager.wind_conditions) if config.is_operational() else -np.inf
+                for config in manager.runways.values()
+            ]
+            np.testing.assert_array_equal(scores, expected)
+
+    def test_calm_wind_keeps_active_runway(self):
+        """Test calm wind keeps the active runway without rescoring."""
+        airport = Airport(position_nm=np.array([0.0, 0.0], dtype=np.float32))
+        manager = RunwayConfigurationManager(airport)
+
+        manager.add_runway(RunwayConfig("RWY 27", 270.0, 10000.0, 150.0))
+        manager.add_runway(RunwayConfig("RWY 09", 90.0, 8000.0, 150.0))
+        manager.active_runway = "RWY 09"
+
+        # Light westerly would slightly favor RWY 27 if scored
+        manager.update_wind_conditions(2.0, 270.0)
+        assert manager.get_best_runway() == "RWY 09"
+
+        should_change, new_runway, _ = manager.evaluate_configuration_change(1000.0)
+        assert should_change is False
+        assert new_runway is None
+
     def test_evaluate_configuration_change(self):
         """Test evaluating need for configuration change."""
         airport = Airport(position_nm=np.array([0.0, 0.0], dtype=np.float32))
@@ -309,6 +436,46 @@ class TestRunwayConfigurationManager:
         manager.reopen_runway("RWY 27")
         assert manager.runways["RWY 27"].is_operational()
 
+    def test_scheduled_reopen(self):
+        """Test runway closed until a set time is reopened once that time passes."""
+        airport = Airport(position_nm=np.array([0.0, 0.0], dtype=np.float32))
+        manager = RunwayConfigurationManager(airport)
+
+        manager.add_runway(RunwayConfig("RWY 27", 270.0, 10000.0, 150.0))
+        manager.add_runway(RunwayConfig("RWY 09", 90.0, 8000.0, 150.0))
+        manager.update_wind_conditions(10.0, 270.0)
+
+        manager.close_runway("RWY 27", reopen_at_time=2000.0)
+        assert manager.active_runway == "RWY 09"
+
+        should_change, _, _ = manager.evaluate_configuration_change(1500.0)
+        assert should_change is False
+        assert manager.runways["RWY 27"].status == RunwayStatus.CLOSED
+
+        should_change, new_runway, _ = manager.evaluate_configuration_change(2500.0)
+        assert should_change is True
+        assert new_runway == "RWY 27"
+        assert manager.runways["RWY 27"].status == RunwayStatus.ACTIVE
+
+    def test_scheduled_reopen_rewrites_directly_closed_config(self):
+        """Test a closure assigned on the config is reopened on the config itself."""
+        airport = Airport(position_nm=np.array([0.0, 0.0], dtype=np.float32))
+        manager = RunwayConfigurationManager(airport)
+
+        manager.add_runway(RunwayConfig("RWY 27", 270.0, 10000.0, 150.0))
+        manager.add_runway(RunwayConfig("RWY 09", 90.0, 8000.0, 150.0))
+        manager.update_wind_conditions(10.0, 270.0)
+
+        runway = manager.runways["RWY 27"]
+        runway.status = RunwayStatus.CLOSED
+        runway.closed_until_time = 2000.0
+        assert manager.get_best_runway() == "RWY 09"
+
+        manager.evaluate_configuration_change(2500.0)
+        assert runway.status == RunwayStatus.ACTIVE
+        assert runway.closed_until_time is None
+        assert manager.get_best_runway() == "RWY 27"
+
     def test_configuration_history(self):
         """Test tracking configuration changes."""
         airport = Airport(position_nm=np.array([0.0, 0.0], dtype=np.float32))
@@ -324,6 +491,20 @@ class TestRunwayConfigurationManager:
         assert manager.configuration_history[0] == (1000.0, "RWY 27", "RWY 09")
         assert manager.configuration_history[1] == (2000.0, "RWY 09", "RWY 27")
 
+        # History is derived, so direct writes fail instead of being dropped
+        with pytest.raises(AttributeError):
+            manager.configuration_history.append((3000.0, "RWY 27", "RWY 09"))
+
+    def test_active_runway_setter_rejects_unknown_id(self):
+        """Test assigning an unknown active runway raises."""
+        airport = Airport(position_nm=np.array([0.0, 0.0], dtype=np.float32))
+        manager = RunwayConfigurationManager(airport)
+        manager.add_runway(RunwayConfig("RWY 27", 270.0, 10000.0, 150.0))
+
+        with pytest.raises(ValueError):
+            manager.active_runway = "RWY 99"
+        assert manager.active_runway == "RWY 27"
+
     def test_get_summary(self):
         """Test getting configuration summary."""
         airport = Airport(position_nm=np.array([0.0, 0.0], dtype=np.float32))
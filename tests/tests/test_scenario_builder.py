@@ -0,0 +1,34 @@
+"""
+Tests for scenario builder.
+"""
+
+from scenarios.scenario_builder import ScenarioBuilder
+
+
+class TestScenarioCaching:
+    """Test cached scenario variants are isolated from callers."""
+
+    def test_mutating_result_does_not_affect_later_calls(self):
+        """Test repeat builds are unaffected by mutating an earlier result."""
+        builder = ScenarioBuilder(seed=0)
+
+        first = builder.build_airport_scenarios("SFO")
+        expected_runways = list(first["beginner"]["runways"])
+        expected_params = dict(first["beginner"]["difficulty_params"])
+        first["beginner"]["runways"].clear()
+        first["beginner"]["difficulty_params"]["aircraft_count"] = 99
+
+        again = builder.build_airport_scenarios("SFO")
+        assert again["beginner"]["runways"] == expected_runways
+        assert again["beginner"]["difficulty_params"] == expected_params
+        assert ScenarioBuilder(seed=0).build_airport_scenarios("SFO") == again
+
+    def test_build_all_scenarios_returns_copies(self):
+        """Test build_all_scenarios results do not share the builder's cache."""
+        builder = ScenarioBuilder(seed=0)
+
+        all_scenarios = builder.build_all_scenarios()
+        all_scenarios["SFO"]["expert"]["traffic"].clear()
+
+        assert builder.build_all_scenarios()["SFO"]["expert"]["traffic"]
+        assert builder.scenarios["SFO"]["expert"]["traffic"]
@@ -0,0 +1,180 @@
+"""
+Tests for the encrypted secrets store.
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from security.secrets_manager import SecretsManager
+
+
+@pytest.fixture
+def secrets_dir(tmp_path, monkeypatch):
+    """Run in a temp dir so the relative archive directory lands there too."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def make_manager(secrets_dir):
+    return SecretsManager(
+        secrets_file=str(secrets_dir / "secrets.json"),
+        key_file=str(secrets_dir / "key"),
+    )
+
+
+def read_back(secrets_dir, name):
+    """Value of a secret as a freshly loaded manager sees it."""
+    with make_manager(secrets_dir) as manager:
+        return manager.get_secret(name)
+
+
+class TestWriterLifecycle:
+    """Test the background writer thread."""
+
+    def test_close_writes_pending_and_stops_writer(self, secrets_dir):
+        """Test close() persists queued mutations and joins the writer thread."""
+        manager = make_manager(secrets_dir)
+        writer = manager._writer
+        manager.set_secret("api_key", "value-1")
+        manager.close()
+
+        assert not writer.is_alive()
+        assert read_back(secrets_dir, "api_key") == "value-1"
+
+        manager.close()  # Second close is a no-op
+        with pytest.raises(ValueError):
+            manager.set_secret("api_key", "value-2")
+
+    def test_context_manager_closes(self, secrets_dir):
+        """Test leaving a with block closes the manager."""
+        with make_manager(secrets_dir) as manager:
+            manager.set_secret("db_password", "hunter2hunter2")
+        assert manager._writer is None
+
+    def test_flush_raises_writer_failure(self, secrets_dir):
+        """Test a failed background write surfaces from flush() once."""
+        manager = make_manager(secrets_dir)
+        os.mkdir(manager.wal_file)  # Appending to a directory fails
+
+        manager.set_secret("api_key", "value-1")
+        with pytest.raises(OSError):
+            manager.flush()
+        manager.flush()  # Error was reported; nothing new pending
+
+        os.rmdir(manager.wal_file)
+        manager.set_secret("api_key", "value-2")
+        manager.close()
+        assert read_back(secrets_dir, "api_key") == "value-2"
+
+
+class TestPersistence:
+    """Test the baseline file and write-ahead log round trip."""
+
+    def test_wal_replay(self, secrets_dir):
+        """Test mutations kept in the WAL are replayed on load."""
+        with make_manager(secrets_dir) as manager:
+            manager.set_secret("api_key", "value-1")
+            manager.set_secret("db_password", "hunter2hunter2")
+            manager.flush()  # First write compacts into the baseline file
+            manager.set_secret("api_key", "value-2")
+            manager.delete_secret("db_password")
+
+        assert os.path.exists(secrets_dir / "secrets.wal")
+        with make_manager(secrets_dir) as reloaded:
+            assert reloaded.get_secret("api_key") == "value-2"
+            assert reloaded.get_secret("db_password") is None
+
+    def test_torn_wal_tail_is_truncated(self, secrets_dir):
+        """Test a partial trailing WAL record is dropped and cut from the file."""
+        with make_manager(secrets_dir) as manager:
+            manager.set_secret("api_key", "value-1")
+            manager.set_secret("db_password", "hunter2hunter2")
+            manager.flush()
+            manager.set_secret("api_key", "value-2")
+
+        wal_file = secrets_dir / "secrets.wal"
+        intact = wal_file.read_bytes()
+        with open(wal_file, "ab") as f:
+            f.write(b"gAAAAAtorn-record")
+
+        assert read_back(secrets_dir, "api_key") == "value-2"
+        assert wal_file.read_bytes() == intact
+
+    def test_compaction_folds_wal_into_baseline(self, secrets_dir):
+        """Test the WAL is folded into the baseline once it outgrows it."""
+        with make_manager(secrets_dir) as manager:
+            manager.set_secret("api_key", "value-0")
+            manager.flush()
+            wal_file = secrets_dir / "secrets.wal"
+            for i in range(1, 20):
+                manager.set_secret("api_key", f"value-{i}")
+                manager.flush()
+                if not wal_file.exists():
+                    break
+            assert not wal_file.exists()
+
+        assert read_back(secrets_dir, "api_key") == f"value-{i}"
+
+    def test_legacy_per_key_file_loads(self, secrets_dir):
+        """Test a baseline file with one Fernet token per secret still loads."""
+        from cryptography.fernet import Fernet
+
+        key = Fernet.generate_key()
+        (secrets_dir / "key").write_bytes(key)
+        cipher = Fernet(key)
+        legacy = {
+            name: cipher.encrypt(json.dumps({
+                "value": value,
+                "created_at": "2024-01-01T00:00:00",
+            }).encode()).decode()
+            for name, value in [("api_key", "value-1"), ("db_password", "hunter2hunter2")]
+        }
+        (secrets_dir / "secrets.json").write_text(json.dumps(legacy))
+
+        with make_manager(secrets_dir) as manager:
+            assert manager.get_secret("api_key") == "value-1"
+            assert manager.get_secret("db_password") == "hunter2hunter2"
+
+    def test_flush_makes_writes_visible(self, secrets_dir):
+        """Test flush() returns only once queued mutations are on disk."""
+        with make_manager(secrets_dir) as manager:
+            manager.set_secret("api_key", "value-1")
+            manager.flush()
+            assert read_back(secrets_dir, "api_key") == "value-1"
+
+            manager.set_secret("api_key", "value-2")
+            manager.flush()
+            assert read_back(secrets_dir, "api_key") == "value-2"
+
+    def test_rotate_all_due_writes_one_batch(self, secrets_dir):
+        """Test due secrets are rotated, archived and logged in a single WAL append."""
+        with make_manager(secrets_dir) as manager:
+            for name in ("api_key", "db_password", "session_token"):
+                manager.set_secret(name, f"{name}-original")
+            manager.flush()
+            stale = time.time() - (manager.rotation_days + 1) * 86400
+            manager.secrets["api_key"]["created_at_epoch"] = stale
+            manager.secrets["db_password"]["created_at_epoch"] = stale
+
+            appended = []
+            append_wal = manager._append_wal
+            manager._append_wal = lambda mutations: appended.append(mutations) or append_wal(mutations)
+
+            results = manager.rotate_all_due()
+            manager.flush()
+
+        assert results == {"api_key": True, "db_password": True}
+        assert [[(op, name) for op, name, _ in batch] for batch in appended if batch] == [
+            [("set", "api_key"), ("set", "db_password")]
+        ]
+        assert read_back(secrets_dir, "api_key") != "api_key-original"
+        assert read_back(secrets_dir, "db_password") != "db_password-original"
+        assert read_back(secrets_dir, "session_token") == "session_token-original"
+
+        archive = (secrets_dir / ".secrets" / "archive" / "archive.log").read_text().splitlines()
+        assert sorted(json.loads(line)["name"] for line in archive) == ["api_key", "db_password"]
@@ -0,0 +1,82 @@
+"""
+Tests for request validation in the security middleware.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("flask")
+ijson = pytest.importorskip("ijson")
+
+from flask import Flask
+
+from security import security_middleware
+from security.security_middleware import (
+    is_valid_json_stream,
+    is_valid_json_structure,
+    setup_input_validation,
+)
+
+
+PAYLOADS = [
+    b'{"a": 1, "b": [1, 2, 3]}',
+    b'[9223372036854775808]',                  # Past int64
+    b'{"n": 99999999999999999999999999}',
+    b'[1e400]',                                # Past float64
+    b'[1.5e-400]',
+    b'[1, 2,]',                                # Malformed
+    b'{"a": "' + b'x' * 10000 + b'"}',         # String too long
+    b'[' * 11 + b']' * 11,                     # Too deep
+    json.dumps({f"k{i}": i for i in range(101)}).encode(),  # Too many keys
+    json.dumps([1] * 1001).encode(),  # Too many items
+]
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    setup_input_validation(app)
+
+    @app.route("/echo", methods=["POST"])
+    def echo():
+        return "ok"
+
+    return app.test_client()
+
+
+class TestJsonStreamValidation:
+    """Test the ijson validator against the parse-then-walk validator."""
+
+    @pytest.mark.parametrize("raw", PAYLOADS)
+    def test_stream_agrees_with_structure_walk(self, raw):
+        """Test a streamed verdict, when given, matches parsing and walking."""
+        try:
+            expected = is_valid_json_structure(json.loads(raw))
+        except ValueError:
+            expected = False
+
+        streamed = is_valid_json_stream(raw)
+        if streamed is None:
+            return  # Undecided; the caller falls back to the full parse
+        assert streamed == expected
+
+    def test_rejected_text_is_undecided(self):
+        """Test text the tokenizer rejects is left to the full parse."""
+        assert is_valid_json_stream(b'[1, 2,]') is None
+
+    @pytest.mark.parametrize("raw", PAYLOADS)
+    def test_request_status_matches_without_ijson(self, client, monkeypatch, raw):
+        """Test requests get the same response with and without ijson installed."""
+        def post():
+            return client.post("/echo", data=raw, content_type="application/json").status_code
+
+        with_ijson = post()
+        monkeypatch.setattr(security_middleware, "ijson", None)
+        assert with_ijson == post()
+
+    def test_large_numbers_pass_validation(self, client):
+        """Test numbers outside the ijson backend's range are not rejected."""
+        for raw in (b'[9223372036854775808]', b'[1e400]'):
+            response = client.post("/echo", data=raw, content_type="application/json")
+            assert response.status_code == 200
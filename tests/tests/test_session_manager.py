@@ -7,9 +7,11 @@ import os
 import tempfile
 import gzip
 import json
+from dataclasses import fields
 from session_manager import (
     EventType,
     AircraftSnapshot,
+    CheckpointArrays,
     SessionEvent,
     SessionCheckpoint,
     SessionMetadata,
@@ -102,6 +104,20 @@ class TestAircraftSnapshot:
         assert snapshot.plane_id == 1
         assert snapshot.speed_kts == 150.0
 
+    def test_checkpoint_arrays_round_trip(self):
+        """Test column storage returns the snapshots it was built from."""
+        snapshots = [
+            AircraftSnapshot(i, (10.0 + i, 5.0 - i), 1.57, 150.0, 3000.0, 0.0, 1.57, 150.0, 3000.0, i == 1)
+            for i in range(3)
+        ]
+
+        arrays = CheckpointArrays.from_records(snapshots)
+
+        assert len(arrays) == 3
+        assert arrays.position_nm.shape == (3, 2)
+        assert list(arrays) == snapshots
+        assert CheckpointArrays.from_records([s.to_dict() for s in snapshots]) == arrays
+
 
 class TestSessionRecorder:
     """Test session recording."""
@@ -136,6 +152,18 @@ class TestSessionRecorder:
         assert len(recorder.events) == 1
         assert 1 in recorder.aircraft_spawned
 
+    def test_record_spawn_negative_and_sparse_ids(self):
+        """Test spawn ids outside the bitmap range are still counted."""
+        recorder = SessionRecorder("test-session")
+
+        for plane_id in (-1, 3, 10**9, 3, -1):
+            recorder.record_aircraft_spawn(plane_id, 0.0)
+
+        assert recorder.aircraft_spawned == {-1, 3, 10**9}
+        assert recorder.get_session_metadata().aircraft_count == 3
+        assert len(recorder._spawn_bitmap) == 1
+        assert len(recorder.events) == 5
+
     def test_record_landing(self):
         """Test recording landing."""
         recorder = SessionRecorder("test-session")
@@ -175,6 +203,64 @@ class TestSessionRecorder:
 
         assert recorder.total_reward == pytest.approx(160.5)
 
+    def test_descriptions_built_only_when_events_read(self, monkeypatch):
+        """Test record_* defers description formatting until events are read."""
+        import session_manager
+
+        calls = []
+        spawn_event = session_manager._spawn_event
+
+        def counting_spawn_event(*args):
+            calls.append(args)
+            return spawn_event(*args)
+
+        monkeypatch.setattr(session_manager, "_spawn_event", counting_spawn_event)
+        recorder = SessionRecorder("test-session")
+
+        for plane_id in range(3):
+            recorder.record_aircraft_spawn(plane_id, float(plane_id), is_vfr=plane_id == 1)
+        assert calls == []
+
+        assert recorder.events[1].description == "Aircraft 1 spawned (VFR)"
+        recorder.events
+        assert len(calls) == 3
+
+    def test_event_log_keeps_only_tail_in_memory(self, monkeypatch):
+        """Test events stream to the event log at each checkpoint."""
+        monkeypatch.setattr("session_manager.EVENT_TAIL_SIZE", 2)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = os.path.join(tmpdir, "events.jsonl.gz")
+            recorder = SessionRecorder("test-session", event_log_path=log_path)
+
+            for plane_id in range(3):
+                recorder.record_aircraft_spawn(plane_id, float(plane_id))
+            recorder.create_checkpoint(5.0, [], 10.0, 270.0, "RWY 27")
+            recorder.record_landing(0, 6.0)
+
+            assert len(recorder._event_rows) == 1  # Only the landing is still pending
+            assert [e.timestamp for e in recorder.events] == [2.0, 6.0]
+            assert [e.timestamp for e in recorder.iter_events()] == [0.0, 1.0, 2.0, 6.0]
+
+            with gzip.open(log_path, "rt") as f:
+                assert len(f.readlines()) == 4
+
+    def test_event_log_starts_empty_for_new_recorder(self):
+        """Test a recorder reusing a log path does not see earlier events."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = os.path.join(tmpdir, "events.jsonl.gz")
+
+            first = SessionRecorder("first", event_log_path=log_path)
+            first.record_aircraft_spawn(1, 0.0)
+            first.record_landing(1, 5.0)
+            first.create_checkpoint(5.0, [], 10.0, 270.0, "RWY 27")
+
+            second = SessionRecorder("second", event_log_path=log_path)
+            second.record_aircraft_spawn(2, 1.0)
+            second.create_checkpoint(1.0, [], 10.0, 270.0, "RWY 27")
+
+            assert [e.data["plane_id"] for e in second.iter_events()] == [2]
+
     def test_create_checkpoint(self):
         """Test creating checkpoint."""
         recorder = SessionRecorder("test-session")
@@ -222,6 +308,19 @@ class TestSessionRecorder:
 class TestSessionSerializer:
     """Test session serialization."""
 
+    def test_to_dict_matches_dataclass_fields(self):
+        """Test hand-written to_dict methods stay in sync with the dataclass fields."""
+        snapshot = AircraftSnapshot(1, (10.0, 5.0), 1.57, 150.0, 3000.0, 0.0, 1.57, 150.0, 3000.0, False)
+        objects = [
+            snapshot,
+            SessionEvent(10.0, EventType.AIRCRAFT_SPAWN, "Aircraft 1 spawned"),
+            SessionCheckpoint(10.0, 0, [snapshot], 10.0, 270.0, "RWY 27", 0.0),
+            SessionMetadata("test-session", "2024-01-01T00:00:00"),
+        ]
+
+        for obj in objects:
+            assert list(obj.to_dict()) == [f.name for f in fields(obj)]
+
     def test_save_and_load_session(self):
         """Test saving and loading session."""
         recorder = SessionRecorder("test-session")
@@ -309,6 +408,86 @@ class TestSessionSerializer:
             assert len(checkpoints) == 1
             assert checkpoints[0].aircraft_snapshots[0].plane_id == 1
 
+    def test_save_with_npz_checkpoints(self):
+        """Test checkpoints written to a column-array side file load back identically."""
+        recorder = SessionRecorder("test-session")
+
+        for step in range(3):
+            snapshots = [
+                AircraftSnapshot(i, (10.0 + step, 5.0), 1.57, 150.0, 3000.0, 0.0, 1.57, 150.0, 3000.0, False)
+                for i in range(step)
+            ]
+            recorder.create_checkpoint(10.0 * step, snapshots, 10.0, 270.0, "RWY 27")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "test_session.json")
+
+            assert SessionSerializer.save_session(recorder, filepath, checkpoint_format='npz')
+            assert os.path.exists(os.path.join(tmpdir, "test_session.checkpoints.npz"))
+
+            result = SessionSerializer.load_session(filepath)
+            assert result is not None
+
+            metadata, events, checkpoints = result
+            assert checkpoints == recorder.checkpoints
+
+    def test_save_with_delta_checkpoints(self):
+        """Test keyframe + delta checkpoints rebuild the recorded snapshots."""
+        recorder = SessionRecorder("test-session")
+
+        for step in range(12):
+            # Aircraft 0 leaves after step 4, aircraft 3 joins at step 6
+            ids = [i for i in range(4) if not (i == 0 and step > 4) and not (i == 3 and step < 6)]
+            snapshots = [
+                AircraftSnapshot(i, (10.0 + step, 5.0), 1.57, 150.0, 3000.0 - 10 * step * (i % 2), 0.0,
+                                 1.57, 150.0, 3000.0, False)
+                for i in ids
+            ]
+            recorder.create_checkpoint(10.0 * step, snapshots, 10.0, 270.0, "RWY 27")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "test_session.json")
+
+            assert SessionSerializer.save_session(
+                recorder, filepath, compress=False, checkpoint_format='delta'
+            )
+
+            result = SessionSerializer.load_session(filepath)
+            assert result is not None
+
+            metadata, events, checkpoints = result
+            assert checkpoints == recorder.checkpoints
+
+    def test_save_jsonl_loads_checkpoints_lazily(self):
+        """Test a JSON Lines session parses checkpoints only when accessed."""
+        recorder = SessionRecorder("test-session")
+        recorder.record_aircraft_spawn(1, 0.0)
+
+        for step in range(3):
+            snapshots = [
+                AircraftSnapshot(i, (10.0 + step, 5.0), 1.57, 150.0, 3000.0, 0.0, 1.57, 150.0, 3000.0, False)
+                for i in range(step)
+            ]
+            recorder.create_checkpoint(10.0 * step, snapshots, 10.0, 270.0, "RWY 27")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "test_session.json")
+
+            assert SessionSerializer.save_session(recorder, filepath, checkpoint_format='jsonl')
+
+            result = SessionSerializer.load_session(filepath)
+            assert result is not None
+
+            metadata, events, checkpoints = result
+            assert events == recorder.events
+            assert len(checkpoints) == 3
+            assert checkpoints._parsed == [None, None, None]
+
+            replayer = SessionReplayer(metadata, events, checkpoints)
+            assert replayer.get_checkpoint_at_time(19.0) == recorder.checkpoints[2]
+            assert checkpoints._parsed[:2] == [None, None]
+            assert checkpoints == recorder.checkpoints
+
 
 class TestSessionReplayer:
     """Test session replay."""
@@ -349,6 +528,21 @@ class TestSessionReplayer:
 
         assert len(range_events) == 3
 
+    def test_get_events_in_range_unsorted_input(self):
+        """Test range queries on events recorded out of time order."""
+        metadata = SessionMetadata("test-session", "2024-01-01T00:00:00")
+        events = [
+            SessionEvent(30.0, EventType.EPISODE_REWARD, "Episode complete"),
+            SessionEvent(10.0, EventType.AIRCRAFT_SPAWN, "Aircraft 1 spawned"),
+            SessionEvent(20.0, EventType.AIRCRAFT_LANDED, "Aircraft 1 landed"),
+            SessionEvent(15.0, EventType.WEATHER_UPDATE, "Wind updated"),
+        ]
+
+        replayer = SessionReplayer(metadata, events, [])
+
+        assert [e.timestamp for e in replayer.get_events_in_range(12.0, 30.0)] == [15.0, 20.0, 30.0]
+        assert replayer.get_events_in_range(40.0, 50.0) == []
+
     def test_get_checkpoint_at_time(self):
         """Test getting checkpoint at time."""
         metadata = SessionMetadata("test-session", "2024-01-01T00:00:00")
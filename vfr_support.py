@@ -3,6 +3,8 @@ VFR (Visual Flight Rules) support for AI-ATC.
 Implements VFR-specific behaviors, flight following, and traffic management.
 """
 
+import math
+
 import numpy as np
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
@@ -134,18 +136,18 @@ class VFRTrafficPattern:
         Returns:
             Tuple of (position_nm, heading_rad)
         """
-        runway_rad = np.deg2rad(runway_heading_deg)
+        runway_rad = math.radians(runway_heading_deg)
 
         # Downwind is parallel to runway, opposite direction, 1.5 nm out
-        perpendicular_rad = runway_rad + np.pi / 2
+        perpendicular_rad = runway_rad + math.pi / 2
 
         position = airport_position_nm + np.array(
-            [np.cos(perpendicular_rad), np.sin(perpendicular_rad)],
+            [math.cos(perpendicular_rad), math.sin(perpendicular_rad)],
             dtype=np.float32
         ) * downwind_distance_nm
 
         # Aircraft heading on downwind
-        heading = runway_rad + np.pi  # Opposite to runway heading
+        heading = runway_rad + math.pi  # Opposite to runway heading
 
         return position, heading
 
@@ -157,11 +159,11 @@ class VFRTrafficPattern:
         entry_altitude_ft: float = 800.0,
     ) -> Tuple[np.ndarray, float]:
         """Generate a standard VFR base leg entry point."""
-        runway_rad = np.deg2rad(runway_heading_deg)
+        runway_rad = math.radians(runway_heading_deg)
 
         # Base leg perpendicular to runway
         base_vector = np.array(
-            [np.cos(runway_rad), np.sin(runway_rad)],
+            [math.cos(runway_rad), math.sin(runway_rad)],
             dtype=np.float32
         ) * base_distance_nm
 
@@ -180,11 +182,11 @@ class VFRTrafficPattern:
         entry_altitude_ft: float = 1500.0,
     ) -> Tuple[np.ndarray, float]:
         """Generate a straight-in visual approach entry."""
-        runway_rad = np.deg2rad(runway_heading_deg)
+        runway_rad = math.radians(runway_heading_deg)
 
         # Straight in on final approach
         inbound_vector = -np.array(
-            [np.cos(runway_rad), np.sin(runway_rad)],
+            [math.cos(runway_rad), math.sin(runway_rad)],
             dtype=np.float32
         ) * distance_nm
 